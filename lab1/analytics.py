@@ -0,0 +1,270 @@
+"""
+Векторизована аналітика EducationSystem на колонкових таблицях pandas/NumPy.
+
+to_frames() за один прохід перетворює систему на чотири таблиці
+(students, courses, grades, enrollments), де посилання між таблицями -
+цілі коди рядків, а не рядкові ідентифікатори. Аналітичні функції нижче
+працюють лише з цими таблицями, без циклів Python по об'єктах.
+
+Потребує numpy та pandas (необов'язкові залежності lab1).
+"""
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # pragma: no cover - аналітика просто недоступна
+    np = pd = None
+
+
+class Frames:
+    """Колонкове представлення системи (результат to_frames)."""
+
+    __slots__ = ("students", "courses", "assignments", "grades", "enrollments")
+
+    def __init__(self, students, courses, assignments, grades, enrollments):
+        self.students = students
+        self.courses = courses
+        self.assignments = assignments
+        self.grades = grades
+        self.enrollments = enrollments
+
+
+def _require_pandas():
+    if pd is None:
+        raise ImportError("Для аналітики потрібні numpy та pandas: pip install numpy pandas")
+
+
+def _codes(index, ids):
+    """Перетворює ідентифікатори на коди рядків таблиці (-1 - невідомий)."""
+    return index.get_indexer(pd.Index(ids)).astype(np.int32)
+
+
+def to_frames(system):
+    """
+    Матеріалізує систему в таблиці:
+      students    - id, name, major, year_of_study
+      courses     - id, title, credits, max_students, instructor_id,
+                    instructor, department, assignments_count, enrolled_students
+      assignments - id, course (код), max_points
+      grades      - student, assignment, course (коди), points, percentage, enrolled
+      enrollments - student, course (коди)
+    Категоріальні колонки (major, department) зберігаються як category.
+    """
+    _require_pandas()
+    student_list = list(system.students.values())
+    course_list = list(system.courses.values())
+    assignment_list = list(system.assignments.values())
+
+    students = pd.DataFrame(
+        {
+            "id": [s.id for s in student_list],
+            "name": [s.name for s in student_list],
+            "major": pd.Categorical([s.major for s in student_list]),
+            "year_of_study": np.fromiter(
+                (s.year_of_study for s in student_list), np.int16, len(student_list)
+            ),
+        }
+    )
+    student_index = pd.Index(students["id"])
+
+    courses = pd.DataFrame(
+        {
+            "id": [c.id for c in course_list],
+            "title": [c.title for c in course_list],
+            "credits": np.fromiter(
+                (c.credits for c in course_list), np.float64, len(course_list)
+            ),
+            "max_students": np.fromiter(
+                (c.max_students for c in course_list), np.int32, len(course_list)
+            ),
+            "instructor_id": [c.instructor.id for c in course_list],
+            "instructor": [c.instructor.name for c in course_list],
+            "department": pd.Categorical([c.instructor.department for c in course_list]),
+            "assignments_count": np.fromiter(
+                (len(c.assignments) for c in course_list), np.int32, len(course_list)
+            ),
+            "enrolled_students": np.fromiter(
+                (len(c.enrolled_ids) for c in course_list), np.int32, len(course_list)
+            ),
+        }
+    )
+    course_index = pd.Index(courses["id"])
+
+    assignments = pd.DataFrame(
+        {
+            "id": [a.id for a in assignment_list],
+            "course": _codes(course_index, [a.course_id for a in assignment_list]),
+            "max_points": np.fromiter(
+                (a.max_points for a in assignment_list), np.float64, len(assignment_list)
+            ),
+        }
+    )
+    assignment_index = pd.Index(assignments["id"])
+
+    enrolled_student = []
+    enrolled_course = []
+    for code, course in enumerate(course_list):
+        enrolled_student.extend(course.enrolled_ids)
+        enrolled_course.extend([code] * len(course.enrolled_ids))
+    enrollments = pd.DataFrame(
+        {
+            "student": _codes(student_index, enrolled_student),
+            "course": np.array(enrolled_course, dtype=np.int32),
+        }
+    )
+
+    store = system.grade_store
+    if store is not None:
+        # Компактний режим: колонки GradeStore копіюються цілими масивами
+        student_codes = _codes(student_index, store.student_ids)[np.array(store.students)]
+        assignment_codes = _codes(
+            assignment_index, [a.id for a in store.assignments]
+        )[np.array(store.assignment_indices)]
+        points = np.array(store.points)
+    else:
+        grade_students = []
+        grade_assignments = []
+        grade_points = []
+        for code, student in enumerate(student_list):
+            grades = student.grades
+            grade_students.extend([code] * len(grades))
+            for assignment_id, grade in grades.items():
+                grade_assignments.append(assignment_id)
+                grade_points.append(grade.points_earned)
+        student_codes = np.array(grade_students, dtype=np.int32)
+        assignment_codes = _codes(assignment_index, grade_assignments)
+        points = np.array(grade_points, dtype=np.float64)
+
+    max_points = assignments["max_points"].to_numpy()[assignment_codes]
+    grade_courses = assignments["course"].to_numpy()[assignment_codes]
+    # Оцінка входить у статистику курсу лише якщо студент зарахований на нього
+    pair_keys = enrollments["student"].to_numpy(np.int64) * len(courses) + enrollments[
+        "course"
+    ].to_numpy()
+    grades = pd.DataFrame(
+        {
+            "student": student_codes,
+            "assignment": assignment_codes,
+            "course": grade_courses,
+            "points": points,
+            # (бали / максимум) * 100 - у тому ж порядку операцій, що й
+            # Grade.get_percentage, інакше відсотки відрізняються в останньому біті
+            "percentage": np.divide(
+                points,
+                max_points,
+                out=np.zeros_like(points),
+                where=max_points > 0,
+            )
+            * 100,
+            "enrolled": np.isin(
+                student_codes.astype(np.int64) * len(courses) + grade_courses, pair_keys
+            ),
+        }
+    )
+    return Frames(students, courses, assignments, grades, enrollments)
+
+
+# --- Аналітика ---
+
+
+def student_gpa(frames, weighted=False):
+    """GPA кожного студента (як Student.get_gpa), індекс - id студента."""
+    grades = frames.grades
+    count = len(frames.students)
+    percentage = grades["percentage"].to_numpy()
+    student = grades["student"].to_numpy()
+    if weighted:
+        credits = frames.courses["credits"].to_numpy()[grades["course"].to_numpy()]
+        total = np.bincount(student, percentage * credits, count)
+        weight = np.bincount(student, credits, count)
+    else:
+        total = np.bincount(student, percentage, count)
+        weight = np.bincount(student, minlength=count).astype(np.float64)
+    gpa = np.divide(total, weight, out=np.zeros(count), where=weight > 0) / 100 * 4
+    # round() Python, а не ndarray.round: інакше "половинки" округлюються інакше,
+    # ніж у Student.get_gpa (1.555 -> 1.56 проти 1.55)
+    rounded = [round(value, 2) for value in gpa.tolist()]
+    return pd.Series(rounded, index=frames.students["id"], name="gpa", dtype=np.float64)
+
+
+def gpa_by_major(frames, quantiles=(0.25, 0.5, 0.75)):
+    """Розподіл GPA за спеціальностями: кількість, середнє, стандартне відхилення, квантилі."""
+    gpa = student_gpa(frames).to_numpy()
+    groups = pd.Series(gpa).groupby(frames.students["major"].to_numpy(), observed=True)
+    summary = groups.agg(["count", "mean", "std"])
+    for q in quantiles:
+        summary[f"q{int(q * 100)}"] = groups.quantile(q)
+    return summary.round(2)
+
+
+def course_statistics(frames):
+    """Середня оцінка та рівень виконання кожного курсу (як Course.get_statistics)."""
+    courses = frames.courses
+    grades = frames.grades[frames.grades["enrolled"].to_numpy()]
+    count = len(courses)
+    submitted = np.bincount(grades["course"].to_numpy(), minlength=count)
+    total = np.bincount(grades["course"].to_numpy(), grades["percentage"].to_numpy(), count)
+    possible = courses["enrolled_students"].to_numpy() * courses["assignments_count"].to_numpy()
+    average = np.divide(total, submitted, out=np.zeros(count), where=submitted > 0)
+    # (здано / можливо) * 100 - як у Course.get_statistics
+    completion = (
+        np.divide(
+            submitted,
+            possible,
+            out=np.zeros(count),
+            where=(possible > 0) & (submitted > 0),
+        )
+        * 100
+    )
+    return pd.DataFrame(
+        {
+            "course_title": courses["title"].to_numpy(),
+            "instructor": courses["instructor"].to_numpy(),
+            "enrolled_students": courses["enrolled_students"].to_numpy(),
+            "assignments_count": courses["assignments_count"].to_numpy(),
+            # round() Python, як і в student_gpa: ndarray.round округлює половинки інакше
+            "average_grade": [round(value, 2) for value in average.tolist()],
+            "completion_rate": [round(value, 2) for value in completion.tolist()],
+        },
+        index=courses["id"],
+    )
+
+
+def instructor_averages(frames):
+    """Середня оцінка зарахованих студентів по кожному викладачу."""
+    grades = frames.grades[frames.grades["enrolled"].to_numpy()]
+    instructor = frames.courses["instructor_id"].to_numpy()[grades["course"].to_numpy()]
+    names = frames.courses.drop_duplicates("instructor_id").set_index("instructor_id")
+    summary = (
+        grades["percentage"]
+        .groupby(instructor)
+        .agg(["count", "mean"])
+        .rename(columns={"count": "grades", "mean": "average_grade"})
+    )
+    summary.insert(0, "instructor", names["instructor"].reindex(summary.index))
+    return summary.round(2)
+
+
+def completion_by_year(frames):
+    """Рівень виконання завдань (здано / можливо, %) за роком навчання."""
+    years = frames.students["year_of_study"].to_numpy()
+    grades = frames.grades[frames.grades["enrolled"].to_numpy()]
+    submitted = pd.Series(1, index=years[grades["student"].to_numpy()]).groupby(level=0).sum()
+    enrollments = frames.enrollments
+    possible = (
+        pd.Series(
+            frames.courses["assignments_count"].to_numpy()[enrollments["course"].to_numpy()],
+            index=years[enrollments["student"].to_numpy()],
+        )
+        .groupby(level=0)
+        .sum()
+    )
+    result = pd.DataFrame({"submitted": submitted, "possible": possible}).fillna(0)
+    result["completion_rate"] = np.divide(
+        result["submitted"] * 100.0,
+        result["possible"],
+        out=np.zeros(len(result)),
+        where=result["possible"].to_numpy() > 0,
+    ).round(2)
+    result.index.name = "year_of_study"
+    return result.astype({"submitted": np.int64, "possible": np.int64})
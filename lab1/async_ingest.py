@@ -0,0 +1,277 @@
+"""
+Asyncio-фасад над EducationSystem з чергою, що об'єднує оцінки в пакети.
+
+Події оцінювання ставляться в обмежену чергу (повна черга пригальмовує
+відправників - backpressure), фоновий обробник забирає їх пакетами та
+застосовує через EducationSystem.submit_grades одним проходом.
+
+Пакетування окуповується, коли виклик має великі фіксовані витрати - як у
+SQLiteEducationSystem, де кожен submit_grade є окремою транзакцією з
+записом на диск, а пакет - однією. Для EducationSystem у пам'яті виклик
+submit_grade коштує кілька мікросекунд, тож черга з futures лише додає
+накладні витрати та затримку (p50 - десятки мс під сплесками); там фасад
+корисний для backpressure та невблокування циклу подій, а не для швидкості.
+Демонстрація порівнює обидва бекенди.
+
+Пакети застосовуються в окремому потоці (одному на обробник, тож по черзі),
+і коміт SQLite не блокує інші корутини. Поки обробник працює, систему не
+слід змінювати з інших потоків чи корутин напряму - або це має бути
+ConcurrentEducationSystem.
+
+Запуск демонстрації:
+    python lab1/async_ingest.py [--events 100000] [--batch 500] [--backend sqlite]
+"""
+
+import argparse
+import asyncio
+import collections
+import concurrent.futures
+import datetime
+import os
+import tempfile
+import time
+
+from main import EducationSystem, SilentSink
+from sqlite_backend import SQLiteEducationSystem
+
+
+class GradeIngestor:
+    """Черга виставлення оцінок з пакетною обробкою та статистикою затримок."""
+
+    def __init__(
+        self, system, batch_size=500, max_pending=10_000, linger=0.002, history=100_000
+    ):
+        self.system = system
+        self.batch_size = batch_size
+        # Скільки чекати на наповнення пакета, якщо черга спорожніла
+        self.linger = linger
+        self.queue = asyncio.Queue(maxsize=max_pending)
+        self.latencies = collections.deque(maxlen=history)  # секунди
+        self.batches = 0
+        self.processed = 0
+        self._worker = None
+        self._executor = None
+
+    @property
+    def pending(self):
+        """Кількість подій у черзі (для моніторингу навантаження)."""
+        return self.queue.qsize()
+
+    async def start(self):
+        if self._worker is None:
+            # Один потік: пакети застосовуються послідовно в порядку надходження
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                1, thread_name_prefix="grade-ingestor"
+            )
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Дочікується обробки всіх поставлених подій та зупиняє обробник."""
+        await self.queue.join()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+            self._executor.shutdown()
+            self._executor = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def submit(self, student_id, assignment_id, points_earned, feedback=""):
+        """
+        Ставить оцінку в чергу (чекає, якщо черга повна) і повертає
+        результат виставлення (True/False) після обробки пакета.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put(
+            (
+                (student_id, assignment_id, points_earned, feedback),
+                time.perf_counter(),
+                future,
+            )
+        )
+        return await future
+
+    def try_submit(self, student_id, assignment_id, points_earned, feedback=""):
+        """
+        Ставить оцінку в чергу без очікування. Повертає future з результатом
+        або None, якщо черга переповнена і відправнику слід повторити пізніше.
+        """
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait(
+                (
+                    (student_id, assignment_id, points_earned, feedback),
+                    time.perf_counter(),
+                    future,
+                )
+            )
+        except asyncio.QueueFull:
+            return None
+        return future
+
+    async def _collect(self):
+        """Збирає пакет: перший елемент очікується, решта - поки є або до linger."""
+        batch = [await self.queue.get()]
+        deadline = time.perf_counter() + self.linger
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except asyncio.QueueEmpty:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            # Усе, включно з розбором результатів, під захистом: інакше помилка
+            # зупинила б обробник, а відправники чекали б на futures вічно
+            try:
+                results = await loop.run_in_executor(
+                    self._executor, self.system.submit_grades, [item[0] for item in batch]
+                )
+                if results is None or len(results) != len(batch):
+                    raise TypeError(
+                        "submit_grades має повертати список результатів для кожного запису"
+                    )
+                done = time.perf_counter()
+                for (_, enqueued, future), result in zip(batch, results):
+                    self.latencies.append(done - enqueued)
+                    if not future.done():
+                        future.set_result(result)
+            except Exception as error:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+            finally:
+                self.batches += 1
+                self.processed += len(batch)
+                for _ in batch:
+                    self.queue.task_done()
+
+    def latency_stats(self):
+        """Повертає p50/p99/максимальну затримку в мілісекундах."""
+        if not self.latencies:
+            return {"count": 0, "p50_ms": 0, "p99_ms": 0, "max_ms": 0}
+        ordered = sorted(self.latencies)
+
+        def percentile(p):
+            return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1000
+
+        return {
+            "count": len(ordered),
+            "p50_ms": round(percentile(50), 3),
+            "p99_ms": round(percentile(99), 3),
+            "max_ms": round(ordered[-1] * 1000, 3),
+        }
+
+
+def build_system(students=2000, assignments=50, db_path=None):
+    """Система для демонстрації; з db_path - SQLiteEducationSystem у цьому файлі."""
+    if db_path is None:
+        system = EducationSystem(sink=SilentSink())
+    else:
+        system = SQLiteEducationSystem(db_path, sink=SilentSink())
+    instructor = system.add_instructor("Викладач", "t@uni.edu", "КН", "Python")
+    course = system.create_course("Курс", "", 4, instructor.id, max_students=students)
+    student_ids = [
+        system.add_student(f"Студент {i}", f"s{i}@uni.edu", "КН", 1).id
+        for i in range(students)
+    ]
+    system.bulk_enroll(course.id, student_ids)
+    due = datetime.datetime.now() + datetime.timedelta(days=30)
+    assignment_ids = [
+        system.create_assignment(course.id, f"Лаб {i}", "", 100, due).id
+        for i in range(assignments)
+    ]
+    return system, student_ids, assignment_ids
+
+
+async def demo(
+    system, student_ids, assignment_ids, events, batch_size, producers=20, burst=200
+):
+    async with GradeIngestor(system, batch_size=batch_size) as ingestor:
+
+        async def producer(worker):
+            # Сервіси оцінювання надсилають події сплесками
+            for start in range(worker * burst, events, producers * burst):
+                pending = []
+                for i in range(start, min(start + burst, events)):
+                    event = (
+                        student_ids[i % len(student_ids)],
+                        assignment_ids[i % len(assignment_ids)],
+                        i % 101,
+                    )
+                    future = ingestor.try_submit(*event)
+                    if future is None:
+                        # Черга повна: чекаємо на звільнення місця
+                        pending.append(asyncio.ensure_future(ingestor.submit(*event)))
+                    else:
+                        pending.append(future)
+                await asyncio.gather(*pending)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(producer(w) for w in range(producers)))
+        seconds = time.perf_counter() - started
+    return seconds, ingestor
+
+
+def run_demo(events, batch_size, db_path=None):
+    """Друкує пропускну здатність викликів по одному та через чергу з пакетами."""
+    system, student_ids, assignment_ids = build_system(db_path=db_path)
+    started = time.perf_counter()
+    for i in range(events):
+        system.submit_grade(
+            student_ids[i % len(student_ids)], assignment_ids[i % len(assignment_ids)], i % 101
+        )
+    baseline = time.perf_counter() - started
+    print(f"  submit_grade по одній: {events / baseline:10.0f} подій/с")
+
+    if db_path is not None:
+        system.close()
+        os.remove(db_path)
+    system, student_ids, assignment_ids = build_system(db_path=db_path)
+    seconds, ingestor = asyncio.run(
+        demo(system, student_ids, assignment_ids, events, batch_size)
+    )
+    stats = ingestor.latency_stats()
+    print(
+        f"  Черга з пакетами:      {events / seconds:10.0f} подій/с "
+        f"({baseline / seconds:.1f}x), пакетів {ingestor.batches}, "
+        f"p50 {stats['p50_ms']} мс, p99 {stats['p99_ms']} мс"
+    )
+    if db_path is not None:
+        system.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=500)
+    parser.add_argument(
+        "--backend", choices=("memory", "sqlite", "both"), default="both"
+    )
+    args = parser.parse_args()
+
+    if args.backend in ("memory", "both"):
+        print("EducationSystem (у пам'яті):")
+        run_demo(args.events, args.batch)
+    if args.backend in ("sqlite", "both"):
+        print("SQLiteEducationSystem (файл):")
+        with tempfile.TemporaryDirectory() as directory:
+            run_demo(args.events, args.batch, os.path.join(directory, "ingest.db"))
@@ -0,0 +1,136 @@
+"""
+Стрес-тест ConcurrentEducationSystem: пропускна здатність submit_grade
+при різній кількості потоків та перевірка відсутності переповнення курсів.
+
+Запуск: python lab1/bench_concurrency.py [--grades 200000] [--threads 1 2 4 8]
+"""
+
+import argparse
+import datetime
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from concurrent_system import ConcurrentEducationSystem
+from main import SilentSink
+
+
+def build(students=2000, courses=20, assignments_per_course=10, seats=None):
+    system = ConcurrentEducationSystem(sink=SilentSink())
+    instructor = system.add_instructor("Викладач", "t@uni.edu", "КН", "Python")
+    student_ids = [
+        system.add_student(f"Студент {i}", f"s{i}@uni.edu", "КН", 1).id
+        for i in range(students)
+    ]
+    due = datetime.datetime.now() + datetime.timedelta(days=30)
+    course_ids, assignment_ids = [], []
+    for c in range(courses):
+        course = system.create_course(
+            f"Курс {c}", "", 3, instructor.id, max_students=seats or students
+        )
+        course_ids.append(course.id)
+        assignment_ids.extend(
+            system.create_assignment(course.id, f"Лаб {a}", "", 100, due).id
+            for a in range(assignments_per_course)
+        )
+    return system, student_ids, course_ids, assignment_ids
+
+
+def grade_throughput(threads, total):
+    system, student_ids, course_ids, assignment_ids = build()
+    for course_id in course_ids:
+        system.bulk_enroll(course_id, student_ids)
+
+    def work(worker):
+        for i in range(worker, total, threads):
+            system.submit_grade(
+                student_ids[i % len(student_ids)],
+                assignment_ids[(i // len(student_ids)) % len(assignment_ids)],
+                i % 101,
+            )
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(work, range(threads)))
+    seconds = time.perf_counter() - started
+
+    # Агрегати мають збігатися з повним перерахунком
+    for student in list(system.students.values())[:200]:
+        assert student.get_gpa() == full_gpa(student), student.id
+    return seconds
+
+
+def full_gpa(student):
+    """GPA, розрахований заново за всіма оцінками студента."""
+    if not student.grades:
+        return 0.0
+    total = sum(g.get_percentage() for g in student.grades.values())
+    return round((total / len(student.grades) / 100) * 4, 2)
+
+
+def regrade_check(submits=100, seed=1):
+    """
+    Випадкові оцінки з повторним оцінюванням для завдань з різними макс. балами:
+    GPA та порядок get_top_students мають збігатися з повним перерахунком.
+    """
+    rng = random.Random(seed)
+    system = ConcurrentEducationSystem(sink=SilentSink())
+    instructor = system.add_instructor("Викладач", "t@uni.edu", "КН", "Python")
+    student_ids = [
+        system.add_student(f"Студент {i}", f"s{i}@uni.edu", "КН", 1).id
+        for i in range(5)
+    ]
+    course = system.create_course("Курс", "", 3, instructor.id)
+    system.bulk_enroll(course.id, student_ids)
+    due = datetime.datetime.now() + datetime.timedelta(days=30)
+    assignments = [
+        (system.create_assignment(course.id, f"Лаб {m}", "", m, due).id, m)
+        for m in (7, 8, 12, 30, 100)
+    ]
+    for _ in range(submits):
+        assignment_id, max_points = rng.choice(assignments)
+        system.submit_grade(rng.choice(student_ids), assignment_id, rng.randint(0, max_points))
+    students = [system.students[sid] for sid in student_ids]
+    for student in students:
+        assert student.get_gpa() == full_gpa(student), student.id
+    expected = sorted(students, key=lambda s: (-full_gpa(s), s.id))
+    assert system.get_top_students(len(students)) == expected
+
+
+def enrollment_race(threads, seats=500, applicants=5000):
+    """Багато потоків зараховують студентів на курс з обмеженою кількістю місць."""
+    system, student_ids, course_ids, _ = build(
+        students=applicants, courses=1, assignments_per_course=0, seats=seats
+    )
+    course_id = course_ids[0]
+    with ThreadPoolExecutor(threads) as pool:
+        results = list(
+            pool.map(lambda sid: system.enroll_student(sid, course_id), student_ids)
+        )
+    enrolled = len(system.courses[course_id].enrolled_students)
+    return enrolled, sum(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--grades", type=int, default=200_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    for seed in range(200):
+        regrade_check(seed=seed)
+    print("Повторне оцінювання: GPA збігається з повним перерахунком")
+
+    print(f"submit_grade, {args.grades} оцінок:")
+    for threads in args.threads:
+        seconds = grade_throughput(threads, args.grades)
+        print(
+            f"  потоків {threads:>2}: {seconds:6.2f} с, "
+            f"{args.grades / seconds:10.0f} оцінок/с"
+        )
+
+    print("Зарахування на курс з 500 місцями (5000 претендентів):")
+    for threads in args.threads:
+        enrolled, accepted = enrollment_race(threads)
+        status = "OK" if enrolled == accepted <= 500 else "ПЕРЕПОВНЕННЯ"
+        print(f"  потоків {threads:>2}: зараховано {enrolled}, успішних викликів {accepted} - {status}")
@@ -0,0 +1,48 @@
+"""
+Швидкість створення об'єктів та кількість колізій для різних генераторів ID.
+
+Запуск: python lab1/bench_ids.py [--count 1000000]
+"""
+
+import argparse
+import time
+
+from main import (
+    PrefixedAllocator,
+    SequentialAllocator,
+    Student,
+    UUIDAllocator,
+)
+
+ALLOCATORS = {
+    "uuid4[:8] (старий)": lambda: UUIDAllocator(length=8),
+    "uuid4 (повний)": UUIDAllocator,
+    "послідовний": SequentialAllocator,
+    "з префіксом": PrefixedAllocator,
+}
+
+
+def run(allocator, count):
+    """Створює count студентів; повертає (секунди, кількість колізій ID)."""
+    allocate = allocator.allocate
+    started = time.perf_counter()
+    students = [
+        Student("Студент", "s@uni.edu", "КН", 1, entity_id=allocate("student"))
+        for _ in range(count)
+    ]
+    seconds = time.perf_counter() - started
+    return seconds, count - len({student.id for student in students})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(f"Створення {args.count} студентів:")
+    for label, factory in ALLOCATORS.items():
+        seconds, collisions = run(factory(), args.count)
+        print(
+            f"  {label:<20} {seconds:6.2f} с, {args.count / seconds:10.0f} об'єктів/с, "
+            f"колізій: {collisions}"
+        )
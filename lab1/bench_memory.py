@@ -0,0 +1,73 @@
+"""
+Порівняння споживання пам'яті оцінками у звичайному (словники об'єктів Grade)
+та компактному (колонковий GradeStore) режимах.
+
+Запуск: python lab1/bench_memory.py [--grades 1000000] [--assignments 100]
+"""
+
+import argparse
+import datetime
+import gc
+import time
+import tracemalloc
+
+from main import Assignment, Grade, GradeStore, Student
+
+
+def build(total_grades, assignments_per_student, compact):
+    """Створює студентів та total_grades оцінок, повертає (об'єкти, секунди)."""
+    due = datetime.datetime(2025, 12, 1)
+    assignments = [
+        Assignment("course", f"Завдання {i}", "", 100, due)
+        for i in range(assignments_per_student)
+    ]
+    store = GradeStore() if compact else None
+    if store is not None:
+        for assignment in assignments:
+            store.assignment_index(assignment)
+
+    students = []
+    started = time.perf_counter()
+    student_count = total_grades // assignments_per_student
+    for i in range(student_count):
+        student = Student(f"Студент {i}", f"s{i}@uni.edu", "КН", 1)
+        if store is not None:
+            student.grades = store.view(student)
+        for j, assignment in enumerate(assignments):
+            student.record_grade(Grade(student, assignment, (i + j) % 101))
+        students.append(student)
+    return (students, assignments, store), time.perf_counter() - started
+
+
+def measure(total_grades, assignments_per_student, compact):
+    gc.collect()
+    tracemalloc.start()
+    data, seconds = build(total_grades, assignments_per_student, compact)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    students = data[0]
+    gpa_sample = students[len(students) // 2].get_gpa()
+    del data, students
+    return {
+        "mode": "compact" if compact else "dict",
+        "current_mb": current / 2**20,
+        "peak_mb": peak / 2**20,
+        "seconds": seconds,
+        "gpa_sample": gpa_sample,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--grades", type=int, default=1_000_000)
+    parser.add_argument("--assignments", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"Оцінок: {args.grades}, завдань на студента: {args.assignments}")
+    for compact in (False, True):
+        result = measure(args.grades, args.assignments, compact)
+        print(
+            f"  {result['mode']:>7}: {result['current_mb']:8.1f} MiB "
+            f"(пік {result['peak_mb']:.1f} MiB), {result['seconds']:.1f} с, "
+            f"GPA-зразок {result['gpa_sample']}"
+        )
@@ -0,0 +1,61 @@
+"""
+Пропускна здатність submit_grade для різних приймачів подій:
+stdout (друк у /dev/null), buffered (накопичення в пам'яті) та silent.
+
+Запуск: python lab1/bench_sinks.py [--grades 100000]
+"""
+
+import argparse
+import contextlib
+import datetime
+import os
+import time
+
+from main import BufferedSink, EducationSystem, SilentSink, StdoutSink
+
+
+def build_system(sink, students=1000, assignments=100):
+    """Створює систему без виводу, після чого підключає досліджуваний приймач."""
+    system = EducationSystem(sink=SilentSink())
+    instructor = system.add_instructor("Викладач", "t@uni.edu", "КН", "Python")
+    course = system.create_course("Курс", "", 4, instructor.id, max_students=students)
+    student_ids = [
+        system.add_student(f"Студент {i}", f"s{i}@uni.edu", "КН", 1).id
+        for i in range(students)
+    ]
+    system.bulk_enroll(course.id, student_ids)
+    due = datetime.datetime(2025, 12, 1)
+    assignment_ids = [
+        system.create_assignment(course.id, f"Лаб {i}", "", 100, due).id
+        for i in range(assignments)
+    ]
+    system.sink = sink
+    return system, student_ids, assignment_ids
+
+
+def run(sink, total):
+    system, student_ids, assignment_ids = build_system(sink)
+    started = time.perf_counter()
+    for i in range(total):
+        system.submit_grade(
+            student_ids[i % len(student_ids)],
+            assignment_ids[(i // len(student_ids)) % len(assignment_ids)],
+            i % 101,
+        )
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--grades", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"Виставлення {args.grades} оцінок:")
+    for label, sink in (
+        ("stdout", StdoutSink()),
+        ("buffered", BufferedSink()),
+        ("silent", SilentSink()),
+    ):
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            seconds = run(sink, args.grades)
+        print(f"  {label:>8}: {seconds:6.2f} с, {args.grades / seconds:10.0f} оцінок/с")
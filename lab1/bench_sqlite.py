@@ -0,0 +1,106 @@
+"""
+Порівняння EducationSystem (у пам'яті) та SQLiteEducationSystem на однакових операціях.
+
+Запуск: python lab1/bench_sqlite.py [--students 5000] [--assignments 20] [--db FILE]
+"""
+
+import argparse
+import datetime
+import os
+import tempfile
+import time
+
+from main import EducationSystem, SilentSink
+from sqlite_backend import SQLiteEducationSystem
+
+
+def timed(results, label, action):
+    started = time.perf_counter()
+    value = action()
+    results[label] = time.perf_counter() - started
+    return value
+
+
+def run(system, students, assignments):
+    """Виконує однаковий сценарій та повертає {операція: секунди}."""
+    results = {}
+    instructor = system.add_instructor("Викладач", "t@uni.edu", "КН", "Python")
+    course = system.create_course("Курс", "", 4, instructor.id, max_students=students)
+    student_ids = timed(
+        results,
+        "add_student",
+        lambda: [
+            system.add_student(f"Студент {i}", f"s{i}@uni.edu", "КН", 1).id
+            for i in range(students)
+        ],
+    )
+    timed(results, "bulk_enroll", lambda: system.bulk_enroll(course.id, student_ids))
+    now = datetime.datetime.now()
+    assignment_ids = [
+        system.create_assignment(
+            course.id, f"Лаб {i}", "", 100, now + datetime.timedelta(days=i)
+        ).id
+        for i in range(assignments)
+    ]
+    grades = [
+        (student_id, assignment_id, (i + j) % 101, "")
+        for i, student_id in enumerate(student_ids)
+        for j, assignment_id in enumerate(assignment_ids)
+    ]
+    # Половина оцінок записується по одній, половина - одним пакетом,
+    # щоб обидва шляхи запису порівнювались на обох рушіях
+    half = len(grades) // 2
+    timed(
+        results,
+        "submit_grade (1/2)",
+        lambda: [system.submit_grade(*grade) for grade in grades[:half]],
+    )
+    timed(
+        results,
+        "submit_grades (1/2)",
+        lambda: system.submit_grades(grades[half:]),
+    )
+    timed(results, "get_gpa (усі)", lambda: [gpa(system, s) for s in student_ids])
+    timed(results, "get_statistics", lambda: statistics(system, course.id))
+    timed(results, "get_top_students", lambda: system.get_top_students(10))
+    timed(results, "deadlines (7 днів)", lambda: list(system.iter_upcoming_deadlines(7)))
+    return results
+
+
+def gpa(system, student_id):
+    if isinstance(system, SQLiteEducationSystem):
+        return system.get_gpa(student_id)
+    return system.students[student_id].get_gpa()
+
+
+def statistics(system, course_id):
+    if isinstance(system, SQLiteEducationSystem):
+        return system.get_statistics(course_id)
+    return system.courses[course_id].get_statistics()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--students", type=int, default=5000)
+    parser.add_argument("--assignments", type=int, default=20)
+    parser.add_argument("--db", help="файл бази (за замовчуванням тимчасовий)")
+    args = parser.parse_args()
+
+    db_path = args.db or os.path.join(tempfile.mkdtemp(), "education.sqlite")
+    engines = {
+        "пам'ять": EducationSystem(sink=SilentSink()),
+        "sqlite": SQLiteEducationSystem(db_path, sink=SilentSink()),
+    }
+    print(f"Студентів: {args.students}, оцінок: {args.students * args.assignments}")
+    report = {
+        name: run(system, args.students, args.assignments)
+        for name, system in engines.items()
+    }
+    labels = list(dict.fromkeys(label for r in report.values() for label in r))
+    print(f"{'операція':<24}" + "".join(f"{name:>12}" for name in report))
+    for label in labels:
+        cells = "".join(
+            f"{report[name][label]:>11.4f}s" if label in report[name] else f"{'-':>12}"
+            for name in report
+        )
+        print(f"{label:<24}{cells}")
@@ -0,0 +1,257 @@
+"""
+Набір бенчмарків основних операцій EducationSystem на різних масштабах.
+
+Для кожного масштабу система генерується loadgen.generate (детерміновано),
+після чого кожна операція виконується rounds разів по ops викликів.
+Статистика (min/max/mean/median/stddev на виклик, ops/s) пишеться в JSON,
+а з --compare попередній JSON використовується для пошуку регресій.
+
+Запуск:
+    python lab1/bench_suite.py [--scales 10000 100000 1000000] [--output bench.json]
+                               [--compare old.json] [--threshold 0.2] [--compact]
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+
+from loadgen import BASE_DATE, LoadConfig, generate
+from main import ATTENDANCE_STATUSES
+
+
+def _stats(timings, ops):
+    """Статистика одного бенчмарку у стилі pytest-benchmark (секунди на виклик)."""
+    per_call = [seconds / ops for seconds in timings]
+    return {
+        "rounds": len(timings),
+        "ops_per_round": ops,
+        "min": min(per_call),
+        "max": max(per_call),
+        "mean": statistics.fmean(per_call),
+        "median": statistics.median(per_call),
+        "stddev": statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+        "ops": ops / statistics.median(timings),
+    }
+
+
+def _quiet(action, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return action(*args)
+
+
+def _member_ids(course):
+    """ID зарахованих студентів у порядку зарахування (відтворювано між процесами)."""
+    return [student.id for student in course.enrolled_students]
+
+
+def run_benchmark(name, setup, action, rounds, ops):
+    """
+    Виконує action(arguments) для кожного аргументу з setup(round) у кожному раунді.
+    Час setup не враховується.
+    """
+    timings = []
+    for round_number in range(rounds):
+        arguments = setup(round_number)
+        started = time.perf_counter()
+        for argument in arguments:
+            action(argument)
+        timings.append(time.perf_counter() - started)
+    return {"name": name, "stats": _stats(timings, ops)}
+
+
+def benchmarks(system, rng, ops):
+    """Повертає список (назва, setup, action, ops) для системи."""
+    student_ids = list(system.students)
+    course_ids = list(system.courses)
+    instructor_id = next(iter(system.instructors))
+    enrolled = [
+        (student_id, assignment.id)
+        for course_id in rng.sample(course_ids, min(len(course_ids), 50))
+        for student_id in _member_ids(system.courses[course_id])
+        for assignment in system.courses[course_id].assignments
+    ]
+
+    def enroll_setup(round_number):
+        # Окремий курс на раунд, щоб кожен виклик був справжнім зарахуванням
+        course = system.create_course(
+            f"Бенчмарк {round_number}", "", 3, instructor_id, max_students=ops
+        )
+        return [(s, course.id) for s in rng.sample(student_ids, ops)]
+
+    def attendance_setup(round_number):
+        sample = rng.sample(course_ids, min(ops, len(course_ids)))
+        date = (BASE_DATE + datetime.timedelta(days=round_number + 1)).date()
+        return [
+            (
+                system.courses[course_id],
+                date,
+                {
+                    student_id: rng.choice(ATTENDANCE_STATUSES)
+                    for student_id in _member_ids(system.courses[course_id])
+                },
+            )
+            for course_id in sample
+        ]
+
+    course_ops = min(ops, len(course_ids))
+    return [
+        (
+            "enroll_student",
+            enroll_setup,
+            lambda pair: system.enroll_student(*pair),
+            ops,
+        ),
+        (
+            "submit_grade",
+            lambda _: [
+                (s, a, rng.randint(0, 10)) for s, a in rng.choices(enrolled, k=ops)
+            ],
+            lambda row: system.submit_grade(*row),
+            ops,
+        ),
+        (
+            "get_gpa",
+            lambda _: rng.sample(student_ids, ops),
+            lambda student_id: system.students[student_id].get_gpa(),
+            ops,
+        ),
+        (
+            "get_statistics",
+            lambda _: rng.sample(course_ids, course_ops),
+            lambda course_id: system.courses[course_id].get_statistics(),
+            course_ops,
+        ),
+        (
+            # Дедлайни генеруються навколо BASE_DATE; друк перенаправляється в буфер
+            "check_deadline_reminders",
+            lambda _: [7] * 10,
+            lambda days: _quiet(system.check_deadline_reminders, days, BASE_DATE),
+            10,
+        ),
+        (
+            "mark_attendance",
+            attendance_setup,
+            lambda row: row[0].mark_attendance(row[1], row[2]),
+            course_ops,
+        ),
+    ]
+
+
+def run_suite(scales, rounds=5, ops=1000, compact=False, seed=42):
+    results = []
+    for scale in scales:
+        config = LoadConfig(students=scale, seed=seed)
+        started = time.perf_counter()
+        system = generate(config, compact=compact)
+        results.append(
+            {
+                "name": "generate",
+                "scale": scale,
+                "stats": _stats([time.perf_counter() - started], 1),
+            }
+        )
+        print(f"[{scale}] згенеровано за {results[-1]['stats']['min']:.2f} с", file=sys.stderr)
+        rng = random.Random(seed)
+        for name, setup, action, count in benchmarks(system, rng, min(ops, scale)):
+            result = run_benchmark(name, setup, action, rounds, count)
+            result["scale"] = scale
+            results.append(result)
+            print(
+                f"[{scale}] {name:26s} медіана {result['stats']['median'] * 1e6:10.2f} мкс",
+                file=sys.stderr,
+            )
+        del system
+    return results
+
+
+# Параметри, від яких залежать медіани: прогони з різними значеннями не порівнюються
+COMPARABLE_CONFIG = ("compact", "ops", "rounds", "seed")
+
+
+def check_config(baseline, config):
+    """ValueError, якщо baseline отримано з іншою конфігурацією, ніж config."""
+    previous = baseline.get("config", {})
+    mismatched = [
+        f"{key}: {previous.get(key)!r} -> {config.get(key)!r}"
+        for key in COMPARABLE_CONFIG
+        if previous.get(key) != config.get(key)
+    ]
+    if mismatched:
+        raise ValueError("Інша конфігурація baseline: " + ", ".join(mismatched))
+
+
+def compare(results, baseline, threshold, config):
+    """Повертає список регресій: медіана повільніша за baseline більш ніж на threshold."""
+    check_config(baseline, config)
+    previous = {(b["name"], b["scale"]): b["stats"] for b in baseline["benchmarks"]}
+    regressions = []
+    for result in results:
+        old = previous.get((result["name"], result["scale"]))
+        if old is None or not old["median"]:
+            continue
+        change = result["stats"]["median"] / old["median"] - 1
+        if change > threshold:
+            regressions.append(
+                {"name": result["name"], "scale": result["scale"], "change": round(change, 3)}
+            )
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--ops", type=int, default=1000, help="викликів на раунд")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--compact", action="store_true")
+    parser.add_argument("--output", help="файл JSON (за замовчуванням - stdout)")
+    parser.add_argument("--compare", metavar="JSON", help="попередні результати")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    config = {
+        "rounds": args.rounds,
+        "ops": args.ops,
+        "seed": args.seed,
+        "compact": args.compact,
+    }
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        # Перевіряється до запуску, щоб не чекати даремно на весь прогін
+        try:
+            check_config(baseline, config)
+        except ValueError as error:
+            parser.error(str(error))
+
+    results = run_suite(args.scales, args.rounds, args.ops, args.compact, args.seed)
+    report = {
+        "datetime": datetime.datetime.now().isoformat(timespec="seconds"),
+        "machine_info": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "config": config,
+        "benchmarks": results,
+    }
+    if baseline is not None:
+        report["regressions"] = compare(results, baseline, args.threshold, config)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    else:
+        print(text)
+    if report.get("regressions"):
+        print(f"Регресії: {report['regressions']}", file=sys.stderr)
+        sys.exit(1)
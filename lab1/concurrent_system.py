@@ -0,0 +1,204 @@
+"""
+Потокобезпечна EducationSystem для паралельного виставлення оцінок та зарахування.
+
+Блокування дрібнозернисті: окремий замок на кожен курс і на кожного студента,
+плюс короткі замки для спільних індексів (GPA, розклад, реєстри). Порядок
+захоплення завжди однаковий - курс, потім студент (кілька курсів чи
+студентів - за зростанням ID), потім замок індексу, - тож взаємні
+блокування неможливі.
+"""
+
+import contextlib
+import threading
+
+from main import EducationSystem
+from schedule import ScheduleEngine
+
+
+class LockedScheduleEngine(ScheduleEngine):
+    """ScheduleEngine, усі операції якого виконуються під одним замком."""
+
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.RLock()
+
+    def find_conflicts(self, course, start, end, location):
+        with self.lock:
+            return super().find_conflicts(course, start, end, location)
+
+    def add_session(self, course, start, end, location):
+        with self.lock:
+            super().add_session(course, start, end, location)
+
+    def find_enrollment_conflicts(self, student, course):
+        with self.lock:
+            return super().find_enrollment_conflicts(student, course)
+
+    def enroll(self, student, course):
+        with self.lock:
+            super().enroll(student, course)
+
+
+class ConcurrentEducationSystem(EducationSystem):
+    """EducationSystem, методи якої можна викликати з кількох потоків."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.timetable = LockedScheduleEngine()
+        self._course_locks = {}
+        self._student_locks = {}
+        self._locks_guard = threading.Lock()
+        self._registry_lock = threading.RLock()
+        self._gpa_lock = threading.RLock()
+        # Колонкове сховище спільне для всіх студентів, тому має власний замок
+        self._store_lock = threading.Lock()
+
+    # --- Замки ---
+
+    def _lock(self, table, key):
+        """Повертає замок сутності, створюючи його за потреби."""
+        lock = table.get(key)
+        if lock is None:
+            with self._locks_guard:
+                lock = table.setdefault(key, threading.RLock())
+        return lock
+
+    def _course_lock(self, course_id):
+        if course_id not in self.courses:
+            return contextlib.nullcontext()
+        return self._lock(self._course_locks, course_id)
+
+    def _student_lock(self, student_id):
+        if student_id not in self.students:
+            return contextlib.nullcontext()
+        return self._lock(self._student_locks, student_id)
+
+    # --- Спільні індекси ---
+
+    def _index_gpa(self, student):
+        with self._gpa_lock:
+            super()._index_gpa(student)
+
+    def _reindex_gpa(self, students):
+        with self._gpa_lock:
+            super()._reindex_gpa(students)
+
+    def _apply_grade(self, student, assignment, grade):
+        if self.grade_store is None:
+            super()._apply_grade(student, assignment, grade)
+            return
+        with self._store_lock:
+            super()._apply_grade(student, assignment, grade)
+
+    def get_top_students(self, n=10):
+        with self._gpa_lock:
+            return super().get_top_students(n)
+
+    # --- Створення сутностей ---
+
+    def add_instructor(self, name, email, department, specialization):
+        with self._registry_lock:
+            return super().add_instructor(name, email, department, specialization)
+
+    def add_student(self, name, email, major, year_of_study):
+        with self._registry_lock:
+            return super().add_student(name, email, major, year_of_study)
+
+    def create_course(
+        self, title, description, credits, instructor_id, max_students=30
+    ):
+        with self._registry_lock:
+            return super().create_course(
+                title, description, credits, instructor_id, max_students
+            )
+
+    def create_assignment(self, course_id, title, description, max_points, due_date):
+        with self._course_lock(course_id), self._registry_lock:
+            return super().create_assignment(
+                course_id, title, description, max_points, due_date
+            )
+
+    def add_schedule(self, course_id, day, start_time, end_time, location):
+        # Заняття додається в розклад кожного зарахованого студента, тож їхні
+        # замки не дають паралельному enroll_student пройти перевірку конфліктів
+        # до вставки. Перевірка аудиторії/викладача та вставка - під одним
+        # замком розкладу, щоб два курси не зайняли той самий час
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(self._course_lock(course_id))
+            course = self.courses.get(course_id)
+            if course is not None:
+                for student_id in sorted(student.id for student in course.enrolled_students):
+                    stack.enter_context(self._student_lock(student_id))
+            stack.enter_context(self.timetable.lock)
+            return super().add_schedule(course_id, day, start_time, end_time, location)
+
+    # --- Зарахування та оцінки ---
+
+    def enroll_student(self, student_id, course_id):
+        # Перевірка місткості та додавання виконуються під замком курсу атомарно
+        with self._course_lock(course_id), self._student_lock(student_id):
+            return super().enroll_student(student_id, course_id)
+
+    def bulk_enroll(self, course_id, student_ids):
+        if course_id not in self.courses:
+            return super().bulk_enroll(course_id, student_ids)
+        with self._course_lock(course_id):
+            report = {}
+            for student_id in student_ids:
+                # Повторний ID зберігає статус першого, як у EducationSystem.bulk_enroll
+                if student_id in report:
+                    continue
+                with self._student_lock(student_id):
+                    report.update(super().bulk_enroll(course_id, [student_id]))
+            return report
+
+    def submit_grade(self, student_id, assignment_id, points_earned, feedback=""):
+        assignment = self.assignments.get(assignment_id)
+        course_id = assignment.course_id if assignment else None
+        with self._course_lock(course_id), self._student_lock(student_id):
+            return super().submit_grade(student_id, assignment_id, points_earned, feedback)
+
+    def submit_grades(self, grades):
+        # Кожен запис застосовується під замками свого курсу та студента
+        results = []
+        for row in grades:
+            assignment = self.assignments.get(row[1])
+            course_id = assignment.course_id if assignment else None
+            with self._course_lock(course_id), self._student_lock(row[0]):
+                results.extend(super().submit_grades([row]))
+        return results
+
+    # --- Пакетне завантаження ---
+
+    def import_instructors(self, instructors):
+        with self._registry_lock:
+            super().import_instructors(instructors)
+
+    def import_students(self, students):
+        with self._registry_lock:
+            super().import_students(students)
+
+    def import_courses(self, courses):
+        with self._registry_lock:
+            super().import_courses(courses)
+
+    def import_enrollments(self, enrollments):
+        for student_id, course_id in enrollments:
+            with self._course_lock(course_id), self._student_lock(student_id):
+                super().import_enrollments([(student_id, course_id)])
+
+    def import_assignments(self, assignments):
+        # Списки завдань курсів змінюються під їхніми замками (за зростанням ID),
+        # як у create_assignment; пакет застосовується одним викликом
+        assignments = list(assignments)
+        with contextlib.ExitStack() as stack:
+            for course_id in sorted({assignment.course_id for assignment in assignments}):
+                stack.enter_context(self._course_lock(course_id))
+            stack.enter_context(self._registry_lock)
+            super().import_assignments(assignments)
+
+    def import_grades(self, grades):
+        for grade in grades:
+            course_id = self.assignments[grade.assignment_id].course_id
+            with self._course_lock(course_id), self._student_lock(grade.student_id):
+                super().import_grades([grade])
@@ -0,0 +1,288 @@
+"""
+Потокове збереження та завантаження стану EducationSystem у форматах CSV та JSON Lines.
+
+Кожен тип сутностей зберігається в окремому файлі каталогу
+(instructors, students, courses, enrollments, assignments, grades).
+Записи читаються рядок за рядком і вставляються пакетами через
+EducationSystem.import_*, тож пам'ять на сам імпорт не залежить від розміру файлів.
+
+Запуск:
+    python lab1/data_io.py load DIR [--format jsonl|csv] [--compact]
+    python lab1/data_io.py convert SRC DST --format jsonl --to csv
+"""
+
+import argparse
+import csv
+import datetime
+import itertools
+import json
+import os
+import time
+
+from main import (
+    Assignment,
+    Course,
+    EducationSystem,
+    Grade,
+    Instructor,
+    SilentSink,
+    Student,
+)
+
+# Порядок важливий: кожен файл посилається лише на попередні
+KINDS = ("instructors", "students", "courses", "enrollments", "assignments", "grades")
+
+FIELDS = {
+    "instructors": ("id", "name", "email", "department", "specialization"),
+    "students": ("id", "name", "email", "major", "year_of_study"),
+    "courses": (
+        "id",
+        "title",
+        "description",
+        "credits",
+        "instructor_id",
+        "max_students",
+    ),
+    "enrollments": ("student_id", "course_id"),
+    "assignments": ("id", "course_id", "title", "description", "max_points", "due_date"),
+    "grades": ("student_id", "assignment_id", "points_earned", "feedback", "date_graded"),
+}
+
+BATCH_SIZE = 10_000
+
+
+# --- Перетворення об'єктів у записи ---
+
+
+def iter_records(system, kind):
+    """Генерує записи (словники) заданого типу з системи."""
+    if kind == "instructors":
+        for i in system.instructors.values():
+            yield {
+                "id": i.id,
+                "name": i.name,
+                "email": i.email,
+                "department": i.department,
+                "specialization": i.specialization,
+            }
+    elif kind == "students":
+        for s in system.students.values():
+            yield {
+                "id": s.id,
+                "name": s.name,
+                "email": s.email,
+                "major": s.major,
+                "year_of_study": s.year_of_study,
+            }
+    elif kind == "courses":
+        for c in system.courses.values():
+            yield {
+                "id": c.id,
+                "title": c.title,
+                "description": c.description,
+                "credits": c.credits,
+                "instructor_id": c.instructor.id,
+                "max_students": c.max_students,
+            }
+    elif kind == "enrollments":
+        for c in system.courses.values():
+            for s in c.enrolled_students:
+                yield {"student_id": s.id, "course_id": c.id}
+    elif kind == "assignments":
+        for a in system.assignments.values():
+            yield {
+                "id": a.id,
+                "course_id": a.course_id,
+                "title": a.title,
+                "description": a.description,
+                "max_points": a.max_points,
+                "due_date": a.due_date.isoformat(),
+            }
+    elif kind == "grades":
+        for s in system.students.values():
+            for g in s.grades.values():
+                yield {
+                    "student_id": g.student_id,
+                    "assignment_id": g.assignment_id,
+                    "points_earned": g.points_earned,
+                    "feedback": g.feedback,
+                    "date_graded": g.date_graded.isoformat(),
+                }
+    else:
+        raise ValueError(f"Невідомий тип записів: {kind}")
+
+
+# --- Перетворення записів в об'єкти ---
+
+
+def _number(value):
+    """Перетворює рядок з CSV на int або float (JSON-значення повертає як є)."""
+    if isinstance(value, str):
+        return float(value) if "." in value else int(value)
+    return value
+
+
+def _build(system, kind, record):
+    """Створює об'єкт (або пару для зарахування) із запису."""
+    if kind == "instructors":
+        return Instructor(
+            record["name"],
+            record["email"],
+            record["department"],
+            record["specialization"],
+            entity_id=record["id"],
+        )
+    if kind == "students":
+        return Student(
+            record["name"],
+            record["email"],
+            record["major"],
+            _number(record["year_of_study"]),
+            entity_id=record["id"],
+        )
+    if kind == "courses":
+        return Course(
+            record["title"],
+            record["description"],
+            _number(record["credits"]),
+            system.instructors[record["instructor_id"]],
+            _number(record["max_students"]),
+            entity_id=record["id"],
+        )
+    if kind == "enrollments":
+        return record["student_id"], record["course_id"]
+    if kind == "assignments":
+        return Assignment(
+            record["course_id"],
+            record["title"],
+            record["description"],
+            _number(record["max_points"]),
+            datetime.datetime.fromisoformat(record["due_date"]),
+            entity_id=record["id"],
+        )
+    if kind == "grades":
+        return Grade.from_values(
+            record["student_id"],
+            record["assignment_id"],
+            record["points_earned"],
+            system.assignments[record["assignment_id"]].max_points,
+            record["feedback"] or "",
+            datetime.datetime.fromisoformat(record["date_graded"]),
+        )
+    raise ValueError(f"Невідомий тип записів: {kind}")
+
+
+IMPORTERS = {
+    "instructors": "import_instructors",
+    "students": "import_students",
+    "courses": "import_courses",
+    "enrollments": "import_enrollments",
+    "assignments": "import_assignments",
+    "grades": "import_grades",
+}
+
+
+# --- Файли ---
+
+
+def _path(directory, kind, fmt):
+    return os.path.join(directory, f"{kind}.{fmt}")
+
+
+def write_records(path, fmt, kind, records):
+    """Записує потік записів у файл. Повертає кількість записів."""
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        if fmt == "csv":
+            writer = csv.DictWriter(file, fieldnames=FIELDS[kind])
+            writer.writeheader()
+            for record in records:
+                writer.writerow(record)
+                count += 1
+        else:
+            for record in records:
+                file.write(json.dumps(record, ensure_ascii=False))
+                file.write("\n")
+                count += 1
+    return count
+
+
+def read_records(path, fmt):
+    """Генерує записи з файлу рядок за рядком."""
+    with open(path, encoding="utf-8", newline="") as file:
+        if fmt == "csv":
+            yield from csv.DictReader(file)
+        else:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def dump_system(system, directory, fmt="jsonl"):
+    """Зберігає систему в каталог. Повертає {тип: кількість записів}."""
+    os.makedirs(directory, exist_ok=True)
+    return {
+        kind: write_records(
+            _path(directory, kind, fmt), fmt, kind, iter_records(system, kind)
+        )
+        for kind in KINDS
+    }
+
+
+def load_system(directory, fmt="jsonl", system=None, batch_size=BATCH_SIZE):
+    """
+    Завантажує систему з каталогу пакетами по batch_size записів.
+    Відсутні файли пропускаються. Повертає систему.
+    """
+    if system is None:
+        system = EducationSystem(sink=SilentSink())
+    for kind in KINDS:
+        path = _path(directory, kind, fmt)
+        if not os.path.exists(path):
+            continue
+        importer = getattr(system, IMPORTERS[kind])
+        records = read_records(path, fmt)
+        while True:
+            batch = [
+                _build(system, kind, record)
+                for record in itertools.islice(records, batch_size)
+            ]
+            if not batch:
+                break
+            importer(batch)
+    return system
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Імпорт/експорт EducationSystem")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    load_parser = subparsers.add_parser("load", help="завантажити та показати підсумок")
+    load_parser.add_argument("directory")
+    load_parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    load_parser.add_argument("--compact", action="store_true")
+
+    convert_parser = subparsers.add_parser("convert", help="перетворити формат")
+    convert_parser.add_argument("source")
+    convert_parser.add_argument("destination")
+    convert_parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    convert_parser.add_argument("--to", choices=("jsonl", "csv"), default="csv")
+
+    args = parser.parse_args()
+    started = time.perf_counter()
+    loaded = load_system(
+        args.directory if args.command == "load" else args.source,
+        args.format,
+        EducationSystem(
+            compact=getattr(args, "compact", False), sink=SilentSink()
+        ),
+    )
+    print(
+        f"Завантажено за {time.perf_counter() - started:.2f} с: "
+        f"{len(loaded.instructors)} викладачів, {len(loaded.students)} студентів, "
+        f"{len(loaded.courses)} курсів, {len(loaded.assignments)} завдань, "
+        f"{sum(len(s.grades) for s in loaded.students.values())} оцінок"
+    )
+    if args.command == "convert":
+        counts = dump_system(loaded, args.destination, args.to)
+        print(f"Збережено у {args.destination}: {counts}")
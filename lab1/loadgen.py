@@ -0,0 +1,222 @@
+"""
+Детермінований генератор синтетичного навантаження для EducationSystem.
+
+Однакові параметри та seed завжди дають ту саму систему (включно з ID),
+тож результати бенчмарків на різних версіях коду порівнянні.
+
+Запуск:
+    python lab1/loadgen.py --students 100000 [--seed 42] [--compact] [--dump DIR]
+"""
+
+import argparse
+import datetime
+import random
+import time
+
+from main import (
+    ATTENDANCE_STATUSES,
+    Assignment,
+    Course,
+    EducationSystem,
+    Grade,
+    Instructor,
+    PrefixedAllocator,
+    SilentSink,
+    Student,
+)
+
+MAJORS = ("КН", "ІПЗ", "Математика", "Фізика", "Економіка", "Філологія")
+DEPARTMENTS = ("КН", "Математики", "Фізики", "Економіки")
+# Ймовірності статусів відвідуваності (у порядку ATTENDANCE_STATUSES)
+ATTENDANCE_WEIGHTS = (0.8, 0.1, 0.07, 0.03)
+# Фіксована "поточна" дата, відносно якої розкладаються дедлайни та заняття
+BASE_DATE = datetime.datetime(2025, 9, 1, 9, 0)
+BATCH_SIZE = 10_000
+
+
+class LoadConfig:
+    """Параметри генерації; None означає значення, пропорційне кількості студентів."""
+
+    def __init__(
+        self,
+        students=10_000,
+        instructors=None,
+        courses=None,
+        assignments_per_course=5,
+        courses_per_student=4,
+        grade_fill=0.8,
+        attendance_days=10,
+        deadline_spread_days=60,
+        seed=42,
+    ):
+        self.students = students
+        self.courses = courses or max(1, students // 50)
+        self.instructors = instructors or max(1, self.courses // 3)
+        self.assignments_per_course = assignments_per_course
+        self.courses_per_student = min(courses_per_student, self.courses)
+        self.grade_fill = grade_fill  # частка (студент, завдання), що мають оцінку
+        self.attendance_days = attendance_days
+        self.deadline_spread_days = deadline_spread_days
+        self.seed = seed
+
+    def as_dict(self):
+        return dict(
+            students=self.students,
+            instructors=self.instructors,
+            courses=self.courses,
+            assignments_per_course=self.assignments_per_course,
+            courses_per_student=self.courses_per_student,
+            grade_fill=self.grade_fill,
+            attendance_days=self.attendance_days,
+            deadline_spread_days=self.deadline_spread_days,
+            seed=self.seed,
+        )
+
+
+def _batches(items, size=BATCH_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def generate(config=None, compact=False, sink=None):
+    """
+    Будує систему за конфігурацією через пакетні import_* методи.
+    Повертає EducationSystem (sink за замовчуванням - SilentSink).
+    """
+    config = config or LoadConfig()
+    rng = random.Random(config.seed)
+    ids = PrefixedAllocator()
+    system = EducationSystem(
+        compact=compact, sink=sink or SilentSink(), id_allocator=PrefixedAllocator()
+    )
+
+    instructors = [
+        Instructor(
+            f"Викладач {i}",
+            f"teacher{i}@uni.edu",
+            DEPARTMENTS[i % len(DEPARTMENTS)],
+            "Програмування",
+            entity_id=ids.allocate("instructor"),
+        )
+        for i in range(config.instructors)
+    ]
+    system.import_instructors(instructors)
+
+    students = [
+        Student(
+            f"Студент {i}",
+            f"student{i}@uni.edu",
+            rng.choice(MAJORS),
+            rng.randint(1, 4),
+            entity_id=ids.allocate("student"),
+        )
+        for i in range(config.students)
+    ]
+    for batch in _batches(students):
+        system.import_students(batch)
+
+    expected = config.students * config.courses_per_student // config.courses + 1
+    courses = [
+        Course(
+            f"Курс {i}",
+            "",
+            rng.choice((3, 4, 5)),
+            instructors[i % len(instructors)],
+            max_students=expected * 2,
+            entity_id=ids.allocate("course"),
+        )
+        for i in range(config.courses)
+    ]
+    system.import_courses(courses)
+
+    spread = config.deadline_spread_days
+    assignments = [
+        Assignment(
+            course.id,
+            f"Завдання {j}",
+            "",
+            rng.choice((10, 20, 50, 100)),
+            BASE_DATE + datetime.timedelta(days=rng.uniform(-spread, spread)),
+            entity_id=ids.allocate("assignment"),
+        )
+        for course in courses
+        for j in range(config.assignments_per_course)
+    ]
+    system.import_assignments(assignments)
+
+    course_assignments = {course.id: [] for course in courses}
+    for assignment in assignments:
+        course_assignments[assignment.course_id].append(assignment)
+
+    enrollments = []
+    grades = []
+    graded_at = BASE_DATE - datetime.timedelta(days=1)
+    for student in students:
+        for course in rng.sample(courses, config.courses_per_student):
+            enrollments.append((student.id, course.id))
+            for assignment in course_assignments[course.id]:
+                if rng.random() < config.grade_fill:
+                    grades.append(
+                        Grade.from_values(
+                            student.id,
+                            assignment.id,
+                            rng.randint(0, assignment.max_points),
+                            assignment.max_points,
+                            "",
+                            graded_at,
+                        )
+                    )
+    for batch in _batches(enrollments):
+        system.import_enrollments(batch)
+    for batch in _batches(grades):
+        system.import_grades(batch)
+
+    for course in courses:
+        # Упорядкований список, а не множина: порядок не залежить від PYTHONHASHSEED
+        members = [student.id for student in course.enrolled_students]
+        for day in range(config.attendance_days):
+            statuses = rng.choices(ATTENDANCE_STATUSES, ATTENDANCE_WEIGHTS, k=len(members))
+            course.mark_attendance(
+                (BASE_DATE - datetime.timedelta(days=day)).date(),
+                dict(zip(members, statuses)),
+            )
+    return system
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--students", type=int, default=10_000)
+    parser.add_argument("--instructors", type=int)
+    parser.add_argument("--courses", type=int)
+    parser.add_argument("--assignments", type=int, default=5, help="на курс")
+    parser.add_argument("--per-student", type=int, default=4, help="курсів на студента")
+    parser.add_argument("--grade-fill", type=float, default=0.8)
+    parser.add_argument("--attendance-days", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--compact", action="store_true")
+    parser.add_argument("--dump", metavar="DIR", help="зберегти згенеровані дані (data_io)")
+    parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    args = parser.parse_args()
+
+    config = LoadConfig(
+        students=args.students,
+        instructors=args.instructors,
+        courses=args.courses,
+        assignments_per_course=args.assignments,
+        courses_per_student=args.per_student,
+        grade_fill=args.grade_fill,
+        attendance_days=args.attendance_days,
+        seed=args.seed,
+    )
+    started = time.perf_counter()
+    system = generate(config, compact=args.compact)
+    print(
+        f"Згенеровано за {time.perf_counter() - started:.2f} с: "
+        f"{len(system.instructors)} викладачів, {len(system.students)} студентів, "
+        f"{len(system.courses)} курсів, {len(system.assignments)} завдань, "
+        f"{sum(len(s.grades) for s in system.students.values())} оцінок"
+    )
+    if args.dump:
+        from data_io import dump_system
+
+        print(f"Збережено у {args.dump}: {dump_system(system, args.dump, args.format)}")
@@ -1,13 +1,152 @@
+import bisect
 import datetime
+import itertools
 import uuid
+from array import array
+from collections.abc import MutableMapping
 from datetime import timedelta
 
+from schedule import ScheduleEngine, validate_timetable, week_interval
+
+# Початок відліку для компактного зберігання часу оцінювання (мікросекунди)
+EPOCH = datetime.datetime(1970, 1, 1)
+
+
+class EducationSystemError(Exception):
+    """Помилка операції освітньої системи (піднімається у строгому режимі)."""
+
+
+class UUIDAllocator:
+    """Генератор випадкових UUID; length обрізає рядок (як у попередніх версіях)."""
+
+    def __init__(self, length=None):
+        self.length = length
+
+    def allocate(self, kind):
+        value = str(uuid.uuid4())
+        return value[: self.length] if self.length else value
+
+    def observe(self, kind, entity_id):
+        """Випадкові ID не залежать від уже виданих."""
+
+
+class SequentialAllocator:
+    """Монотонний цілочисельний лічильник, спільний для всіх типів сутностей."""
+
+    def __init__(self, start=1):
+        self._counter = itertools.count(start)
+
+    def allocate(self, kind):
+        return str(next(self._counter))
+
+    def observe(self, kind, entity_id):
+        """Зсуває лічильник за імпортований ID, щоб нові ID з ним не збігалися."""
+        if entity_id.isdigit():
+            current = next(self._counter)
+            self._counter = itertools.count(max(current, int(entity_id) + 1))
+
+
+class PrefixedAllocator:
+    """Окремий лічильник для кожного типу сутностей: S000001, C000001, ..."""
+
+    PREFIXES = {
+        "person": "P",
+        "instructor": "I",
+        "student": "S",
+        "course": "C",
+        "assignment": "A",
+    }
+
+    def __init__(self, width=6):
+        self.width = width
+        self._counters = {kind: itertools.count(1) for kind in self.PREFIXES}
+
+    def allocate(self, kind):
+        return f"{self.PREFIXES[kind]}{next(self._counters[kind]):0{self.width}d}"
+
+    def observe(self, kind, entity_id):
+        """Зсуває лічильник типу за імпортований ID, щоб нові ID з ним не збігалися."""
+        prefix = self.PREFIXES[kind]
+        number = entity_id[len(prefix) :]
+        if entity_id.startswith(prefix) and number.isdigit():
+            current = next(self._counters[kind])
+            self._counters[kind] = itertools.count(max(current, int(number) + 1))
+
+
+# Генератор за замовчуванням, спільний для об'єктів, створених поза EducationSystem
+DEFAULT_ID_ALLOCATOR = PrefixedAllocator()
+
+# Скільки разів EducationSystem повторно генерує ID, що вже зайнятий
+ID_RETRIES = 10
+
+
+class Event:
+    """Подія системи: назва, шаблон повідомлення та структуровані поля."""
+
+    __slots__ = ("name", "template", "fields")
+
+    def __init__(self, name, template, fields):
+        self.name = name
+        self.template = template
+        self.fields = fields
+
+    @property
+    def message(self):
+        """Текст повідомлення (форматується лише на вимогу)."""
+        return self.template.format(**self.fields)
+
+
+class StdoutSink:
+    """Приймач подій, що одразу друкує повідомлення (поведінка за замовчуванням)."""
+
+    enabled = True
+
+    def emit(self, event):
+        print(event.message)
+
+
+class BufferedSink:
+    """Приймач подій, що накопичує їх у пам'яті для подальшого перегляду."""
+
+    enabled = True
+
+    def __init__(self):
+        self.events = []
+
+    def emit(self, event):
+        self.events.append(event)
+
+    def errors(self):
+        """Повертає лише події-помилки."""
+        return [event for event in self.events if event.name == "error"]
+
+    def flush(self):
+        """Друкує накопичені повідомлення та очищує буфер."""
+        for event in self.events:
+            print(event.message)
+        self.events.clear()
+
+
+class SilentSink:
+    """Приймач подій, що їх ігнорує (для масового імпорту даних)."""
+
+    enabled = False
+
+    def emit(self, event):
+        pass
+
+
+STDOUT_SINK = StdoutSink()
+
 
 class Person:
     """Базовий клас для Студента та Викладача."""
 
-    def __init__(self, name, email):
-        self.id = str(uuid.uuid4())[:8]
+    __slots__ = ("id", "name", "email")
+    id_kind = "person"
+
+    def __init__(self, name, email, entity_id=None):
+        self.id = entity_id or DEFAULT_ID_ALLOCATOR.allocate(self.id_kind)
         self.name = name
         self.email = email
 
@@ -15,8 +154,11 @@ class Person:
 class Instructor(Person):
     """Клас для представлення викладача."""
 
-    def __init__(self, name, email, department, specialization):
-        super().__init__(name, email)
+    __slots__ = ("department", "specialization", "courses_taught")
+    id_kind = "instructor"
+
+    def __init__(self, name, email, department, specialization, entity_id=None):
+        super().__init__(name, email, entity_id)
         self.department = department
         self.specialization = specialization
         self.courses_taught = []
@@ -25,73 +167,406 @@ class Instructor(Person):
 class Student(Person):
     """Клас для представлення студента."""
 
-    def __init__(self, name, email, major, year_of_study):
-        super().__init__(name, email)
+    __slots__ = (
+        "major",
+        "year_of_study",
+        "enrolled_courses",
+        "enrolled_course_ids",
+        "grades",
+        "_percentage_sum",
+        "_weighted_sum",
+        "_credits_sum",
+        "_grade_credits",
+        "_sums_stale",
+        "version",
+    )
+    id_kind = "student"
+
+    def __init__(self, name, email, major, year_of_study, entity_id=None):
+        super().__init__(name, email, entity_id)
         self.major = major
         self.year_of_study = year_of_study
         self.enrolled_courses = []
+        self.enrolled_course_ids = set()
         self.grades = {}
-
-    def get_gpa(self):
-        """Розраховує GPA студента на основі оцінок."""
+        # Накопичувальні суми для GPA, щоб не перераховувати всі оцінки щоразу
+        self._percentage_sum = 0.0
+        self._weighted_sum = 0.0
+        self._credits_sum = 0.0
+        self._grade_credits = {}  # {assignment_id: кредити курсу}
+        # Після заміни оцінки суми перераховуються заново: віднімання накопичує
+        # похибку float, і округлений GPA відрізнявся б від повного перерахунку
+        self._sums_stale = False
+        # Лічильник змін: збільшується при кожній зміні оцінок чи зарахувань
+        self.version = 0
+
+    def record_grade(self, grade, credits=1):
+        """
+        Зберігає оцінку та інкрементально оновлює агрегати GPA.
+        Повторна оцінка того ж завдання замінює внесок попередньої.
+        Повертає попередню оцінку або None.
+        """
+        previous = self.grades.get(grade.assignment_id)
+        if previous is not None:
+            self._sums_stale = True
+        elif not self._sums_stale:
+            percentage = grade.get_percentage()
+            self._percentage_sum += percentage
+            self._weighted_sum += percentage * credits
+            self._credits_sum += credits
+        self._grade_credits[grade.assignment_id] = credits
+        self.grades[grade.assignment_id] = grade
+        self.version += 1
+        return previous
+
+    def _refresh_sums(self):
+        """Перераховує суми за всіма оцінками (у тому ж порядку, що й при додаванні)."""
+        version = self.version
+        percentages, credits = [], []
+        for assignment_id, grade in self.grades.items():
+            percentages.append(grade.get_percentage())
+            credits.append(self._grade_credits[assignment_id])
+        # Оцінку змінено під час перерахунку - суми залишаються позначеними як застарілі
+        if version != self.version:
+            return
+        self._percentage_sum = sum(percentages)
+        self._weighted_sum = sum(p * c for p, c in zip(percentages, credits))
+        self._credits_sum = sum(credits)
+        self._sums_stale = False
+
+    def get_gpa(self, weighted=False):
+        """
+        Розраховує GPA студента на основі оцінок.
+        Якщо weighted=True, оцінки зважуються на кредити курсу.
+        """
         if not self.grades:
             return 0.0
-        total_percentage = sum(grade.get_percentage() for grade in self.grades.values())
-        return round((total_percentage / len(self.grades) / 100) * 4, 2)
+        if self._sums_stale:
+            self._refresh_sums()
+        if weighted:
+            if self._credits_sum <= 0:
+                return 0.0
+            return round((self._weighted_sum / self._credits_sum / 100) * 4, 2)
+        return round((self._percentage_sum / len(self.grades) / 100) * 4, 2)
+
+
+class AssignmentStats:
+    """Накопичувальна статистика оцінок (у відсотках) для одного завдання."""
+
+    __slots__ = ("scores", "total", "_min", "_max", "_stale")
+
+    def __init__(self):
+        self.scores = {}  # {student_id: відсоток}
+        self.total = 0.0
+        self._min = None
+        self._max = None
+        self._stale = False
+
+    def add(self, student_id, percentage):
+        """Додає або замінює оцінку студента. Повертає попередній відсоток або None."""
+        previous = self.scores.get(student_id)
+        if previous is not None:
+            self.total -= previous
+            # Мінімум/максимум перераховуються лише якщо замінено крайнє значення
+            if previous == self._min or previous == self._max:
+                self._stale = True
+        self.scores[student_id] = percentage
+        self.total += percentage
+        if not self._stale:
+            self._min = percentage if self._min is None else min(self._min, percentage)
+            self._max = percentage if self._max is None else max(self._max, percentage)
+        return previous
+
+    def summary(self):
+        """Повертає словник із середнім, мінімумом, максимумом та кількістю оцінок."""
+        if not self.scores:
+            return {"mean": 0, "min": 0, "max": 0, "submissions": 0}
+        if self._stale:
+            self._min = min(self.scores.values())
+            self._max = max(self.scores.values())
+            self._stale = False
+        return {
+            "mean": round(self.total / len(self.scores), 2),
+            "min": round(self._min, 2),
+            "max": round(self._max, 2),
+            "submissions": len(self.scores),
+        }
+
+
+# Коди статусів відвідуваності; 0 означає відсутність відмітки
+ATTENDANCE_STATUSES = ("present", "absent", "late", "excused")
+ATTENDANCE_CODES = {status: code for code, status in enumerate(ATTENDANCE_STATUSES, 1)}
+PRESENT = ATTENDANCE_CODES["present"]
+LATE = ATTENDANCE_CODES["late"]
+
+
+class AttendanceMatrix:
+    """
+    Компактний журнал відвідуваності: дати x студенти, статуси як малі цілі (array "b").
+    Для кожного студента ведуться лічильники відмічених та відвіданих занять,
+    тому загальний відсоток відвідуваності доступний за O(1).
+    """
+
+    __slots__ = ("student_ids", "_columns", "_rows", "dates", "_attended", "_marked")
+
+    def __init__(self):
+        self.student_ids = []  # стовпець -> student_id
+        self._columns = {}  # {student_id: стовпець}
+        self._rows = {}  # {порядковий номер дати: array статусів}
+        self.dates = []  # відсортовані порядкові номери дат (для діапазонів)
+        self._attended = array("I")  # на стовпець: присутній або запізнився
+        self._marked = array("I")  # на стовпець: будь-яка відмітка
+
+    def _column(self, student_id):
+        column = self._columns.get(student_id)
+        if column is None:
+            column = self._columns[student_id] = len(self.student_ids)
+            self.student_ids.append(student_id)
+            self._attended.append(0)
+            self._marked.append(0)
+        return column
+
+    def _count(self, column, code, sign):
+        if code:
+            self._marked[column] += sign
+            if code == PRESENT or code == LATE:
+                self._attended[column] += sign
+
+    def mark(self, date, codes):
+        """
+        Записує статуси {student_id: код} за дату, замінюючи попередній запис дня.
+        """
+        ordinal = date.toordinal()
+        row = self._rows.get(ordinal)
+        if row is None:
+            row = self._rows[ordinal] = array("b")
+            bisect.insort(self.dates, ordinal)
+        else:
+            for column, code in enumerate(row):
+                self._count(column, code, -1)
+                row[column] = 0
+
+        for student_id, code in codes.items():
+            column = self._column(student_id)
+            if column >= len(row):
+                row.extend(bytes(len(self.student_ids) - len(row)))
+            row[column] = code
+            self._count(column, code, 1)
+
+    def _date_range(self, start, end):
+        """Повертає порядкові номери дат у діапазоні [start, end] (межі необов'язкові)."""
+        low = 0 if start is None else bisect.bisect_left(self.dates, start.toordinal())
+        high = (
+            len(self.dates)
+            if end is None
+            else bisect.bisect_right(self.dates, end.toordinal())
+        )
+        return self.dates[low:high]
+
+    def student_rate(self, student_id, start=None, end=None):
+        """Частка відвіданих занять студента (0..1) серед відмічених; None без відміток."""
+        column = self._columns.get(student_id)
+        if column is None:
+            return None
+        if start is None and end is None:
+            marked, attended = self._marked[column], self._attended[column]
+        else:
+            marked = attended = 0
+            for ordinal in self._date_range(start, end):
+                row = self._rows[ordinal]
+                code = row[column] if column < len(row) else 0
+                if code:
+                    marked += 1
+                    attended += code == PRESENT or code == LATE
+        return attended / marked if marked else None
+
+    def student_rates(self):
+        """Повертає {student_id: частка відвіданих занять} для всіх студентів."""
+        return {
+            student_id: attended / marked
+            for student_id, attended, marked in zip(
+                self.student_ids, self._attended, self._marked
+            )
+            if marked
+        }
+
+    def date_rates(self, start=None, end=None):
+        """Повертає список (дата, частка присутніх) для дат у діапазоні."""
+        rates = []
+        for ordinal in self._date_range(start, end):
+            row = self._rows[ordinal]
+            # array.count виконується в C, без Python-циклу по студентах
+            marked = len(row) - row.count(0)
+            attended = row.count(PRESENT) + row.count(LATE)
+            rates.append(
+                (datetime.date.fromordinal(ordinal), attended / marked if marked else None)
+            )
+        return rates
+
+    def as_dict(self):
+        """Повертає журнал у вигляді {"YYYY-MM-DD": {student_id: статус}}."""
+        journal = {}
+        for ordinal in self.dates:
+            day = {}
+            for column, code in enumerate(self._rows[ordinal]):
+                if code:
+                    day[self.student_ids[column]] = ATTENDANCE_STATUSES[code - 1]
+            journal[datetime.date.fromordinal(ordinal).strftime("%Y-%m-%d")] = day
+        return journal
 
 
 class Course:
     """Клас для представлення курсу."""
 
-    def __init__(self, title, description, credits, instructor, max_students=30):
-        self.id = str(uuid.uuid4())[:8]
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "credits",
+        "instructor",
+        "max_students",
+        "enrolled_students",
+        "enrolled_ids",
+        "assignments",
+        "schedule",
+        "attendance_matrix",
+        "assignment_stats",
+        "_grade_sum",
+        "_grade_count",
+        "version",
+        "system",
+    )
+
+    def __init__(
+        self, title, description, credits, instructor, max_students=30, entity_id=None
+    ):
+        self.id = entity_id or DEFAULT_ID_ALLOCATOR.allocate("course")
         self.title = title
         self.description = description
         self.credits = credits
         self.instructor = instructor
         self.max_students = max_students
         self.enrolled_students = []
+        self.enrolled_ids = set()  # для перевірки зарахування за O(1)
         self.assignments = []
         self.schedule = []
-        self.attendance = {}  # {date: {student_id: status}}
+        self.attendance_matrix = AttendanceMatrix()
+        # Індекс оцінок зарахованих студентів: {assignment_id: AssignmentStats}
+        self.assignment_stats = {}
+        self._grade_sum = 0.0
+        self._grade_count = 0
+        self.version = 0  # лічильник змін для кешу звітів
+        # EducationSystem, що володіє курсом: її приймач подій і режим strict
+        self.system = None
+
+    def _emit(self, event_name, template, **fields):
+        if self.system is not None:
+            self.system._emit(event_name, template, **fields)
+        elif STDOUT_SINK.enabled:
+            STDOUT_SINK.emit(Event(event_name, template, fields))
+
+    def _fail(self, template, **fields):
+        """Помилка курсу: виняток, якщо система-власник у строгому режимі."""
+        if self.system is not None and self.system.strict:
+            raise EducationSystemError(template.format(**fields))
+        self._emit("error", template, **fields)
 
     def add_schedule(self, day, start_time, end_time, location):
-        """Додає запис у розклад курсу."""
-        self.schedule.append(
-            {
-                "day": day,
-                "start_time": start_time,
-                "end_time": end_time,
-                "location": location,
-            }
-        )
-        print(
-            f"Додано розклад для курсу '{self.title}': {day}, {start_time}-{end_time} в {location}"
+        """
+        Додає запис у розклад курсу. Час розбирається один раз у хвилини від
+        початку тижня (ключ "interval"). Повертає запис або None при помилці.
+        Конфлікти з іншими курсами перевіряє EducationSystem.add_schedule.
+        """
+        try:
+            interval = week_interval(day, start_time, end_time)
+        except ValueError as error:
+            self._fail("Помилка: {error}", error=error)
+            return None
+        session = {
+            "day": day,
+            "start_time": start_time,
+            "end_time": end_time,
+            "location": location,
+            "interval": interval,
+        }
+        self.schedule.append(session)
+        self._emit(
+            "schedule_added",
+            "Додано розклад для курсу '{title}': {day}, {start}-{end} в {location}",
+            title=self.title,
+            day=day,
+            start=start_time,
+            end=end_time,
+            location=location,
         )
+        return session
+
+    @property
+    def attendance(self):
+        """Журнал відвідуваності у форматі {date: {student_id: status}}."""
+        return self.attendance_matrix.as_dict()
 
     def mark_attendance(self, date, attendance_data):
         """Відмічає відвідуваність студентів за певну дату."""
         if not isinstance(date, datetime.date):
-            print("Помилка: дата повинна бути об'єктом datetime.date.")
+            self._fail("Помилка: дата повинна бути об'єктом datetime.date.")
             return
 
-        self.attendance[date.strftime("%Y-%m-%d")] = attendance_data
-        print(
-            f"Записано відвідуваність для курсу '{self.title}' за {date.strftime('%Y-%m-%d')}."
+        codes = {}
+        for student_id, status in attendance_data.items():
+            code = ATTENDANCE_CODES.get(status)
+            if code is None:
+                self._fail(
+                    "Помилка: невідомий статус відвідуваності '{status}'.",
+                    status=status,
+                )
+                return
+            codes[student_id] = code
+
+        self.attendance_matrix.mark(date, codes)
+        self._emit(
+            "attendance_marked",
+            "Записано відвідуваність для курсу '{title}' за {date:%Y-%m-%d}.",
+            title=self.title,
+            date=date,
         )
 
+    def record_grade(self, student_id, assignment_id, percentage):
+        """Оновлює індекс оцінок курсу для однієї (повторної) оцінки."""
+        stats = self.assignment_stats.get(assignment_id)
+        if stats is None:
+            stats = self.assignment_stats[assignment_id] = AssignmentStats()
+        previous = stats.add(student_id, percentage)
+        if previous is None:
+            self._grade_count += 1
+            self._grade_sum += percentage
+        else:
+            self._grade_sum += percentage - previous
+        self.version += 1
+
+    def index_student_grades(self, student):
+        """Додає до індексу оцінки, отримані студентом до зарахування на курс."""
+        for assignment in self.assignments:
+            grade = student.grades.get(assignment.id)
+            if grade is not None:
+                self.record_grade(student.id, assignment.id, grade.get_percentage())
+
+    def get_attendance_rate(self, student_id, start=None, end=None):
+        """Відсоток відвіданих студентом занять (за весь час або за діапазон дат)."""
+        rate = self.attendance_matrix.student_rate(student_id, start, end)
+        return round(rate * 100, 2) if rate is not None else 0
+
+    def get_daily_attendance(self, start=None, end=None):
+        """Повертає список (дата, відсоток присутніх) за діапазон дат."""
+        return [
+            (date, round(rate * 100, 2) if rate is not None else 0)
+            for date, rate in self.attendance_matrix.date_rates(start, end)
+        ]
+
     def get_statistics(self):
         """Отримує та повертає статистику по цьому курсу."""
-        # Збираємо всі оцінки, що стосуються тільки цього курсу
-        course_grades = []
-        course_assignment_ids = {a.id for a in self.assignments}
-
-        for student in self.enrolled_students:
-            for assignment_id, grade in student.grades.items():
-                if assignment_id in course_assignment_ids:
-                    course_grades.append(grade)
-
-        if not course_grades:
+        # Оцінки зараховані до індексу курсу під час виставлення
+        if not self._grade_count:
             return {
                 "course_title": self.title,
                 "instructor": self.instructor.name,
@@ -101,12 +576,11 @@ class Course:
                 "completion_rate": 0,
             }
 
-        total_percentage = sum(grade.get_percentage() for grade in course_grades)
-        average_grade = total_percentage / len(course_grades)
+        average_grade = self._grade_sum / self._grade_count
 
         # Розрахунок рівня виконання
         total_possible_submissions = len(self.enrolled_students) * len(self.assignments)
-        actual_submissions = len(course_grades)
+        actual_submissions = self._grade_count
         completion_rate = (
             (actual_submissions / total_possible_submissions) * 100
             if total_possible_submissions > 0
@@ -122,6 +596,17 @@ class Course:
             "completion_rate": round(completion_rate, 2),
         }
 
+    def get_assignment_breakdown(self):
+        """Повертає статистику (середнє, мінімум, максимум, кількість) по кожному завданню."""
+        breakdown = []
+        for assignment in self.assignments:
+            stats = self.assignment_stats.get(assignment.id)
+            summary = stats.summary() if stats else AssignmentStats().summary()
+            summary["assignment_id"] = assignment.id
+            summary["assignment_title"] = assignment.title
+            breakdown.append(summary)
+        return breakdown
+
     def print_course_schedule(self):
         """Функція для гарного виводу розкладу конкретного курсу."""
 
@@ -140,8 +625,12 @@ class Course:
 class Assignment:
     """Клас для представлення завдання."""
 
-    def __init__(self, course_id, title, description, max_points, due_date):
-        self.id = str(uuid.uuid4())[:8]
+    __slots__ = ("id", "course_id", "title", "description", "max_points", "due_date")
+
+    def __init__(
+        self, course_id, title, description, max_points, due_date, entity_id=None
+    ):
+        self.id = entity_id or DEFAULT_ID_ALLOCATOR.allocate("assignment")
         self.course_id = course_id
         self.title = title
         self.description = description
@@ -152,6 +641,15 @@ class Assignment:
 class Grade:
     """Клас для представлення оцінки."""
 
+    __slots__ = (
+        "student_id",
+        "assignment_id",
+        "points_earned",
+        "max_points",
+        "feedback",
+        "date_graded",
+    )
+
     def __init__(self, student, assignment, points_earned, feedback=""):
         self.student_id = student.id
         self.assignment_id = assignment.id
@@ -160,6 +658,20 @@ class Grade:
         self.feedback = feedback
         self.date_graded = datetime.datetime.now()
 
+    @classmethod
+    def from_values(
+        cls, student_id, assignment_id, points_earned, max_points, feedback, date_graded
+    ):
+        """Створює оцінку з уже збережених значень (без об'єктів студента/завдання)."""
+        grade = cls.__new__(cls)
+        grade.student_id = student_id
+        grade.assignment_id = assignment_id
+        grade.points_earned = float(points_earned)
+        grade.max_points = max_points
+        grade.feedback = feedback
+        grade.date_graded = date_graded
+        return grade
+
     def get_percentage(self):
         """Повертає оцінку у відсотках."""
         return (
@@ -167,67 +679,533 @@ class Grade:
         )
 
 
+class GradeStore:
+    """
+    Компактне колонкове сховище оцінок на масивах array.
+    Кожна оцінка - це рядок: індекс студента, індекс завдання, бали,
+    час оцінювання (мікросекунди від EPOCH). Відгуки зберігаються розріджено.
+    """
+
+    __slots__ = (
+        "student_ids",
+        "assignments",
+        "students",
+        "assignment_indices",
+        "points",
+        "graded_at",
+        "feedback",
+        "_student_index",
+        "_assignment_index",
+        "_student_assignments",
+        "_student_rows",
+    )
+
+    def __init__(self):
+        self.student_ids = []  # індекс -> student_id
+        self.assignments = []  # індекс -> Assignment
+        self.students = array("I")
+        self.assignment_indices = array("I")
+        self.points = array("d")
+        self.graded_at = array("q")
+        self.feedback = {}  # {рядок: відгук}, лише непорожні
+        self._student_index = {}
+        self._assignment_index = {}
+        # Для кожного студента: відсортовані індекси завдань і паралельні рядки,
+        # пошук оцінки студента - bisect без окремого словника на кожну оцінку
+        self._student_assignments = []
+        self._student_rows = []
+
+    def __len__(self):
+        return len(self.points)
+
+    def student_index(self, student_id):
+        """Повертає (за потреби створює) індекс студента у сховищі."""
+        index = self._student_index.get(student_id)
+        if index is None:
+            index = self._student_index[student_id] = len(self.student_ids)
+            self.student_ids.append(student_id)
+            self._student_assignments.append(array("I"))
+            self._student_rows.append(array("I"))
+        return index
+
+    def assignment_index(self, assignment):
+        """Повертає (за потреби створює) індекс завдання у сховищі."""
+        index = self._assignment_index.get(assignment.id)
+        if index is None:
+            index = self._assignment_index[assignment.id] = len(self.assignments)
+            self.assignments.append(assignment)
+        return index
+
+    def put(self, student_index, assignment, points_earned, feedback, date_graded):
+        """Додає оцінку або перезаписує існуючу для пари (студент, завдання)."""
+        assignment_index = self.assignment_index(assignment)
+        timestamp = (date_graded - EPOCH) // timedelta(microseconds=1)
+        owned = self._student_assignments[student_index]
+        position = bisect.bisect_left(owned, assignment_index)
+        if position == len(owned) or owned[position] != assignment_index:
+            row = len(self.points)
+            self.students.append(student_index)
+            self.assignment_indices.append(assignment_index)
+            self.points.append(points_earned)
+            self.graded_at.append(timestamp)
+            owned.insert(position, assignment_index)
+            self._student_rows[student_index].insert(position, row)
+        else:
+            row = self._student_rows[student_index][position]
+            self.points[row] = points_earned
+            self.graded_at[row] = timestamp
+        if feedback:
+            self.feedback[row] = feedback
+        else:
+            self.feedback.pop(row, None)
+
+    def find_row(self, student_index, assignment_id):
+        """Повертає номер рядка оцінки або None."""
+        assignment_index = self._assignment_index.get(assignment_id)
+        if assignment_index is None:
+            return None
+        owned = self._student_assignments[student_index]
+        position = bisect.bisect_left(owned, assignment_index)
+        if position == len(owned) or owned[position] != assignment_index:
+            return None
+        return self._student_rows[student_index][position]
+
+    def rows_for(self, student_index):
+        """Повертає номери рядків усіх оцінок студента."""
+        return self._student_rows[student_index]
+
+    def grade_at(self, row):
+        """Матеріалізує об'єкт Grade з рядка сховища."""
+        assignment = self.assignments[self.assignment_indices[row]]
+        return Grade.from_values(
+            self.student_ids[self.students[row]],
+            assignment.id,
+            self.points[row],
+            assignment.max_points,
+            self.feedback.get(row, ""),
+            EPOCH + timedelta(microseconds=self.graded_at[row]),
+        )
+
+    def view(self, student):
+        """Повертає словникове представлення оцінок студента поверх сховища."""
+        return StudentGradesView(self, self.student_index(student.id))
+
+
+class StudentGradesView(MutableMapping):
+    """
+    Замінник словника Student.grades у компактному режимі:
+    {assignment_id: Grade}, дані читаються та записуються у GradeStore.
+    """
+
+    __slots__ = ("store", "student_index")
+
+    def __init__(self, store, student_index):
+        self.store = store
+        self.student_index = student_index
+
+    def __getitem__(self, assignment_id):
+        row = self.store.find_row(self.student_index, assignment_id)
+        if row is None:
+            raise KeyError(assignment_id)
+        return self.store.grade_at(row)
+
+    def __setitem__(self, assignment_id, grade):
+        index = self.store._assignment_index.get(assignment_id)
+        if index is None:
+            raise KeyError(f"Завдання {assignment_id} не зареєстроване у сховищі")
+        self.store.put(
+            self.student_index,
+            self.store.assignments[index],
+            grade.points_earned,
+            grade.feedback,
+            grade.date_graded,
+        )
+
+    def __delitem__(self, assignment_id):
+        raise TypeError("Видалення оцінок не підтримується компактним сховищем")
+
+    def __iter__(self):
+        store = self.store
+        for row in store.rows_for(self.student_index):
+            yield store.assignments[store.assignment_indices[row]].id
+
+    def __len__(self):
+        return len(self.store.rows_for(self.student_index))
+
+
+class ReportCache:
+    """
+    Кеш звітів, прив'язаних до версії сутності: значення перераховується
+    лише тоді, коли лічильник змін сутності відрізняється від збереженого.
+    """
+
+    def __init__(self):
+        self._entries = {}  # {ключ: (версія, значення)}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, version, compute):
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        value = compute()
+        self._entries[key] = (version, value)
+        return value
+
+    def stats(self):
+        """Лічильники влучань/промахів для моніторингу."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "hit_rate": round(self.hits / lookups * 100, 2) if lookups else 0,
+        }
+
+
 class EducationSystem:
     """Клас для керування всією освітньою системою."""
 
-    def __init__(self):
+    def __init__(self, compact=False, sink=None, strict=False, id_allocator=None):
+        # Приймач подій замість print(); strict=True - помилки як винятки
+        self.sink = sink if sink is not None else STDOUT_SINK
+        self.strict = strict
+        self.id_allocator = id_allocator or DEFAULT_ID_ALLOCATOR
         self.courses = {}
         self.students = {}
         self.instructors = {}
         self.assignments = {}
+        # У компактному режимі оцінки зберігаються в колонковому GradeStore
+        self.grade_store = GradeStore() if compact else None
+        # Відсортований індекс (-GPA, student_id) для запитів "топ-N"
+        self._gpa_index = []
+        self._gpa_keys = {}  # {student_id: поточний ключ у _gpa_index}
+        # Паралельні списки, відсортовані за дедлайном, для пошуку через bisect
+        self._deadline_dates = []
+        self._deadline_ids = []
+        # Індекси розкладу для виявлення конфліктів аудиторій/викладачів/студентів
+        self.timetable = ScheduleEngine()
+        self.report_cache = ReportCache()
+
+    def _index_deadline(self, assignment):
+        position = bisect.bisect_right(self._deadline_dates, assignment.due_date)
+        self._deadline_dates.insert(position, assignment.due_date)
+        self._deadline_ids.insert(position, assignment.id)
+
+    def _emit(self, event_name, template, **fields):
+        """Передає подію приймачу (повідомлення форматується лише за потреби)."""
+        if self.sink.enabled:
+            self.sink.emit(Event(event_name, template, fields))
+
+    def _fail(self, message):
+        """Повідомляє про помилку: виняток у строгому режимі, інакше подія."""
+        if self.strict:
+            raise EducationSystemError(message)
+        # Готовий текст передається полем: фігурні дужки в назвах не є шаблоном
+        self._emit("error", "{message}", message=message)
+
+    def _new_id(self, registry, kind):
+        """Генерує ID, якого ще немає в реєстрі (колізії генерується повторно)."""
+        for _ in range(ID_RETRIES):
+            entity_id = self.id_allocator.allocate(kind)
+            if entity_id not in registry:
+                return entity_id
+        raise EducationSystemError(f"Не вдалося згенерувати унікальний ID для '{kind}'")
+
+    def _check_unique(self, registry, entity, kind):
+        """Не дозволяє імпортованій сутності перезаписати існуючу з тим самим ID."""
+        if entity.id in registry:
+            raise EducationSystemError(
+                f"Дублікат ID '{entity.id}' ({type(entity).__name__})"
+            )
+        self.id_allocator.observe(kind, entity.id)
+
+    def _index_gpa(self, student):
+        """Оновлює позицію студента у відсортованому індексі GPA."""
+        key = (-student.get_gpa(), student.id)
+        old_key = self._gpa_keys.get(student.id)
+        if old_key == key:
+            return
+        if old_key is not None:
+            del self._gpa_index[bisect.bisect_left(self._gpa_index, old_key)]
+        bisect.insort(self._gpa_index, key)
+        self._gpa_keys[student.id] = key
+
+    def _reindex_gpa(self, students):
+        """Оновлює індекс GPA для групи студентів (повна перебудова, якщо їх багато)."""
+        if len(students) * 8 < len(self._gpa_keys):
+            for student in students:
+                self._index_gpa(student)
+            return
+        self._gpa_keys = {
+            student.id: (-student.get_gpa(), student.id)
+            for student in self.students.values()
+        }
+        self._gpa_index = sorted(self._gpa_keys.values())
+
+    def _apply_grade(self, student, assignment, grade):
+        """Записує оцінку студенту та в індекс курсу (без оновлення індексу GPA)."""
+        course = self.courses[assignment.course_id]
+        student.record_grade(grade, course.credits)
+        if student.id in course.enrolled_ids:
+            course.record_grade(student.id, assignment.id, grade.get_percentage())
+
+    def _record_grade(self, student, assignment, grade):
+        """Записує оцінку студенту та оновлює всі похідні агрегати."""
+        self._apply_grade(student, assignment, grade)
+        self._index_gpa(student)
+
+    def get_course_report(self, course_id):
+        """
+        Статистика курсу разом із розбивкою по завданнях. Результат кешується
+        до наступної зміни курсу; повернений словник не слід змінювати.
+        """
+        course = self.courses.get(course_id)
+        if not course:
+            self._fail("Помилка: Курс не знайдений.")
+            return None
+
+        def compute():
+            report = course.get_statistics()
+            report["assignments"] = course.get_assignment_breakdown()
+            return report
+
+        return self.report_cache.get(("course", course_id), course.version, compute)
+
+    def get_student_report(self, student_id):
+        """Звіт студента (GPA, кількість оцінок і курсів), кешований за версією."""
+        student = self.students.get(student_id)
+        if not student:
+            self._fail("Помилка: Студент не знайдений.")
+            return None
+
+        def compute():
+            return {
+                "student_name": student.name,
+                "major": student.major,
+                "year_of_study": student.year_of_study,
+                "gpa": student.get_gpa(),
+                "weighted_gpa": student.get_gpa(weighted=True),
+                "grades_count": len(student.grades),
+                "courses_count": len(student.enrolled_courses),
+            }
+
+        return self.report_cache.get(("student", student_id), student.version, compute)
+
+    def generate_reports(self):
+        """Звіти для всіх курсів і студентів; перераховуються лише змінені."""
+        return {
+            "courses": {
+                course_id: self.get_course_report(course_id) for course_id in self.courses
+            },
+            "students": {
+                student_id: self.get_student_report(student_id)
+                for student_id in self.students
+            },
+        }
+
+    def cache_stats(self):
+        """Лічильники влучань/промахів кешу звітів."""
+        return self.report_cache.stats()
+
+    def to_frames(self):
+        """
+        Колонкове представлення системи для векторизованої аналітики
+        (див. analytics.py, потребує numpy та pandas).
+        """
+        from analytics import to_frames
+
+        return to_frames(self)
+
+    def get_top_students(self, n=10):
+        """Повертає n студентів з найвищим GPA без сортування всіх студентів."""
+        return [self.students[student_id] for _, student_id in self._gpa_index[:n]]
 
     def add_instructor(self, name, email, department, specialization):
-        instructor = Instructor(name, email, department, specialization)
+        instructor = Instructor(
+            name,
+            email,
+            department,
+            specialization,
+            entity_id=self._new_id(self.instructors, "instructor"),
+        )
         self.instructors[instructor.id] = instructor
-        print(f"Викладач {name} доданий до системи з ID: {instructor.id}")
+        self._emit(
+            "instructor_added",
+            "Викладач {name} доданий до системи з ID: {id}",
+            name=name,
+            id=instructor.id,
+        )
         return instructor
 
     def add_student(self, name, email, major, year_of_study):
-        student = Student(name, email, major, year_of_study)
+        student = Student(
+            name,
+            email,
+            major,
+            year_of_study,
+            entity_id=self._new_id(self.students, "student"),
+        )
+        if self.grade_store is not None:
+            student.grades = self.grade_store.view(student)
         self.students[student.id] = student
-        print(f"Студент {name} зареєстрований у системі з ID: {student.id}")
+        self._index_gpa(student)
+        self._emit(
+            "student_added",
+            "Студент {name} зареєстрований у системі з ID: {id}",
+            name=name,
+            id=student.id,
+        )
         return student
 
     def create_course(
         self, title, description, credits, instructor_id, max_students=30
     ):
         if instructor_id not in self.instructors:
-            print("Помилка: Викладач не знайдений")
+            self._fail("Помилка: Викладач не знайдений")
             return None
         instructor = self.instructors[instructor_id]
-        course = Course(title, description, credits, instructor, max_students)
+        course = Course(
+            title,
+            description,
+            credits,
+            instructor,
+            max_students,
+            entity_id=self._new_id(self.courses, "course"),
+        )
+        course.system = self
         self.courses[course.id] = course
         instructor.courses_taught.append(course)
-        print(f"Курс '{title}' створено з ID: {course.id}")
+        self._emit(
+            "course_created", "Курс '{title}' створено з ID: {id}", title=title, id=course.id
+        )
         return course
 
     def enroll_student(self, student_id, course_id):
         student = self.students.get(student_id)
         course = self.courses.get(course_id)
         if not student or not course:
-            print("Помилка: Студент або курс не знайдені.")
+            self._fail("Помилка: Студент або курс не знайдені.")
             return False
         if len(course.enrolled_students) >= course.max_students:
-            print("Помилка: Курс переповнений.")
+            self._fail("Помилка: Курс переповнений.")
             return False
-        if student in course.enrolled_students:
-            print("Помилка: Студент вже зарахований на цей курс.")
+        if student.id in course.enrolled_ids:
+            self._fail("Помилка: Студент вже зарахований на цей курс.")
+            return False
+        if self.timetable.find_enrollment_conflicts(student, course):
+            self._fail("Помилка: Розклад курсу перетинається з розкладом студента.")
             return False
 
+        self._enroll(student, course)
+        self._emit(
+            "student_enrolled",
+            "Студент {student} зарахований на курс '{course}'",
+            student=student.name,
+            course=course.title,
+        )
+        return True
+
+    def _enroll(self, student, course):
+        """Зараховує студента без перевірок (виконуються викликачем)."""
         course.enrolled_students.append(student)
+        course.enrolled_ids.add(student.id)
         student.enrolled_courses.append(course)
-        print(f"Студент {student.name} зарахований на курс '{course.title}'")
+        student.enrolled_course_ids.add(course.id)
+        course.version += 1
+        student.version += 1
+        course.index_student_grades(student)
+        self.timetable.enroll(student, course)
+
+    def bulk_enroll(self, course_id, student_ids):
+        """
+        Зараховує групу студентів на курс за один прохід.
+        Повертає звіт {student_id: статус}, де статус - одне з
+        "enrolled", "not_found", "already_enrolled", "course_full",
+        "schedule_conflict". Повторний ID у списку зберігає статус першого.
+        """
+        course = self.courses.get(course_id)
+        if not course:
+            self._fail("Помилка: Курс не знайдений.")
+            return None
+
+        report = {}
+        free_seats = course.max_students - len(course.enrolled_students)
+        for student_id in student_ids:
+            if student_id in report:
+                continue
+            student = self.students.get(student_id)
+            if not student:
+                report[student_id] = "not_found"
+            elif student_id in course.enrolled_ids:
+                report[student_id] = "already_enrolled"
+            elif free_seats <= 0:
+                report[student_id] = "course_full"
+            elif self.timetable.find_enrollment_conflicts(student, course):
+                report[student_id] = "schedule_conflict"
+            else:
+                self._enroll(student, course)
+                free_seats -= 1
+                report[student_id] = "enrolled"
+        return report
+
+    def add_schedule(self, course_id, day, start_time, end_time, location):
+        """
+        Додає заняття курсу з перевіркою конфліктів аудиторії, викладача
+        та зарахованих студентів (O(log n) на кожен індекс).
+        """
+        course = self.courses.get(course_id)
+        if not course:
+            self._fail("Помилка: Курс не знайдений.")
+            return False
+        try:
+            start, end = week_interval(day, start_time, end_time)
+        except ValueError as error:
+            self._fail(f"Помилка: {error}")
+            return False
+        conflicts = self.timetable.find_conflicts(course, start, end, location)
+        if conflicts:
+            conflict = conflicts[0]
+            other = self.courses.get(conflict["conflicting_course_id"])
+            self._fail(
+                f"Помилка: Конфлікт розкладу ({conflict['type']} {conflict['resource']}) "
+                f"з курсом '{other.title if other else conflict['conflicting_course_id']}' "
+                f"о {conflict['interval']}."
+            )
+            return False
+        course.add_schedule(day, start_time, end_time, location)
+        self.timetable.add_session(course, start, end, location)
         return True
 
+    def validate_timetable(self):
+        """Повна перевірка розкладу всіх курсів. Повертає список конфліктів."""
+        return validate_timetable(self.courses.values())
+
     def create_assignment(self, course_id, title, description, max_points, due_date):
         if course_id not in self.courses:
-            print("Помилка: Курс не знайдений.")
+            self._fail("Помилка: Курс не знайдений.")
             return None
-        assignment = Assignment(course_id, title, description, max_points, due_date)
+        assignment = Assignment(
+            course_id,
+            title,
+            description,
+            max_points,
+            due_date,
+            entity_id=self._new_id(self.assignments, "assignment"),
+        )
         self.assignments[assignment.id] = assignment
+        if self.grade_store is not None:
+            self.grade_store.assignment_index(assignment)
         self.courses[course_id].assignments.append(assignment)
-        print(
-            f"Завдання '{title}' створено для курсу '{self.courses[course_id].title}'"
+        self.courses[course_id].version += 1
+        self._index_deadline(assignment)
+        self._emit(
+            "assignment_created",
+            "Завдання '{title}' створено для курсу '{course}'",
+            title=title,
+            course=self.courses[course_id].title,
         )
         return assignment
 
@@ -235,34 +1213,140 @@ class EducationSystem:
         student = self.students.get(student_id)
         assignment = self.assignments.get(assignment_id)
         if not student or not assignment:
-            print("Помилка: Студент або завдання не знайдені.")
+            self._fail("Помилка: Студент або завдання не знайдені.")
             return False
 
         grade = Grade(student, assignment, points_earned, feedback)
-        student.grades[assignment.id] = grade
-        print(
-            f"Оцінка {points_earned}/{assignment.max_points} виставлена студенту {student.name}"
+        self._record_grade(student, assignment, grade)
+        self._emit(
+            "grade_submitted",
+            "Оцінка {points}/{max_points} виставлена студенту {student}",
+            points=points_earned,
+            max_points=assignment.max_points,
+            student=student.name,
         )
         return True
 
-    def check_deadline_reminders(self, days_in_advance=7):
+    def submit_grades(self, grades):
+        """
+        Пакетно виставляє оцінки (student_id, assignment_id, points_earned, feedback).
+        Індекс GPA оновлюється один раз на пакет. Помилкові записи не переривають
+        пакет, а позначаються як False. Повертає список результатів.
+        """
+        results = []
+        touched = {}
+        for student_id, assignment_id, points_earned, feedback in grades:
+            student = self.students.get(student_id)
+            assignment = self.assignments.get(assignment_id)
+            if not student or not assignment:
+                self._emit("error", "Помилка: Студент або завдання не знайдені.")
+                results.append(False)
+                continue
+            grade = Grade(student, assignment, points_earned, feedback)
+            self._apply_grade(student, assignment, grade)
+            touched[student_id] = student
+            results.append(True)
+        self._reindex_gpa(list(touched.values()))
+        self._emit(
+            "grades_submitted", "Виставлено оцінок пакетом: {count}", count=sum(results)
+        )
+        return results
+
+    # --- Пакетне завантаження готових об'єктів (без перевірок і повідомлень) ---
+
+    def import_instructors(self, instructors):
+        """Реєструє пакет викладачів."""
+        for instructor in instructors:
+            self._check_unique(self.instructors, instructor, "instructor")
+            self.instructors[instructor.id] = instructor
+
+    def import_students(self, students):
+        """Реєструє пакет студентів."""
+        batch = []
+        for student in students:
+            self._check_unique(self.students, student, "student")
+            if self.grade_store is not None:
+                student.grades = self.grade_store.view(student)
+            self.students[student.id] = student
+            batch.append(student)
+        self._reindex_gpa(batch)
+
+    def import_courses(self, courses):
+        """Реєструє пакет курсів (викладачі мають бути вже завантажені)."""
+        for course in courses:
+            self._check_unique(self.courses, course, "course")
+            course.system = self
+            self.courses[course.id] = course
+            course.instructor.courses_taught.append(course)
+
+    def import_enrollments(self, enrollments):
+        """Зараховує пари (student_id, course_id) без перевірки місткості."""
+        for student_id, course_id in enrollments:
+            student = self.students[student_id]
+            course = self.courses[course_id]
+            if student_id not in course.enrolled_ids:
+                self._enroll(student, course)
+
+    def import_assignments(self, assignments):
+        """Реєструє пакет завдань; індекс дедлайнів перебудовується один раз."""
+        batch = []
+        for assignment in assignments:
+            self._check_unique(self.assignments, assignment, "assignment")
+            self.assignments[assignment.id] = assignment
+            self.courses[assignment.course_id].assignments.append(assignment)
+            self.courses[assignment.course_id].version += 1
+            if self.grade_store is not None:
+                self.grade_store.assignment_index(assignment)
+            batch.append((assignment.due_date, assignment.id))
+        if len(batch) < 8:
+            for due_date, assignment_id in batch:
+                self._index_deadline(self.assignments[assignment_id])
+            return
+        merged = list(zip(self._deadline_dates, self._deadline_ids))
+        merged.extend(batch)
+        merged.sort()
+        self._deadline_dates = [due_date for due_date, _ in merged]
+        self._deadline_ids = [assignment_id for _, assignment_id in merged]
+
+    def import_grades(self, grades):
+        """
+        Записує пакет оцінок; індекс GPA оновлюється один раз
+        для кожного зачепленого студента.
+        """
+        touched = {}
+        for grade in grades:
+            student = self.students[grade.student_id]
+            self._apply_grade(student, self.assignments[grade.assignment_id], grade)
+            touched[student.id] = student
+        self._reindex_gpa(list(touched.values()))
+
+    def iter_upcoming_deadlines(self, days_in_advance=7, now=None):
+        """
+        Генератор завдань, дедлайн яких настає протягом days_in_advance днів.
+        Використовує відсортований індекс дедлайнів: O(log n + k).
+        """
+        if now is None:
+            now = datetime.datetime.now()
+        start = bisect.bisect_right(self._deadline_dates, now)
+        end = bisect.bisect_right(
+            self._deadline_dates, now + timedelta(days=days_in_advance)
+        )
+        for position in range(start, end):
+            assignment = self.assignments[self._deadline_ids[position]]
+            course = self.courses[assignment.course_id]
+            yield {
+                "assignment_id": assignment.id,
+                "assignment_title": assignment.title,
+                "course_id": course.id,
+                "course_title": course.title,
+                "due_date": assignment.due_date,
+                "students_enrolled": len(course.enrolled_students),
+            }
+
+    def check_deadline_reminders(self, days_in_advance=7, now=None):
         """Знаходить завдання з наближенням дедлайну."""
         print(f"\n Перевірка дедлайнів (за {days_in_advance} днів)...")
-        upcoming_deadlines = []
-        now = datetime.datetime.now()
-
-        for assignment in self.assignments.values():
-            time_left = assignment.due_date - now
-            if timedelta(days=0) < time_left <= timedelta(days=days_in_advance):
-                course = self.courses[assignment.course_id]
-                upcoming_deadlines.append(
-                    {
-                        "assignment_title": assignment.title,
-                        "course_title": course.title,
-                        "due_date": assignment.due_date.strftime("%Y-%m-%d %H:%M"),
-                        "students_enrolled": len(course.enrolled_students),
-                    }
-                )
+        upcoming_deadlines = list(self.iter_upcoming_deadlines(days_in_advance, now))
 
         if not upcoming_deadlines:
             print("Немає завдань з наближенням дедлайну.")
@@ -273,7 +1357,8 @@ class EducationSystem:
                 f"  - Курс: '{deadline['course_title']}', Завдання: '{deadline['assignment_title']}'"
             )
             print(
-                f"    Дедлайн: {deadline['due_date']}. Зараховано студентів: {deadline['students_enrolled']}"
+                f"    Дедлайн: {deadline['due_date'].strftime('%Y-%m-%d %H:%M')}. "
+                f"Зараховано студентів: {deadline['students_enrolled']}"
             )
 
 
@@ -313,9 +1398,12 @@ if __name__ == "__main__":
 
     # 3. Додавання розкладу до курсу (НОВА ФУНКЦІЯ)
     print("\n--- 3. Створення розкладу занять ---")
-    cs_course.add_schedule("Понеділок", "10:00", "11:30", "Аудиторія 101")
-    cs_course.add_schedule("Середа", "10:00", "11:30", "Аудиторія 101")
-    math_course.add_schedule("Вівторок", "14:00", "15:30", "Аудиторія 205")
+    system.add_schedule(cs_course.id, "Понеділок", "10:00", "11:30", "Аудиторія 101")
+    system.add_schedule(cs_course.id, "Середа", "10:00", "11:30", "Аудиторія 101")
+    system.add_schedule(math_course.id, "Вівторок", "14:00", "15:30", "Аудиторія 205")
+    # Аудиторія вже зайнята - заняття буде відхилено
+    system.add_schedule(math_course.id, "Понеділок", "11:00", "12:30", "Аудиторія 101")
+    print(f"Конфліктів у розкладі: {len(system.validate_timetable())}")
 
     # 4. Створення завдань та виставлення оцінок
     print("\n--- 4. Створення завдань та оцінювання ---")
@@ -350,6 +1438,7 @@ if __name__ == "__main__":
     # Виведемо журнал для перевірки
     print("Записи відвідуваності для курсу 'Основи програмування':")
     print(cs_course.attendance)
+    print(f"Відвідуваність Анни Іваненко: {cs_course.get_attendance_rate(stu1.id)}%")
 
     # 6. Автоматичні нагадування про дедлайни
     print("\n--- 6. Нагадування про дедлайни ---")
@@ -359,6 +1448,9 @@ if __name__ == "__main__":
     print("\n--- 7. Перегляд інформації ---")
     print(f"GPA Анни Іваненко: {stu1.get_gpa()}")
     print(f"GPA Миколи Сидорова: {stu2.get_gpa()}")
+    print(f"Зважений GPA Анни Іваненко: {stu1.get_gpa(weighted=True)}")
+    top = system.get_top_students(n=1)
+    print(f"Найвищий GPA: {top[0].name} ({top[0].get_gpa()})")
 
     cs_course = system.courses.get(cs_course.id)
 
@@ -369,6 +1461,15 @@ if __name__ == "__main__":
         print(f"Статистика для курсу '{stats['course_title']}':")
         print(f"  - Середня оцінка: {stats['average_grade']}%")
         print(f"  - Рівень виконання завдань: {stats['completion_rate']}%")
+        for item in cs_course.get_assignment_breakdown():
+            print(
+                f"  - {item['assignment_title']}: середнє {item['mean']}%, "
+                f"мін {item['min']}%, макс {item['max']}%, здано {item['submissions']}"
+            )
+        # Повторні звіти без змін беруться з кешу
+        system.generate_reports()
+        system.generate_reports()
+        print(f"  - Кеш звітів: {system.cache_stats()}")
 
     # 9. Вивід розкладу
     print("\n--- 9. Вивід розкладу ---")
@@ -0,0 +1,206 @@
+"""
+Рушій розкладу: розбір часу занять та виявлення конфліктів.
+
+Заняття перетворюються на напівінтервали [початок, кінець) у хвилинах від початку
+тижня. Для кожної аудиторії, викладача та студента ведеться відсортований список
+неперетинних інтервалів, тож перевірка нового заняття коштує O(log n).
+"""
+
+import bisect
+
+MINUTES_PER_DAY = 24 * 60
+
+DAYS = {
+    name: index
+    for index, names in enumerate(
+        (
+            ("понеділок", "monday", "mon", "пн"),
+            ("вівторок", "tuesday", "tue", "вт"),
+            ("середа", "wednesday", "wed", "ср"),
+            ("четвер", "thursday", "thu", "чт"),
+            ("п'ятниця", "friday", "fri", "пт"),
+            ("субота", "saturday", "sat", "сб"),
+            ("неділя", "sunday", "sun", "нд"),
+        )
+    )
+    for name in names
+}
+
+
+def parse_day(day):
+    """Повертає номер дня тижня (0 - понеділок) за назвою."""
+    index = DAYS.get(day.strip().lower().replace("’", "'"))
+    if index is None:
+        raise ValueError(f"Невідомий день тижня: '{day}'")
+    return index
+
+
+def parse_time(text):
+    """Перетворює "ГГ:ХХ" на кількість хвилин від початку доби."""
+    hours, _, minutes = text.strip().partition(":")
+    hours, minutes = int(hours), int(minutes or 0)
+    if not (0 <= hours <= 24 and 0 <= minutes < 60) or hours * 60 + minutes > 1440:
+        raise ValueError(f"Некоректний час: '{text}'")
+    return hours * 60 + minutes
+
+
+def week_interval(day, start_time, end_time):
+    """Повертає (початок, кінець) заняття в хвилинах від початку тижня."""
+    offset = parse_day(day) * MINUTES_PER_DAY
+    start, end = parse_time(start_time), parse_time(end_time)
+    if end <= start:
+        raise ValueError(f"Заняття має закінчуватися після початку: {start_time}-{end_time}")
+    return offset + start, offset + end
+
+
+def format_interval(start, end):
+    """Форматує інтервал тижня для повідомлень: "Понеділок 10:00-11:30"."""
+    names = ("Понеділок", "Вівторок", "Середа", "Четвер", "П'ятниця", "Субота", "Неділя")
+    day, start = divmod(start, MINUTES_PER_DAY)
+    end -= day * MINUTES_PER_DAY
+    return f"{names[day]} {start // 60:02d}:{start % 60:02d}-{end // 60:02d}:{end % 60:02d}"
+
+
+class IntervalIndex:
+    """Відсортовані неперетинні інтервали [start, end) з власниками."""
+
+    __slots__ = ("starts", "ends", "owners")
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.owners = []
+
+    def __len__(self):
+        return len(self.starts)
+
+    def find_conflict(self, start, end):
+        """Повертає власника інтервалу, що перетинається з [start, end), або None."""
+        position = bisect.bisect_right(self.starts, start)
+        # Інтервали не перетинаються, тож достатньо перевірити двох сусідів
+        if position and self.ends[position - 1] > start:
+            return self.owners[position - 1]
+        if position < len(self.starts) and self.starts[position] < end:
+            return self.owners[position]
+        return None
+
+    def insert(self, start, end, owner):
+        """Додає інтервал (викликач має переконатися у відсутності конфлікту)."""
+        position = bisect.bisect_right(self.starts, start)
+        self.starts.insert(position, start)
+        self.ends.insert(position, end)
+        self.owners.insert(position, owner)
+
+
+class ScheduleEngine:
+    """Індекси розкладу по аудиторіях, викладачах та студентах."""
+
+    def __init__(self):
+        self.rooms = {}  # {location: IntervalIndex}
+        self.instructors = {}  # {instructor_id: IntervalIndex}
+        self.students = {}  # {student_id: IntervalIndex}
+
+    @staticmethod
+    def _index(indexes, key):
+        index = indexes.get(key)
+        if index is None:
+            index = indexes[key] = IntervalIndex()
+        return index
+
+    def find_conflicts(self, course, start, end, location):
+        """
+        Перевіряє нове заняття курсу. Повертає список конфліктів
+        {"type", "resource", "course_id", "conflicting_course_id", "interval"}.
+        """
+        conflicts = []
+        checks = [
+            ("room", self.rooms, location),
+            ("instructor", self.instructors, course.instructor.id),
+        ]
+        checks.extend(
+            ("student", self.students, student.id) for student in course.enrolled_students
+        )
+        for kind, indexes, key in checks:
+            index = indexes.get(key)
+            other = index.find_conflict(start, end) if index else None
+            if other is not None:
+                conflicts.append(
+                    {
+                        "type": kind,
+                        "resource": key,
+                        "course_id": course.id,
+                        "conflicting_course_id": other,
+                        "interval": format_interval(start, end),
+                    }
+                )
+        return conflicts
+
+    def add_session(self, course, start, end, location):
+        """Реєструє заняття курсу в усіх індексах."""
+        self._index(self.rooms, location).insert(start, end, course.id)
+        self._index(self.instructors, course.instructor.id).insert(start, end, course.id)
+        for student in course.enrolled_students:
+            self._index(self.students, student.id).insert(start, end, course.id)
+
+    def find_enrollment_conflicts(self, student, course):
+        """Перевіряє, чи не перетинаються заняття курсу з розкладом студента."""
+        index = self.students.get(student.id)
+        conflicts = []
+        for session in course.schedule:
+            start, end = session["interval"]
+            other = index.find_conflict(start, end) if index else None
+            if other is None:
+                continue
+            conflicts.append(
+                {
+                    "type": "student",
+                    "resource": student.id,
+                    "course_id": course.id,
+                    "conflicting_course_id": other,
+                    "interval": format_interval(start, end),
+                }
+            )
+        return conflicts
+
+    def enroll(self, student, course):
+        """Додає заняття курсу до розкладу студента, пропускаючи ті, що конфліктують."""
+        index = self._index(self.students, student.id)
+        for session in course.schedule:
+            start, end = session["interval"]
+            if index.find_conflict(start, end) is None:
+                index.insert(start, end, course.id)
+
+
+def validate_timetable(courses):
+    """
+    Повна перевірка розкладу всіх курсів (зокрема доданого напряму через
+    Course.add_schedule) проходом із сортуванням: O(n log n + кількість конфліктів).
+    Повертає список конфліктів у форматі ScheduleEngine.find_conflicts.
+    """
+    resources = {}
+    for course in courses:
+        for session in course.schedule:
+            start, end = session["interval"]
+            keys = [("room", session["location"]), ("instructor", course.instructor.id)]
+            keys.extend(("student", student.id) for student in course.enrolled_students)
+            for key in keys:
+                resources.setdefault(key, []).append((start, end, course.id))
+
+    conflicts = []
+    for (kind, resource), intervals in resources.items():
+        intervals.sort()
+        active = []  # інтервали, що ще не закінчилися на момент поточного початку
+        for start, end, course_id in intervals:
+            active = [item for item in active if item[1] > start]
+            for _, _, other in active:
+                conflicts.append(
+                    {
+                        "type": kind,
+                        "resource": resource,
+                        "course_id": course_id,
+                        "conflicting_course_id": other,
+                        "interval": format_interval(start, end),
+                    }
+                )
+            active.append((start, end, course_id))
+    return conflicts
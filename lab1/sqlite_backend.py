@@ -0,0 +1,543 @@
+"""
+Реалізація EducationSystem поверх локального файлу SQLite (stdlib sqlite3).
+
+Стан зберігається між запусками, а GPA, статистика курсів та нагадування
+про дедлайни обчислюються агрегатними SQL-запитами по індексованих таблицях.
+Операції можна групувати в одну транзакцію через `with system.transaction():`.
+
+Підтримується лише частина API EducationSystem:
+add_instructor, add_student, create_course, enroll_student, bulk_enroll,
+create_assignment, submit_grade(s), get_gpa, get_top_students,
+get_statistics, get_assignment_breakdown та нагадування про дедлайни.
+Розклад і відвідуваність (add_schedule, mark_attendance) у базі не
+зберігаються, а реєстрів students/courses та методів import_* немає -
+замість них є get_student/get_course. Для цих можливостей потрібен EducationSystem.
+"""
+
+import contextlib
+import datetime
+import heapq
+import sqlite3
+
+from main import (
+    STDOUT_SINK,
+    Assignment,
+    EducationSystemError,
+    Event,
+    Instructor,
+    UUIDAllocator,
+)
+
+# Фіксований формат часу, щоб рядки в SQLite коректно порівнювалися
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS instructors (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    department TEXT,
+    specialization TEXT
+);
+CREATE TABLE IF NOT EXISTS students (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    major TEXT,
+    year_of_study INTEGER
+);
+CREATE TABLE IF NOT EXISTS courses (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT,
+    credits REAL NOT NULL,
+    instructor_id TEXT NOT NULL REFERENCES instructors(id),
+    max_students INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS enrollments (
+    course_id TEXT NOT NULL REFERENCES courses(id),
+    student_id TEXT NOT NULL REFERENCES students(id),
+    PRIMARY KEY (course_id, student_id)
+);
+CREATE INDEX IF NOT EXISTS enrollments_student ON enrollments(student_id);
+CREATE TABLE IF NOT EXISTS assignments (
+    id TEXT PRIMARY KEY,
+    course_id TEXT NOT NULL REFERENCES courses(id),
+    title TEXT NOT NULL,
+    description TEXT,
+    max_points REAL NOT NULL,
+    due_date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS assignments_course ON assignments(course_id);
+CREATE INDEX IF NOT EXISTS assignments_due_date ON assignments(due_date);
+CREATE TABLE IF NOT EXISTS grades (
+    student_id TEXT NOT NULL REFERENCES students(id),
+    assignment_id TEXT NOT NULL REFERENCES assignments(id),
+    points_earned REAL NOT NULL,
+    max_points REAL NOT NULL,
+    feedback TEXT NOT NULL DEFAULT '',
+    date_graded TEXT NOT NULL,
+    PRIMARY KEY (student_id, assignment_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS grades_assignment ON grades(assignment_id);
+"""
+
+# Відсоток оцінки з тим самим захистом від max_points = 0, що й Grade.get_percentage;
+# для відсутньої оцінки (LEFT JOIN) дає NULL, який агрегати ігнорують
+PERCENTAGE = (
+    "CASE WHEN g.max_points > 0 THEN g.points_earned * 100.0 / g.max_points "
+    "WHEN g.max_points <= 0 THEN 0 END"
+)
+
+
+class SQLStudent:
+    """Студент, дані та GPA якого читаються з бази."""
+
+    __slots__ = ("system", "id", "name", "email", "major", "year_of_study")
+
+    def __init__(self, system, row):
+        self.system = system
+        self.id, self.name, self.email, self.major, self.year_of_study = row
+
+    def get_gpa(self, weighted=False):
+        return self.system.get_gpa(self.id, weighted)
+
+
+class SQLCourse:
+    """Курс, статистика якого обчислюється SQL-агрегатами."""
+
+    __slots__ = ("system", "id", "title", "credits", "max_students")
+
+    def __init__(self, system, row):
+        self.system = system
+        self.id, self.title, self.credits, self.max_students = row
+
+    def get_statistics(self):
+        return self.system.get_statistics(self.id)
+
+    def get_assignment_breakdown(self):
+        return self.system.get_assignment_breakdown(self.id)
+
+
+class SQLiteEducationSystem:
+    """EducationSystem у SQLite (підтримувана частина API - див. опис модуля)."""
+
+    def __init__(self, path=":memory:", sink=None, strict=False, id_allocator=None):
+        self.sink = sink if sink is not None else STDOUT_SINK
+        self.strict = strict
+        # Повні UUID: лічильники почалися б з нуля після перезапуску над тим самим файлом
+        self.id_allocator = id_allocator or UUIDAllocator()
+        # Автокомміт; транзакції відкриваються явно в transaction().
+        # З'єднання можна передати іншому потоку (GradeIngestor застосовує пакети
+        # у своєму), але одночасно ним має користуватися лише один потік
+        self.connection = sqlite3.connect(
+            path, isolation_level=None, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.executescript(SCHEMA)
+        self._transaction_depth = 0
+
+    def close(self):
+        self.connection.close()
+
+    def _emit(self, event_name, template, **fields):
+        if self.sink.enabled:
+            self.sink.emit(Event(event_name, template, fields))
+
+    def _fail(self, message):
+        if self.strict:
+            raise EducationSystemError(message)
+        # Готовий текст передається полем: фігурні дужки в назвах не є шаблоном
+        self._emit("error", "{message}", message=message)
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Об'єднує всі вкладені операції в одну транзакцію SQLite."""
+        if self._transaction_depth:
+            self._transaction_depth += 1
+            try:
+                yield
+            finally:
+                self._transaction_depth -= 1
+            return
+
+        self.connection.execute("BEGIN IMMEDIATE")
+        self._transaction_depth = 1
+        try:
+            yield
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        else:
+            self.connection.execute("COMMIT")
+        finally:
+            self._transaction_depth = 0
+
+    def _scalar(self, query, params=()):
+        return self.connection.execute(query, params).fetchone()[0]
+
+    # --- Реєстрація ---
+
+    def add_instructor(self, name, email, department, specialization):
+        instructor = Instructor(
+            name, email, department, specialization, entity_id=self.id_allocator.allocate("instructor")
+        )
+        self.connection.execute(
+            "INSERT INTO instructors VALUES (?, ?, ?, ?, ?)",
+            (instructor.id, name, email, department, specialization),
+        )
+        self._emit(
+            "instructor_added",
+            "Викладач {name} доданий до системи з ID: {id}",
+            name=name,
+            id=instructor.id,
+        )
+        return instructor
+
+    def add_student(self, name, email, major, year_of_study):
+        row = (self.id_allocator.allocate("student"), name, email, major, year_of_study)
+        self.connection.execute("INSERT INTO students VALUES (?, ?, ?, ?, ?)", row)
+        self._emit(
+            "student_added",
+            "Студент {name} зареєстрований у системі з ID: {id}",
+            name=name,
+            id=row[0],
+        )
+        return SQLStudent(self, row)
+
+    def get_student(self, student_id):
+        row = self.connection.execute(
+            "SELECT id, name, email, major, year_of_study FROM students WHERE id = ?",
+            (student_id,),
+        ).fetchone()
+        return SQLStudent(self, row) if row else None
+
+    def create_course(
+        self, title, description, credits, instructor_id, max_students=30
+    ):
+        if not self._scalar(
+            "SELECT COUNT(*) FROM instructors WHERE id = ?", (instructor_id,)
+        ):
+            self._fail("Помилка: Викладач не знайдений")
+            return None
+        course_id = self.id_allocator.allocate("course")
+        self.connection.execute(
+            "INSERT INTO courses VALUES (?, ?, ?, ?, ?, ?)",
+            (course_id, title, description, credits, instructor_id, max_students),
+        )
+        self._emit(
+            "course_created", "Курс '{title}' створено з ID: {id}", title=title, id=course_id
+        )
+        return SQLCourse(self, (course_id, title, credits, max_students))
+
+    def get_course(self, course_id):
+        row = self.connection.execute(
+            "SELECT id, title, credits, max_students FROM courses WHERE id = ?",
+            (course_id,),
+        ).fetchone()
+        return SQLCourse(self, row) if row else None
+
+    # --- Зарахування ---
+
+    def enroll_student(self, student_id, course_id):
+        with self.transaction():
+            student = self.get_student(student_id)
+            course = self.get_course(course_id)
+            if not student or not course:
+                self._fail("Помилка: Студент або курс не знайдені.")
+                return False
+            enrolled = self._scalar(
+                "SELECT COUNT(*) FROM enrollments WHERE course_id = ?", (course_id,)
+            )
+            if enrolled >= course.max_students:
+                self._fail("Помилка: Курс переповнений.")
+                return False
+            inserted = self.connection.execute(
+                "INSERT OR IGNORE INTO enrollments VALUES (?, ?)", (course_id, student_id)
+            ).rowcount
+            if not inserted:
+                self._fail("Помилка: Студент вже зарахований на цей курс.")
+                return False
+        self._emit(
+            "student_enrolled",
+            "Студент {student} зарахований на курс '{course}'",
+            student=student.name,
+            course=course.title,
+        )
+        return True
+
+    def bulk_enroll(self, course_id, student_ids):
+        """Як EducationSystem.bulk_enroll, але в одній транзакції."""
+        with self.transaction():
+            course = self.get_course(course_id)
+            if not course:
+                self._fail("Помилка: Курс не знайдений.")
+                return None
+            free_seats = course.max_students - self._scalar(
+                "SELECT COUNT(*) FROM enrollments WHERE course_id = ?", (course_id,)
+            )
+            report = {}
+            for student_id in student_ids:
+                if student_id in report:
+                    continue
+                if not self._scalar(
+                    "SELECT COUNT(*) FROM students WHERE id = ?", (student_id,)
+                ):
+                    report[student_id] = "not_found"
+                elif free_seats <= 0:
+                    report[student_id] = (
+                        "already_enrolled"
+                        if self._is_enrolled(student_id, course_id)
+                        else "course_full"
+                    )
+                elif self.connection.execute(
+                    "INSERT OR IGNORE INTO enrollments VALUES (?, ?)",
+                    (course_id, student_id),
+                ).rowcount:
+                    free_seats -= 1
+                    report[student_id] = "enrolled"
+                else:
+                    report[student_id] = "already_enrolled"
+        return report
+
+    def _is_enrolled(self, student_id, course_id):
+        return bool(
+            self._scalar(
+                "SELECT COUNT(*) FROM enrollments WHERE course_id = ? AND student_id = ?",
+                (course_id, student_id),
+            )
+        )
+
+    # --- Завдання та оцінки ---
+
+    def create_assignment(self, course_id, title, description, max_points, due_date):
+        course = self.get_course(course_id)
+        if not course:
+            self._fail("Помилка: Курс не знайдений.")
+            return None
+        assignment = Assignment(
+            course_id,
+            title,
+            description,
+            max_points,
+            due_date,
+            entity_id=self.id_allocator.allocate("assignment"),
+        )
+        self.connection.execute(
+            "INSERT INTO assignments VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                assignment.id,
+                course_id,
+                title,
+                description,
+                max_points,
+                due_date.strftime(TIME_FORMAT),
+            ),
+        )
+        self._emit(
+            "assignment_created",
+            "Завдання '{title}' створено для курсу '{course}'",
+            title=title,
+            course=course.title,
+        )
+        return assignment
+
+    def submit_grade(self, student_id, assignment_id, points_earned, feedback=""):
+        row = self.connection.execute(
+            "SELECT s.name, a.max_points FROM students s, assignments a "
+            "WHERE s.id = ? AND a.id = ?",
+            (student_id, assignment_id),
+        ).fetchone()
+        if not row:
+            self._fail("Помилка: Студент або завдання не знайдені.")
+            return False
+        with self.transaction():
+            self._write_grades([(student_id, assignment_id, points_earned, feedback)])
+        self._emit(
+            "grade_submitted",
+            "Оцінка {points}/{max_points} виставлена студенту {student}",
+            points=points_earned,
+            max_points=row[1],
+            student=row[0],
+        )
+        return True
+
+    def submit_grades(self, grades):
+        """
+        Пакетно записує оцінки (student_id, assignment_id, points, feedback)
+        одним executemany в одній транзакції. Повторна оцінка перезаписує попередню.
+        Як і EducationSystem.submit_grades, записи з невідомим студентом або
+        завданням пропускаються з позначкою False. Повертає список результатів.
+        """
+        results = []
+        valid = []
+        known = {}  # {(таблиця, id): існує} - кожен id перевіряється один раз на пакет
+        with self.transaction():
+            for row in grades:
+                student_id, assignment_id = row[0], row[1]
+                if self._exists(known, "students", student_id) and self._exists(
+                    known, "assignments", assignment_id
+                ):
+                    valid.append(row)
+                    results.append(True)
+                else:
+                    self._emit("error", "Помилка: Студент або завдання не знайдені.")
+                    results.append(False)
+            self._write_grades(valid)
+        self._emit(
+            "grades_submitted", "Виставлено оцінок пакетом: {count}", count=len(valid)
+        )
+        return results
+
+    def _exists(self, known, table, entity_id):
+        key = (table, entity_id)
+        if key not in known:
+            known[key] = bool(
+                self._scalar(f"SELECT COUNT(*) FROM {table} WHERE id = ?", (entity_id,))
+            )
+        return known[key]
+
+    def _write_grades(self, grades):
+        """Записує перевірені оцінки (викликається всередині транзакції)."""
+        now = datetime.datetime.now().strftime(TIME_FORMAT)
+        self.connection.executemany(
+            "INSERT INTO grades "
+            "SELECT ?1, a.id, ?3, a.max_points, ?4, ?5 FROM assignments a WHERE a.id = ?2 "
+            "ON CONFLICT (student_id, assignment_id) DO UPDATE SET "
+            "points_earned = excluded.points_earned, max_points = excluded.max_points, "
+            "feedback = excluded.feedback, date_graded = excluded.date_graded",
+            (
+                (student_id, assignment_id, float(points), feedback or "", now)
+                for student_id, assignment_id, points, feedback in grades
+            ),
+        )
+
+    # --- Агрегати ---
+
+    def get_gpa(self, student_id, weighted=False):
+        """GPA студента, обчислений у SQL (з тим самим округленням, що й Student)."""
+        if weighted:
+            query = (
+                f"SELECT SUM(({PERCENTAGE}) * c.credits) / SUM(c.credits) FROM grades g "
+                "JOIN assignments a ON a.id = g.assignment_id "
+                "JOIN courses c ON c.id = a.course_id WHERE g.student_id = ?"
+            )
+        else:
+            query = f"SELECT AVG({PERCENTAGE}) FROM grades g WHERE g.student_id = ?"
+        average = self._scalar(query, (student_id,))
+        return round((average / 100) * 4, 2) if average else 0.0
+
+    def get_top_students(self, n=10):
+        """
+        Повертає n студентів з найвищим GPA. Середні рахує SQLite, а округлення
+        виконує round() Python, як у get_gpa: ROUND() SQLite округлює половинки
+        від нуля (3.125 -> 3.13 проти 3.12), і порядок розходився б з GPA.
+        """
+        rows = self.connection.execute(
+            "SELECT s.id, s.name, s.email, s.major, s.year_of_study, "
+            f"AVG({PERCENTAGE}) FROM students s "
+            "LEFT JOIN grades g ON g.student_id = s.id GROUP BY s.id"
+        ).fetchall()
+        top = heapq.nsmallest(
+            n,
+            rows,
+            key=lambda row: (-(round((row[5] / 100) * 4, 2) if row[5] else 0.0), row[0]),
+        )
+        return [SQLStudent(self, row[:5]) for row in top]
+
+    def get_statistics(self, course_id):
+        """Статистика курсу у форматі Course.get_statistics (None, якщо курсу немає)."""
+        row = self.connection.execute(
+            "SELECT c.title, i.name, "
+            "(SELECT COUNT(*) FROM enrollments e WHERE e.course_id = c.id), "
+            "(SELECT COUNT(*) FROM assignments a WHERE a.course_id = c.id) "
+            "FROM courses c JOIN instructors i ON i.id = c.instructor_id WHERE c.id = ?",
+            (course_id,),
+        ).fetchone()
+        if row is None:
+            self._fail("Помилка: Курс не знайдений.")
+            return None
+        title, instructor, enrolled, assignments = row
+        # Враховуються лише оцінки зарахованих студентів, як і в Course
+        average, submissions = self.connection.execute(
+            f"SELECT AVG({PERCENTAGE}), COUNT(*) FROM grades g "
+            "JOIN assignments a ON a.id = g.assignment_id "
+            "JOIN enrollments e ON e.course_id = a.course_id AND e.student_id = g.student_id "
+            "WHERE a.course_id = ?",
+            (course_id,),
+        ).fetchone()
+        possible = enrolled * assignments
+        return {
+            "course_title": title,
+            "instructor": instructor,
+            "enrolled_students": enrolled,
+            "assignments_count": assignments,
+            "average_grade": round(average, 2) if submissions else 0,
+            "completion_rate": (
+                round(submissions / possible * 100, 2) if submissions and possible else 0
+            ),
+        }
+
+    def get_assignment_breakdown(self, course_id):
+        """Статистика по кожному завданню у форматі Course.get_assignment_breakdown."""
+        if self.get_course(course_id) is None:
+            self._fail("Помилка: Курс не знайдений.")
+            return None
+        rows = self.connection.execute(
+            f"SELECT a.id, a.title, AVG({PERCENTAGE}), MIN({PERCENTAGE}), "
+            f"MAX({PERCENTAGE}), COUNT(g.student_id) FROM assignments a "
+            "LEFT JOIN enrollments e ON e.course_id = a.course_id "
+            "LEFT JOIN grades g ON g.assignment_id = a.id AND g.student_id = e.student_id "
+            "WHERE a.course_id = ? GROUP BY a.id ORDER BY a.rowid",
+            (course_id,),
+        ).fetchall()
+        return [
+            {
+                "mean": round(mean, 2) if count else 0,
+                "min": round(low, 2) if count else 0,
+                "max": round(high, 2) if count else 0,
+                "submissions": count,
+                "assignment_id": assignment_id,
+                "assignment_title": title,
+            }
+            for assignment_id, title, mean, low, high, count in rows
+        ]
+
+    def iter_upcoming_deadlines(self, days_in_advance=7, now=None):
+        """Генератор найближчих дедлайнів (діапазонний запит по індексу due_date)."""
+        if now is None:
+            now = datetime.datetime.now()
+        until = now + datetime.timedelta(days=days_in_advance)
+        cursor = self.connection.execute(
+            "SELECT a.id, a.title, c.id, c.title, a.due_date, "
+            "(SELECT COUNT(*) FROM enrollments e WHERE e.course_id = c.id) "
+            "FROM assignments a JOIN courses c ON c.id = a.course_id "
+            "WHERE a.due_date > ? AND a.due_date <= ? ORDER BY a.due_date",
+            (now.strftime(TIME_FORMAT), until.strftime(TIME_FORMAT)),
+        )
+        for assignment_id, title, course_id, course_title, due, enrolled in cursor:
+            yield {
+                "assignment_id": assignment_id,
+                "assignment_title": title,
+                "course_id": course_id,
+                "course_title": course_title,
+                "due_date": datetime.datetime.strptime(due, TIME_FORMAT),
+                "students_enrolled": enrolled,
+            }
+
+    def check_deadline_reminders(self, days_in_advance=7, now=None):
+        """Друкує завдання з наближенням дедлайну."""
+        print(f"\n Перевірка дедлайнів (за {days_in_advance} днів)...")
+        upcoming_deadlines = list(self.iter_upcoming_deadlines(days_in_advance, now))
+        if not upcoming_deadlines:
+            print("Немає завдань з наближенням дедлайну.")
+            return
+        for deadline in upcoming_deadlines:
+            print(
+                f"  - Курс: '{deadline['course_title']}', Завдання: '{deadline['assignment_title']}'"
+            )
+            print(
+                f"    Дедлайн: {deadline['due_date'].strftime('%Y-%m-%d %H:%M')}. "
+                f"Зараховано студентів: {deadline['students_enrolled']}"
+            )
@@ -0,0 +1,326 @@
+"""
+Аналіз даних StudentsPerformance без залежності від GUI.
+
+Середній бал - це сума трьох цілих балів 0-100, поділена на 3, тож він
+набуває лише 301 значення. ScoreSketch при завантаженні рахує для кожної
+групи кількість студентів з кожною сумою балів; усі графіки (середні,
+гістограма, квартилі та вуса boxplot) для будь-якого діапазону та групування
+будуються з цих лічильників без звернення до рядків таблиці, причому точно.
+Ескізи окремих файлів додаються один до одного, тож набір CSV будь-якого
+розміру аналізується без завантаження всіх рядків у пам'ять.
+"""
+
+import collections
+import math
+import threading
+
+import numpy as np
+import pandas as pd
+from matplotlib import cbook
+
+SCORE_COLUMNS = ["math score", "reading score", "writing score"]
+GROUP_COLUMNS = ["gender", "parental level of education", "race/ethnicity", "lunch"]
+# Колонка групування за файлом-джерелом (школа, рік) при завантаженні набору CSV
+SOURCE_COLUMN = "source"
+MAX_TOTAL = 3 * 100
+TOTAL_BINS = MAX_TOTAL + 1
+# Значення середнього балу для кожної можливої суми балів
+AVERAGES = np.arange(TOTAL_BINS) / 3
+HISTOGRAM_BINS = 20
+# Скільки результатів аналізу (група, діапазон) зберігати для кожного файлу
+CACHE_SIZE = 64
+BOXPLOT_WHIS = 1.5
+
+
+class Cancelled(Exception):
+    """Операцію скасовано новішим запитом користувача."""
+
+
+def check_cancelled(cancelled):
+    if cancelled is not None and cancelled.is_set():
+        raise Cancelled()
+
+
+def total_bounds(min_score, max_score):
+    """
+    Переводить діапазон середнього балу в діапазон сум [low, high] (включно).
+    Невеликий допуск прибирає похибку округлення значень повзунків.
+    """
+    low = max(0, math.ceil(min_score * 3 - 1e-9))
+    high = min(MAX_TOTAL, math.floor(max_score * 3 + 1e-9))
+    return low, high
+
+
+class AnalysisCache:
+    """Потокобезпечний LRU-кеш результатів аналізу."""
+
+    def __init__(self, maxsize=CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key, result):
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class ScoreSketch:
+    """
+    Лічильники {колонка: {група: масив TOTAL_BINS}} кількості студентів
+    з кожною сумою балів. Частини даних додаються по черзі (add_frame),
+    ескізи різних файлів об'єднуються додаванням (merge).
+    """
+
+    def __init__(self, group_columns=GROUP_COLUMNS):
+        self.group_columns = list(group_columns)
+        self.groups = {column: {} for column in self.group_columns}
+        self.overall = np.zeros(TOTAL_BINS, dtype=np.int64)
+        self.cache = AnalysisCache()
+
+    def __len__(self):
+        return int(self.overall.sum())
+
+    def __getstate__(self):
+        # Кеш (з блокуванням) не серіалізується: процес-отримувач (spawn) створює свій
+        state = self.__dict__.copy()
+        del state["cache"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.cache = AnalysisCache()
+
+    def _add_counts(self, column, label, counts):
+        table = self.groups.setdefault(column, {})
+        existing = table.get(label)
+        table[label] = counts if existing is None else existing + counts
+
+    def add_frame(self, df):
+        """Додає рядки таблиці з колонкою "total score" (сума трьох балів)."""
+        totals = df["total score"].to_numpy().astype(np.intp)
+        if len(totals) and (totals.min() < 0 or totals.max() > MAX_TOTAL):
+            raise ValueError("Бали мають бути в межах 0-100.")
+        self.overall += np.bincount(totals, minlength=TOTAL_BINS)
+        for column in self.group_columns:
+            if column not in df:
+                continue
+            values = df[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                codes, names = values.cat.codes.to_numpy(), values.cat.categories
+            else:
+                codes, names = pd.factorize(values)
+            valid = codes >= 0
+            counts = np.bincount(
+                codes[valid].astype(np.intp) * TOTAL_BINS + totals[valid],
+                minlength=len(names) * TOTAL_BINS,
+            ).reshape(len(names), TOTAL_BINS)
+            for label, row in zip(names, counts):
+                if row.any():
+                    self._add_counts(column, label, row)
+        self.cache.clear()
+
+    def merge(self, other):
+        """Додає лічильники іншого ескізу (наприклад, іншого файлу)."""
+        self.overall += other.overall
+        for column, table in other.groups.items():
+            if column not in self.group_columns:
+                self.group_columns.append(column)
+            for label, counts in table.items():
+                self._add_counts(column, label, counts.copy())
+        self.cache.clear()
+        return self
+
+    def add_source(self, label, other):
+        """Додає ескіз одного файлу, записуючи його лічильники як групу label."""
+        self.merge(other)
+        if SOURCE_COLUMN not in self.group_columns:
+            self.group_columns.append(SOURCE_COLUMN)
+        self._add_counts(SOURCE_COLUMN, label, other.overall.copy())
+        return self
+
+    def range_counts(self, column, low, high):
+        """Назви груп (відсортовані) та матриця лічильників сум low..high."""
+        table = self.groups[column]
+        labels = sorted(table, key=str)
+        if not labels:
+            return labels, np.zeros((0, high - low + 1), dtype=np.int64)
+        return labels, np.array([table[label][low : high + 1] for label in labels])
+
+
+def _lerp(a, b, t):
+    """Лінійна інтерполяція в тій самій формі, що й у np.percentile."""
+    diff = b - a
+    return b - diff * (1 - t) if t >= 0.5 else a + diff * t
+
+
+def sketch_box_stats(values, counts, label):
+    """
+    Статистика boxplot (як matplotlib.cbook.boxplot_stats) за відсортованими
+    значеннями та їх кількістю. Викиди повертаються без повторів.
+    """
+    present = counts > 0
+    values, counts = values[present], counts[present]
+    n = int(counts.sum())
+    cumulative = np.cumsum(counts)
+
+    def order_statistic(k):
+        return values[np.searchsorted(cumulative, k, side="right")]
+
+    def percentile(q):
+        position = (n - 1) * q
+        lower = math.floor(position)
+        return _lerp(
+            order_statistic(lower), order_statistic(min(lower + 1, n - 1)), position - lower
+        )
+
+    q1, med, q3 = percentile(0.25), percentile(0.5), percentile(0.75)
+    iqr = q3 - q1
+    low_limit, high_limit = q1 - BOXPLOT_WHIS * iqr, q3 + BOXPLOT_WHIS * iqr
+    inside_high = values[values <= high_limit]
+    whishi = q3 if not len(inside_high) or inside_high.max() < q3 else inside_high.max()
+    inside_low = values[values >= low_limit]
+    whislo = q1 if not len(inside_low) or inside_low.min() > q1 else inside_low.min()
+    return {
+        "label": label,
+        "mean": float((values * counts).sum() / n),
+        "iqr": iqr,
+        "cilo": med - 1.57 * iqr / np.sqrt(n),
+        "cihi": med + 1.57 * iqr / np.sqrt(n),
+        "whishi": whishi,
+        "whislo": whislo,
+        "fliers": values[(values < whislo) | (values > whishi)],
+        "q1": q1,
+        "med": med,
+        "q3": q3,
+    }
+
+
+def analyze(sketch, group_by_col, min_score, max_score, cancelled=None):
+    """
+    Готує дані для графіків за ескізом для діапазону середнього балу.
+    Повертає None, якщо за критеріями нікого не знайдено.
+    Результати кешуються за (колонка, межі сум балів).
+    """
+    low, high = total_bounds(min_score, max_score)
+    if low > high or not sketch.overall[low : high + 1].any():
+        return None
+    key = (group_by_col, low, high)
+    result = sketch.cache.get(key)
+    if result is not None:
+        return result
+    check_cancelled(cancelled)
+
+    values = AVERAGES[low : high + 1]
+    labels, matrix = sketch.range_counts(group_by_col, low, high)
+    group_totals = matrix.sum(axis=1)
+    present = np.flatnonzero(group_totals)
+    labels = [labels[i] for i in present]
+    matrix, group_totals = matrix[present], group_totals[present]
+    means = (matrix * values).sum(axis=1) / group_totals
+
+    overall = sketch.overall[low : high + 1]
+    nonzero = overall > 0
+    hist_counts, hist_edges = np.histogram(
+        values[nonzero], bins=HISTOGRAM_BINS, weights=overall[nonzero]
+    )
+    result = {
+        "group_by": group_by_col,
+        "labels": labels,
+        # Статистика boxplot (квартилі, вуса, викиди) для Axes.bxp
+        "box_stats": [
+            sketch_box_stats(values, row, label) for label, row in zip(labels, matrix)
+        ],
+        "counts": pd.Series(group_totals, index=labels),
+        "mean_scores": pd.Series(means, index=labels).sort_values(),
+        "hist_counts": hist_counts.astype(np.int64),
+        "hist_edges": hist_edges,
+        "total": int(overall.sum()),
+    }
+    sketch.cache.put(key, result)
+    return result
+
+
+def analyze_rows(df, group_by_col, min_score, max_score):
+    """Той самий аналіз безпосередньо за рядками таблиці (еталон для verify_sketch)."""
+    low, high = total_bounds(min_score, max_score)
+    totals = df["total score"].to_numpy()
+    filtered = df[(totals >= low) & (totals <= high)]
+    if filtered.empty:
+        return None
+    scores = filtered["total score"].to_numpy() / 3
+    groups = pd.Series(scores).groupby(
+        filtered[group_by_col].astype(str).to_numpy(), sort=True
+    )
+    labels = list(groups.groups)
+    hist_counts, hist_edges = np.histogram(scores, bins=HISTOGRAM_BINS)
+    return {
+        "labels": labels,
+        "box_stats": cbook.boxplot_stats(
+            [groups.get_group(label).to_numpy() for label in labels], labels=labels
+        ),
+        "counts": groups.size(),
+        "mean_scores": groups.mean(),
+        "hist_counts": hist_counts,
+        "hist_edges": hist_edges,
+        "total": len(filtered),
+    }
+
+
+def verify_sketch(df, sketch, ranges, group_columns=None, tolerance=1e-9):
+    """
+    Порівнює аналіз за ескізом з аналізом за рядками для кожної колонки та
+    діапазону. Повертає список розбіжностей (порожній - ескіз точний).
+    """
+    mismatches = []
+    for column in group_columns or sketch.group_columns:
+        for min_score, max_score in ranges:
+            where = f"{column} {min_score:g}-{max_score:g}"
+            expected = analyze_rows(df, column, min_score, max_score)
+            actual = analyze(sketch, column, min_score, max_score)
+            if expected is None or actual is None:
+                if (expected is None) != (actual is None):
+                    mismatches.append(f"{where}: порожній результат лише з одного боку")
+                continue
+            if [str(label) for label in actual["labels"]] != expected["labels"]:
+                mismatches.append(f"{where}: різні групи")
+                continue
+            if actual["total"] != expected["total"]:
+                mismatches.append(f"{where}: загальна кількість")
+            if not np.array_equal(actual["hist_counts"], expected["hist_counts"]):
+                mismatches.append(f"{where}: гістограма")
+            if np.abs(actual["hist_edges"] - expected["hist_edges"]).max() > tolerance:
+                mismatches.append(f"{where}: межі гістограми")
+            if not np.array_equal(actual["counts"].to_numpy(), expected["counts"].to_numpy()):
+                mismatches.append(f"{where}: кількості в групах")
+            means = actual["mean_scores"].rename(index=str).sort_index().to_numpy()
+            if np.abs(means - expected["mean_scores"].to_numpy()).max() > tolerance:
+                mismatches.append(f"{where}: середні")
+            for mine, reference in zip(actual["box_stats"], expected["box_stats"]):
+                for field in ("q1", "med", "q3", "whislo", "whishi", "mean"):
+                    if abs(mine[field] - reference[field]) > tolerance:
+                        mismatches.append(f"{where}: {mine['label']} {field}")
+                fliers = np.unique(reference["fliers"])
+                if len(fliers) != len(mine["fliers"]) or (
+                    len(fliers) and np.abs(fliers - mine["fliers"]).max() > tolerance
+                ):
+                    mismatches.append(f"{where}: {mine['label']} викиди")
+    return mismatches
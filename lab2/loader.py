@@ -0,0 +1,229 @@
+"""
+Потокове завантаження StudentsPerformance.csv з компактними типами даних.
+
+CSV читається частинами: демографічні колонки - category, бали - uint8,
+сума та середній бал рахуються векторно для кожної частини, і кожна частина
+одразу додається до ескізу ScoreSketch (якщо його передано). За явним
+запитом (cache=".feather" або ".parquet", потрібен pyarrow) розібрана таблиця
+кешується поруч із CSV, тож повторне завантаження того самого файлу майже
+миттєве. За замовчуванням поруч із даними користувача нічого не пишеться.
+
+Набір файлів (тека, glob-шаблон або список) обробляється поза пам'яттю:
+sketch_files читає кожен файл частинами, додає їх до ескізу файлу й одразу
+відкидає рядки, а ескізи файлів зливаються з групуванням "source".
+"""
+
+import glob
+import os
+
+import numpy as np
+import pandas as pd
+
+from analysis import GROUP_COLUMNS, SCORE_COLUMNS, ScoreSketch, check_cancelled
+
+try:
+    import pyarrow  # noqa: F401 - потрібен pandas для Feather/Parquet
+except ImportError:
+    pyarrow = None
+
+CATEGORY_COLUMNS = [
+    "gender",
+    "race/ethnicity",
+    "parental level of education",
+    "lunch",
+    "test preparation course",
+]
+DTYPES = {
+    **{column: "category" for column in CATEGORY_COLUMNS},
+    **{column: "uint8" for column in SCORE_COLUMNS},
+}
+CHUNK_SIZE = 500_000
+# Формати кешу за розширенням файлу
+CACHE_FORMATS = {".feather": "feather", ".parquet": "parquet"}
+# Колонки, які має містити кеш; кеш старішого формату перебудовується з CSV
+CACHE_COLUMNS = list(DTYPES) + ["total score", "average score"]
+
+
+def cache_path(csv_path, extension=".feather"):
+    return csv_path + extension
+
+
+def _read_cache(csv_path, extension):
+    """
+    Повертає таблицю з кешу, якщо він існує, не старший за CSV і має всі
+    колонки CACHE_COLUMNS (інакше None - кеш буде перезаписано).
+    """
+    path = cache_path(csv_path, extension)
+    if pyarrow is None or not os.path.exists(path):
+        return None
+    if os.path.getmtime(path) < os.path.getmtime(csv_path):
+        return None
+    try:
+        if CACHE_FORMATS[extension] == "feather":
+            df = pd.read_feather(path)
+        else:
+            df = pd.read_parquet(path)
+    except Exception:
+        # Пошкоджений кеш просто перебудовується з CSV
+        return None
+    if any(column not in df.columns for column in CACHE_COLUMNS):
+        return None
+    return df
+
+
+def _write_cache(df, csv_path, extension):
+    if pyarrow is None:
+        return
+    path = cache_path(csv_path, extension)
+    try:
+        if CACHE_FORMATS[extension] == "feather":
+            df.to_feather(path)
+        else:
+            df.to_parquet(path, index=False)
+    except OSError:
+        # Каталог лише для читання: працюємо без кешу
+        pass
+
+
+def _combine(chunks):
+    """Об'єднує частини, зводячи категорії кожної колонки до спільного набору."""
+    if not chunks:
+        columns = {column: pd.Series(dtype=dtype) for column, dtype in DTYPES.items()}
+        columns["total score"] = pd.Series(dtype=np.uint16)
+        columns["average score"] = pd.Series(dtype=np.float32)
+        return pd.DataFrame(columns)
+    combined = {}
+    for column in chunks[0].columns:
+        values = [chunk[column] for chunk in chunks]
+        if isinstance(values[0].dtype, pd.CategoricalDtype):
+            combined[column] = pd.Series(
+                pd.api.types.union_categoricals([v.array for v in values])
+            )
+        else:
+            combined[column] = pd.Series(np.concatenate([v.to_numpy() for v in values]))
+    return pd.DataFrame(combined)
+
+
+def iter_chunks(path, progress=None, cancelled=None, chunksize=CHUNK_SIZE):
+    """
+    Читає CSV частинами по chunksize рядків і додає до кожної суму та
+    середній бал. progress(частка від 0 до 1) викликається після кожної частини.
+    """
+    total = os.path.getsize(path) or 1
+    with open(path, "rb") as file:
+        reader = pd.read_csv(file, chunksize=chunksize, dtype=DTYPES)
+        for chunk in reader:
+            check_cancelled(cancelled)
+            # Сума трьох uint8 не вміщується в uint8, тому рахуємо в uint16
+            total_score = chunk[SCORE_COLUMNS].to_numpy(np.uint16).sum(axis=1)
+            chunk["total score"] = total_score.astype(np.uint16)
+            chunk["average score"] = (total_score / 3).astype(np.float32)
+            yield chunk
+            if progress is not None:
+                progress(min(file.tell() / total, 1.0))
+
+
+def load_scores(
+    path,
+    progress=None,
+    cancelled=None,
+    chunksize=CHUNK_SIZE,
+    cache=None,
+    sketch=None,
+):
+    """
+    Читає CSV частинами та розраховує суму й середній бал для кожного студента.
+    progress(частка від 0 до 1) викликається після кожної частини.
+    cache - розширення файлу кешу (".feather", ".parquet") або None (без кешу).
+    sketch - ScoreSketch, до якого додаються всі прочитані рядки.
+    """
+    if cache:
+        df = _read_cache(path, cache)
+        if df is not None:
+            if sketch is not None:
+                sketch.add_frame(df)
+            if progress is not None:
+                progress(1.0)
+            return df
+
+    chunks = []
+    for chunk in iter_chunks(path, progress, cancelled, chunksize):
+        if sketch is not None:
+            sketch.add_frame(chunk)
+        chunks.append(chunk)
+    df = _combine(chunks)
+    if cache:
+        _write_cache(df, path, cache)
+    return df
+
+
+def expand_sources(sources):
+    """
+    Перетворює теку, glob-шаблон, шлях до файлу або їх список на
+    відсортований список CSV-файлів. FileNotFoundError, якщо файлів немає.
+    """
+    if isinstance(sources, str):
+        sources = [sources]
+    paths = []
+    for source in sources:
+        if os.path.isdir(source):
+            paths.extend(sorted(glob.glob(os.path.join(source, "*.csv"))))
+        elif os.path.exists(source):
+            paths.append(source)
+        else:
+            paths.extend(sorted(glob.glob(source)))
+    if not paths:
+        raise FileNotFoundError(f"Не знайдено CSV-файлів: {', '.join(sources)}")
+    return paths
+
+
+def source_labels(paths):
+    """Назви джерел: шлях відносно спільної теки без розширення .csv."""
+    if len(paths) == 1:
+        return [os.path.splitext(os.path.basename(paths[0]))[0]]
+    common = os.path.commonpath([os.path.abspath(path) for path in paths])
+    return [
+        os.path.splitext(os.path.relpath(os.path.abspath(path), common))[0]
+        for path in paths
+    ]
+
+
+def sketch_files(
+    paths,
+    progress=None,
+    cancelled=None,
+    chunksize=CHUNK_SIZE,
+    group_columns=GROUP_COLUMNS,
+    cache=None,
+):
+    """
+    Будує спільний ескіз для набору CSV, не зберігаючи рядків: у пам'яті
+    одночасно лише одна частина одного файлу. З cache (розширення, як у
+    load_scores) готовий кеш файлу читається замість CSV, а відсутній
+    створюється - для цього файл один раз повністю завантажується в пам'ять.
+    progress отримує частку за сумарним розміром усіх файлів.
+    """
+    sizes = [os.path.getsize(path) or 1 for path in paths]
+    total = sum(sizes)
+    done = 0
+    sketch = ScoreSketch(group_columns)
+    for path, label, size in zip(paths, source_labels(paths), sizes):
+        check_cancelled(cancelled)
+        file_sketch = ScoreSketch(group_columns)
+        file_progress = None
+        if progress is not None:
+            file_progress = lambda fraction, done=done, size=size: progress(
+                (done + fraction * size) / total
+            )
+        if cache:
+            load_scores(
+                path, file_progress, cancelled, chunksize, cache=cache, sketch=file_sketch
+            )
+        else:
+            for chunk in iter_chunks(path, file_progress, cancelled, chunksize):
+                file_sketch.add_frame(chunk)
+        sketch.add_source(label, file_sketch)
+        done += size
+        if progress is not None:
+            progress(done / total)
+    return sketch
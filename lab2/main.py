@@ -1,11 +1,74 @@
+import queue
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
 import matplotlib.pyplot as plt
-import pandas as pd
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+from analysis import GROUP_COLUMNS, SOURCE_COLUMN, Cancelled, analyze
+from loader import expand_sources, sketch_files
+from plots import AnalysisFigure
 
+# Як часто головний потік перевіряє результати фонових задач (мс)
+POLL_INTERVAL = 50
+# Затримка після останнього руху повзунка перед перерахунком (мс)
+DEBOUNCE_DELAY = 150
+
+
+class BackgroundJob:
+    """
+    Фонова задача: функція виконується в окремому потоці, а її прогрес
+    і результат передаються в чергу, яку читає головний потік Tk.
+    """
+
+    def __init__(self, target, on_done, on_error=None, on_progress=None):
+        self.cancelled = threading.Event()
+        self.results = queue.Queue()
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.thread = threading.Thread(target=self._run, args=(target,), daemon=True)
+
+    def _run(self, target):
+        try:
+            result = target(self)
+        except Cancelled:
+            return
+        except Exception as e:
+            self.results.put(("error", e))
+        else:
+            self.results.put(("done", result))
+
+    def report_progress(self, fraction):
+        """Викликається з фонового потоку."""
+        self.results.put(("progress", fraction))
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def start(self):
+        self.thread.start()
+
+    def poll(self):
+        """
+        Обробляє повідомлення задачі в головному потоці.
+        Повертає True, поки задача ще не завершилася.
+        """
+        while True:
+            try:
+                kind, payload = self.results.get_nowait()
+            except queue.Empty:
+                return self.thread.is_alive() or not self.results.empty()
+            # Результати скасованої задачі відкидаються
+            if self.cancelled.is_set():
+                continue
+            if kind == "progress" and self.on_progress:
+                self.on_progress(payload)
+            elif kind == "done":
+                self.on_done(payload)
+            elif kind == "error" and self.on_error:
+                self.on_error(payload)
 
 
 class StudentAnalysisApp:
@@ -19,9 +82,14 @@ class StudentAnalysisApp:
         self.root.title("Аналіз успішності студентів")
         self.root.geometry("1200x800")
 
-        # Ініціалізація DataFrame
-        self.df = None
-        self.file_path = ""
+        # Лічильники сум балів по групах: графіки будуються лише з них,
+        # тому рядки файлів у пам'яті не зберігаються
+        self.sketch = None
+        self.file_paths = []
+        # Поточне фонове завантаження файлу
+        self.load_job = None
+        # Відкладений (debounce) перерахунок після руху повзунків
+        self.pending_update = None
 
         # Створення головного фрейму
         main_frame = ttk.Frame(self.root, padding="10")
@@ -46,6 +114,18 @@ class StudentAnalysisApp:
             command=self.load_csv,
         )
         self.load_button.grid(row=0, column=0, padx=5, pady=5, sticky="ew")
+        # Кнопка завантаження теки з CSV (одна на школу/рік)
+        self.load_folder_button = ttk.Button(
+            controls_frame, text="Завантажити теку з CSV", command=self.load_folder
+        )
+        self.load_folder_button.grid(row=1, column=0, padx=5, pady=5, sticky="ew")
+        # Кеш розібраних таблиць поруч із CSV вмикається лише явно
+        self.use_cache_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            controls_frame,
+            text="Кешувати таблиці (.feather)",
+            variable=self.use_cache_var,
+        ).grid(row=2, column=0, padx=5, sticky="w")
 
         # Combobox для вибору групування
         ttk.Label(controls_frame, text="Групувати за:").grid(
@@ -55,10 +135,13 @@ class StudentAnalysisApp:
         self.group_by_combo = ttk.Combobox(
             controls_frame,
             textvariable=self.group_by_var,
-            values=["gender", "parental level of education", "race/ethnicity", "lunch"],
+            values=GROUP_COLUMNS + [SOURCE_COLUMN],
             state="readonly",
         )
         self.group_by_combo.grid(row=0, column=2, padx=5, pady=5, sticky="ew")
+        self.group_by_combo.bind(
+            "<<ComboboxSelected>>", lambda event: self.schedule_update()
+        )
 
         # Slider (Scale) для вибору діапазону балів
         ttk.Label(controls_frame, text="Діапазон середнього балу:").grid(
@@ -72,7 +155,7 @@ class StudentAnalysisApp:
             to=100,
             orient=tk.HORIZONTAL,
             variable=self.min_score_var,
-            command=lambda s: self.min_score_label.config(text=f"{float(s):.0f}"),
+            command=lambda s: self.on_slider_moved(self.min_score_label, s),
         )
         self.min_score_scale.grid(row=0, column=4, padx=5, pady=5, sticky="ew")
         self.min_score_label = ttk.Label(controls_frame, text="0")
@@ -85,7 +168,7 @@ class StudentAnalysisApp:
             to=100,
             orient=tk.HORIZONTAL,
             variable=self.max_score_var,
-            command=lambda s: self.max_score_label.config(text=f"{float(s):.0f}"),
+            command=lambda s: self.on_slider_moved(self.max_score_label, s),
         )
         self.max_score_scale.grid(row=0, column=6, padx=5, pady=5, sticky="ew")
         self.max_score_label = ttk.Label(controls_frame, text="100")
@@ -97,6 +180,12 @@ class StudentAnalysisApp:
         )
         self.update_button.grid(row=0, column=8, padx=20, pady=5, sticky="ew")
 
+        # Індикатор прогресу завантаження та аналізу
+        self.progress = ttk.Progressbar(controls_frame, mode="determinate", maximum=1.0)
+        self.progress.grid(row=1, column=1, columnspan=8, padx=5, pady=(0, 5), sticky="ew")
+        self.status_label = ttk.Label(controls_frame, text="")
+        self.status_label.grid(row=2, column=1, columnspan=8, padx=5, sticky="w")
+
         controls_frame.columnconfigure(4, weight=1)
         controls_frame.columnconfigure(6, weight=1)
 
@@ -106,61 +195,146 @@ class StudentAnalysisApp:
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.pack(fill=tk.BOTH, expand=True)
         plt.tight_layout(pad=3.0)
+        # Графіки оновлюються на місці, без перебудови художників
+        self.plots = AnalysisFigure(self.fig, self.axes)
 
         self.show_initial_message()
 
     def show_initial_message(self):
         """Показує початкове повідомлення на графіках"""
-        for ax in self.axes:
-            ax.clear()
-
-        self.axes[1].text(
-            0.5,
-            0.5,
-            'Будь ласка, завантажте файл "StudentsPerformance.csv"',
-            ha="center",
-            va="center",
-            fontsize=12,
-            wrap=True,
-        )
+        self.plots.show_message('Будь ласка, завантажте файл "StudentsPerformance.csv"')
         self.canvas.draw()
 
+    # --- Фонові задачі ---
+
+    def start_job(self, job):
+        job.start()
+        self.root.after(POLL_INTERVAL, self.poll_job, job)
+        return job
+
+    def poll_job(self, job):
+        """Періодично забирає результати задачі, доки вона не завершиться."""
+        if job.poll():
+            self.root.after(POLL_INTERVAL, self.poll_job, job)
+
+    def on_slider_moved(self, label, value):
+        label.config(text=f"{float(value):.0f}")
+        self.schedule_update()
+
+    def schedule_update(self):
+        """
+        Перераховує аналіз, коли користувач на DEBOUNCE_DELAY мс зупинить
+        повзунок: кожен новий рух відкладає перерахунок.
+        """
+        if self.sketch is None:
+            return
+        if self.pending_update is not None:
+            self.root.after_cancel(self.pending_update)
+        self.pending_update = self.root.after(DEBOUNCE_DELAY, self.run_live_update)
+
+    def run_live_update(self):
+        self.pending_update = None
+        self.update_analysis(live=True)
+
+    # --- Завантаження ---
+
     def load_csv(self):
         """
-        Відкриває діалогове вікно для вибору CSV-файлу та завантажує дані.
-        Розраховує середній бал.
+        Відкриває діалогове вікно для вибору одного або кількох CSV-файлів
+        та завантажує їх у фоновому потоці.
         """
-        self.file_path = filedialog.askopenfilename(
-            title="Оберіть файл StudentsPerformance.csv",
+        file_paths = filedialog.askopenfilenames(
+            title="Оберіть файли StudentsPerformance.csv",
             filetypes=(("CSV Files", "*.csv"), ("All files", "*.*")),
         )
-        if not self.file_path:
-            return
+        if file_paths:
+            self.load_sources(list(file_paths))
 
+    def load_folder(self):
+        """Завантажує всі CSV-файли вибраної теки."""
+        folder = filedialog.askdirectory(title="Оберіть теку з CSV-файлами")
+        if not folder:
+            return
         try:
-            self.df = pd.read_csv(self.file_path)
-            # Розрахунок середнього балу для кожного студента
-            self.df["average score"] = self.df[
-                ["math score", "reading score", "writing score"]
-            ].mean(axis=1)
-            messagebox.showinfo(
-                "Успіх",
-                f"Файл '{self.file_path.split('/')[-1]}' успішно завантажено.\n"
-                f"Знайдено {len(self.df)} записів.",
-            )
-            self.update_analysis()
-        except Exception as e:
-            messagebox.showerror(
-                "Помилка", f"Не вдалося завантажити або обробити файл:\n{e}"
+            file_paths = expand_sources(folder)
+        except FileNotFoundError as e:
+            messagebox.showerror("Помилка", str(e))
+            return
+        self.load_sources(file_paths)
+
+    def load_sources(self, file_paths):
+        """
+        Читає файли частинами у фоновому потоці, збираючи спільний ескіз
+        балів; рядки відкидаються одразу, тож набір може бути більшим за RAM.
+        """
+        if self.load_job is not None:
+            self.load_job.cancel()
+        self.file_paths = file_paths
+        # Значення змінної Tk читається в головному потоці
+        cache = ".feather" if self.use_cache_var.get() else None
+        self.load_button.config(state=tk.DISABLED)
+        self.load_folder_button.config(state=tk.DISABLED)
+        self.progress.config(mode="determinate", value=0)
+        self.status_label.config(
+            text=f"Завантаження {self.describe_sources()}..."
+        )
+        self.load_job = self.start_job(
+            BackgroundJob(
+                lambda job: sketch_files(
+                    file_paths,
+                    progress=job.report_progress,
+                    cancelled=job.cancelled,
+                    group_columns=GROUP_COLUMNS,
+                    cache=cache,
+                ),
+                on_done=self.on_csv_loaded,
+                on_error=self.on_csv_failed,
+                on_progress=lambda fraction: self.progress.config(value=fraction),
             )
-            self.df = None
+        )
 
-    def update_analysis(self):
+    def describe_sources(self):
+        if len(self.file_paths) == 1:
+            return f"'{self.file_paths[0].split('/')[-1]}'"
+        return f"{len(self.file_paths)} файлів"
+
+    def set_loading_done(self):
+        self.load_job = None
+        self.load_button.config(state=tk.NORMAL)
+        self.load_folder_button.config(state=tk.NORMAL)
+
+    def on_csv_loaded(self, sketch):
+        self.set_loading_done()
+        self.sketch = sketch
+        self.group_by_combo.config(values=sketch.group_columns)
+        self.progress.config(value=1.0)
+        self.status_label.config(text=f"Знайдено {len(sketch)} записів.")
+        messagebox.showinfo(
+            "Успіх",
+            f"Успішно завантажено {self.describe_sources()}.\n"
+            f"Знайдено {len(sketch)} записів.",
+        )
+        self.update_analysis()
+
+    def on_csv_failed(self, error):
+        self.set_loading_done()
+        self.sketch = None
+        self.progress.config(value=0)
+        self.status_label.config(text="")
+        messagebox.showerror(
+            "Помилка", f"Не вдалося завантажити або обробити файл:\n{error}"
+        )
+
+    # --- Аналіз ---
+
+    def update_analysis(self, live=False):
         """
-        Оновлює візуалізацію на основі вибраних параметрів у GUI.
-        Виконує фільтрацію та групування даних.
+        Будує дані графіків за ескізом для вибраного діапазону та групування.
+        Аналіз не торкається рядків таблиці, тому виконується одразу в
+        головному потоці. При live=True (рух повзунків) повідомлення
+        показуються в рядку стану, а не діалогами.
         """
-        if self.df is None:
+        if self.sketch is None:
             messagebox.showwarning("Увага", "Спочатку завантажте CSV файл.")
             return
 
@@ -169,78 +343,31 @@ class StudentAnalysisApp:
         max_score = self.max_score_var.get()
 
         if min_score > max_score:
-            messagebox.showerror(
-                "Помилка", "Мінімальний бал не може бути більшим за максимальний."
-            )
+            message = "Мінімальний бал не може бути більшим за максимальний."
+            if live:
+                self.status_label.config(text=message)
+            else:
+                messagebox.showerror("Помилка", message)
             return
 
-        # Фільтрація даних за вибраним діапазоном балів
-        filtered_df = self.df[
-            (self.df["average score"] >= min_score)
-            & (self.df["average score"] <= max_score)
-        ].copy()
-
-        if filtered_df.empty:
-            messagebox.showwarning(
-                "Немає даних", "За вибраними критеріями не знайдено жодного студента."
-            )
-            return
-
-        # Очищення попередніх графіків
-        for ax in self.axes:
-            ax.clear()
-
-        # 1. Boxplot оцінок за вибраною групою
-        try:
-            grouped_data = [
-                group["average score"].values
-                for name, group in filtered_df.groupby(group_by_col)
-            ]
-            labels = [name for name, group in filtered_df.groupby(group_by_col)]
-
-            self.axes[0].boxplot(grouped_data, labels=labels, patch_artist=True)
-            self.axes[0].set_title(f'Розподіл балів за "{group_by_col}"')
-            self.axes[0].set_ylabel("Середній бал")
-            self.axes[0].tick_params(axis="x", rotation=25)
-        except Exception as e:
-            self.axes[0].text(
-                0.5, 0.5, f"Помилка побудови Boxplot:\n{e}", ha="center", va="center"
-            )
-
-        # 2. Bar Chart середнього балу по групах
         try:
-            mean_scores = (
-                filtered_df.groupby(group_by_col)["average score"].mean().sort_values()
-            )
-            mean_scores.plot(kind="bar", ax=self.axes[1], color=plt.cm.viridis(0.6))
-            self.axes[1].set_title(f'Середній бал по групах "{group_by_col}"')
-            self.axes[1].set_xlabel("")
-            self.axes[1].set_ylabel("Середній бал")
-            self.axes[1].tick_params(axis="x", rotation=25)
-            self.axes[1].grid(axis="y", linestyle="--", alpha=0.7)
+            result = analyze(self.sketch, group_by_col, min_score, max_score)
         except Exception as e:
-            self.axes[1].text(
-                0.5, 0.5, f"Помилка побудови Bar Chart:\n{e}", ha="center", va="center"
-            )
-
-        # 3. Histogram розподілу балів
-        try:
-            filtered_df["average score"].plot(
-                kind="hist",
-                ax=self.axes[2],
-                bins=20,
-                color=plt.cm.viridis(0.8),
-                edgecolor="black",
-            )
-            self.axes[2].set_title("Загальний розподіл середніх балів")
-            self.axes[2].set_xlabel("Середній бал")
-            self.axes[2].set_ylabel("Кількість студентів")
-            self.axes[2].grid(axis="y", linestyle="--", alpha=0.7)
-        except Exception as e:
-            self.axes[2].text(
-                0.5, 0.5, f"Помилка побудови Histogram:\n{e}", ha="center", va="center"
-            )
+            messagebox.showerror("Помилка", f"Не вдалося виконати аналіз:\n{e}")
+            return
+        self.status_label.config(text="")
+        if result is None:
+            message = "За вибраними критеріями не знайдено жодного студента."
+            if live:
+                self.status_label.config(text=message)
+            else:
+                messagebox.showwarning("Немає даних", message)
+            return
+        self.draw_analysis(result)
 
+    def draw_analysis(self, result):
+        """Малює графіки за підготовленими даними (лише в головному потоці)."""
+        self.plots.update(result)
         self.fig.tight_layout(pad=3.0)
         # Перемальовка полотна
         self.canvas.draw()
@@ -0,0 +1,127 @@
+"""
+Три графіки аналізу (boxplot, середні по групах, гістограма) на наборі осей.
+
+Художники (artists) створюються при першому малюванні, а далі лише
+оновлюються на місці новими даними; повністю перебудовується лише графік,
+у якого змінилася кількість груп. Використовується і GUI, і пакетним звітом.
+"""
+
+import numpy as np
+from matplotlib import cm
+from matplotlib.path import Path
+
+BAR_COLOR = cm.viridis(0.6)
+HIST_COLOR = cm.viridis(0.8)
+
+
+class AnalysisFigure:
+    """Графіки результату analysis.analyze на трьох осях."""
+
+    def __init__(self, fig, axes):
+        self.fig = fig
+        self.axes = axes
+        self.reset()
+
+    def reset(self):
+        """Забуває створені художники (після ax.clear() ззовні)."""
+        self.box = None
+        self.bars = None
+        self.hist = None
+
+    def show_message(self, text, axis=1):
+        """Очищає всі осі та показує повідомлення в центрі вибраної."""
+        for ax in self.axes:
+            ax.clear()
+        self.reset()
+        self.axes[axis].text(
+            0.5, 0.5, text, ha="center", va="center", fontsize=12, wrap=True
+        )
+
+    def update(self, result):
+        group_by_col = result["group_by"]
+        panels = (
+            (self._update_box, "Boxplot"),
+            (self._update_bars, "Bar Chart"),
+            (self._update_hist, "Histogram"),
+        )
+        for position, (draw, name) in enumerate(panels):
+            ax = self.axes[position]
+            try:
+                draw(ax, result, group_by_col)
+            except Exception as e:
+                ax.clear()
+                setattr(self, ("box", "bars", "hist")[position], None)
+                ax.text(0.5, 0.5, f"Помилка побудови {name}:\n{e}", ha="center", va="center")
+
+    # --- Окремі графіки ---
+
+    def _update_box(self, ax, result, group_by_col):
+        stats = result["box_stats"]
+        if self.box is None or len(self.box["boxes"]) != len(stats):
+            ax.clear()
+            self.box = ax.bxp(stats, patch_artist=True)
+            ax.set_ylabel("Середній бал")
+            ax.tick_params(axis="x", rotation=25)
+        else:
+            for i, item in enumerate(stats):
+                box = self.box["boxes"][i]
+                path = box.get_path()
+                vertices = path.vertices.copy()
+                # Прямокутник: q1, q1, q3, q3, q1 (+ точка замикання)
+                q1, q3 = item["q1"], item["q3"]
+                vertices[:, 1] = [q1, q1, q3, q3, q1, q1][: len(vertices)]
+                box.set_path(Path(vertices, path.codes))
+                self._set_y(self.box["medians"][i], item["med"], item["med"])
+                self._set_y(self.box["whiskers"][2 * i], item["q1"], item["whislo"])
+                self._set_y(self.box["whiskers"][2 * i + 1], item["q3"], item["whishi"])
+                self._set_y(self.box["caps"][2 * i], item["whislo"], item["whislo"])
+                self._set_y(self.box["caps"][2 * i + 1], item["whishi"], item["whishi"])
+                fliers = self.box["fliers"][i]
+                position = self.box["medians"][i].get_xdata().mean()
+                fliers.set_data(np.full(len(item["fliers"]), position), item["fliers"])
+            labels = [str(item["label"]) for item in stats]
+            ax.set_xticks(ax.get_xticks(), labels, rotation=25)
+            # Межі по x залишаються від bxp (з полями навколо коробок), як у новій фігурі
+            ax.relim()
+            ax.autoscale_view(scalex=False)
+        ax.set_title(f'Розподіл балів за "{group_by_col}"')
+
+    @staticmethod
+    def _set_y(line, start, end):
+        line.set_ydata([start, end])
+
+    def _update_bars(self, ax, result, group_by_col):
+        means = result["mean_scores"]
+        labels = [str(label) for label in means.index]
+        if self.bars is None or len(self.bars) != len(means):
+            ax.clear()
+            self.bars = ax.bar(range(len(means)), means.to_numpy(), color=BAR_COLOR)
+            ax.set_ylabel("Середній бал")
+            ax.grid(axis="y", linestyle="--", alpha=0.7)
+        else:
+            for bar, value in zip(self.bars, means.to_numpy()):
+                bar.set_height(value)
+            ax.relim()
+            ax.autoscale_view()
+        ax.set_xticks(range(len(means)), labels, rotation=25)
+        ax.set_title(f'Середній бал по групах "{group_by_col}"')
+
+    def _update_hist(self, ax, result, group_by_col):
+        edges = result["hist_edges"]
+        counts = result["hist_counts"]
+        if self.hist is None or len(self.hist) != len(counts):
+            ax.clear()
+            _, _, self.hist = ax.hist(
+                edges[:-1], bins=edges, weights=counts, color=HIST_COLOR, edgecolor="black"
+            )
+            ax.set_title("Загальний розподіл середніх балів")
+            ax.set_xlabel("Середній бал")
+            ax.set_ylabel("Кількість студентів")
+            ax.grid(axis="y", linestyle="--", alpha=0.7)
+        else:
+            for rect, left, right, count in zip(self.hist, edges[:-1], edges[1:], counts):
+                rect.set_x(left)
+                rect.set_width(right - left)
+                rect.set_height(count)
+            ax.relim()
+            ax.autoscale_view()
@@ -0,0 +1,226 @@
+"""
+Пакетний звіт аналізу успішності без GUI (бекенд Agg).
+
+Для кожної колонки групування та кожного діапазону середнього балу
+зберігається зображення з трьома графіками, а також зведена таблиця
+report.csv (кількість і середній бал кожної групи). Графіки будуються з
+ескізу ScoreSketch, зібраного під час завантаження, тож процесам передаються
+лише лічильники. Одна фігура на процес перевикористовується для всіх звітів:
+графіки оновлюються на місці. Кілька файлів, тека або glob-шаблон читаються
+поза пам'яттю з додатковим групуванням "source". З --check ескіз кожного
+файлу спершу звіряється з аналізом за рядками таблиці.
+
+Запуск:
+    python lab2/report.py StudentsPerformance.csv [data/*.csv | data/] --out reports
+        [--group gender --group lunch] [--range 0 100 --range 60 100]
+        [--format png] [--workers 4] [--check] [--cache .feather]
+"""
+
+import argparse
+import concurrent.futures
+import csv
+import os
+import sys
+import time
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from analysis import GROUP_COLUMNS, SOURCE_COLUMN, ScoreSketch, analyze, verify_sketch
+from loader import CACHE_FORMATS, expand_sources, load_scores, sketch_files
+from plots import AnalysisFigure
+
+DEFAULT_RANGES = [(0, 100), (0, 60), (60, 80), (80, 100)]
+SUMMARY_FIELDS = ["group_by", "min_score", "max_score", "group", "count", "mean_score"]
+
+
+class ReportRenderer:
+    """Фігура Agg, що перемальовується для кожного звіту без створення нових осей."""
+
+    def __init__(self, sketch, out_dir, fmt="png", dpi=100):
+        self.sketch = sketch
+        self.out_dir = out_dir
+        self.fmt = fmt
+        self.dpi = dpi
+        self.fig = Figure(figsize=(15, 5))
+        FigureCanvasAgg(self.fig)
+        self.plots = AnalysisFigure(self.fig, self.fig.subplots(1, 3))
+
+    def render(self, group_by_col, min_score, max_score):
+        """Малює та зберігає один звіт. Повертає (шлях або None, рядки зведення)."""
+        result = analyze(self.sketch, group_by_col, min_score, max_score)
+        if result is None:
+            return None, []
+        self.plots.update(result)
+        self.fig.suptitle(
+            f"Середній бал {min_score:g}-{max_score:g}, студентів: {result['total']}"
+        )
+        self.fig.tight_layout(pad=3.0)
+        name = report_name(group_by_col, min_score, max_score, self.fmt)
+        path = os.path.join(self.out_dir, name)
+        self.fig.savefig(path, format=self.fmt, dpi=self.dpi)
+        rows = [
+            {
+                "group_by": group_by_col,
+                "min_score": min_score,
+                "max_score": max_score,
+                "group": label,
+                "count": int(result["counts"][label]),
+                "mean_score": round(float(result["mean_scores"][label]), 2),
+            }
+            for label in result["labels"]
+        ]
+        return path, rows
+
+
+def report_name(group_by_col, min_score, max_score, fmt="png"):
+    safe = "".join(c if c.isalnum() else "_" for c in group_by_col)
+    return f"{safe}_{min_score:g}-{max_score:g}.{fmt}"
+
+
+def render_column(renderer, group_by_col, ranges):
+    paths, rows = [], []
+    for min_score, max_score in ranges:
+        path, summary = renderer.render(group_by_col, min_score, max_score)
+        if path:
+            paths.append(path)
+        rows.extend(summary)
+    return paths, rows
+
+
+# --- Паралельний режим: кожен процес отримує ескіз та створює фігуру один раз ---
+
+_worker_renderer = None
+
+
+def _init_worker(sketch, out_dir, fmt, dpi):
+    global _worker_renderer
+    _worker_renderer = ReportRenderer(sketch, out_dir, fmt, dpi)
+
+
+def _render_column_in_worker(group_by_col, ranges):
+    return render_column(_worker_renderer, group_by_col, ranges)
+
+
+def check_sketches(paths, ranges, group_columns=GROUP_COLUMNS):
+    """Звіряє ескіз кожного файлу з аналізом за його рядками (кеш не використовується)."""
+    mismatches = []
+    for path in paths:
+        sketch = ScoreSketch(group_columns)
+        df = load_scores(path, sketch=sketch)
+        mismatches.extend(
+            f"{path}: {mismatch}" for mismatch in verify_sketch(df, sketch, ranges)
+        )
+    return mismatches
+
+
+def render_reports(
+    sources,
+    out_dir,
+    group_columns=None,
+    ranges=DEFAULT_RANGES,
+    fmt="png",
+    dpi=100,
+    workers=1,
+    check=False,
+    cache=None,
+):
+    """
+    Будує звіти для всіх комбінацій (колонка, діапазон) та зведення report.csv.
+    sources - файл, тека, glob-шаблон або їх список; за замовчуванням для
+    кількох файлів до колонок групування додається "source".
+    При workers > 1 колонки розподіляються між процесами.
+    З check=True спершу звіряє ескізи з аналізом за рядками (ValueError при
+    розбіжності). cache - розширення кешу таблиць поруч із CSV (див.
+    loader.load_scores) або None. Повертає список шляхів до збережених зображень.
+    """
+    csv_paths = expand_sources(sources)
+    if group_columns is None:
+        group_columns = GROUP_COLUMNS + ([SOURCE_COLUMN] if len(csv_paths) > 1 else [])
+    if check:
+        mismatches = check_sketches(csv_paths, ranges)
+        if mismatches:
+            raise ValueError("Ескіз не збігається з даними:\n" + "\n".join(mismatches))
+    os.makedirs(out_dir, exist_ok=True)
+    paths, rows = [], []
+    # Файли читаються частинами один раз; процесам передаються лише лічильники
+    sketch = sketch_files(csv_paths, group_columns=GROUP_COLUMNS, cache=cache)
+    if workers > 1:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(workers, len(group_columns)),
+            initializer=_init_worker,
+            initargs=(sketch, out_dir, fmt, dpi),
+        ) as pool:
+            futures = [
+                pool.submit(_render_column_in_worker, column, ranges)
+                for column in group_columns
+            ]
+            for future in futures:
+                column_paths, column_rows = future.result()
+                paths.extend(column_paths)
+                rows.extend(column_rows)
+    else:
+        renderer = ReportRenderer(sketch, out_dir, fmt, dpi)
+        for column in group_columns:
+            column_paths, column_rows = render_column(renderer, column, ranges)
+            paths.extend(column_paths)
+            rows.extend(column_rows)
+
+    with open(os.path.join(out_dir, "report.csv"), "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("sources", nargs="+", help="CSV-файли, теки або glob-шаблони")
+    parser.add_argument("--out", default="reports")
+    parser.add_argument(
+        "--group",
+        action="append",
+        choices=GROUP_COLUMNS + [SOURCE_COLUMN],
+        help="колонка групування",
+    )
+    parser.add_argument(
+        "--range",
+        action="append",
+        nargs=2,
+        type=float,
+        metavar=("MIN", "MAX"),
+        help="діапазон середнього балу",
+    )
+    parser.add_argument("--format", default="png")
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--check", action="store_true", help="звірити ескіз з аналізом за рядками"
+    )
+    parser.add_argument(
+        "--cache",
+        choices=sorted(CACHE_FORMATS),
+        help="кешувати розібрані таблиці поруч із CSV (потрібен pyarrow)",
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    try:
+        paths = render_reports(
+            args.sources,
+            args.out,
+            group_columns=args.group,
+            ranges=[tuple(r) for r in args.range] if args.range else DEFAULT_RANGES,
+            fmt=args.format,
+            dpi=args.dpi,
+            workers=args.workers,
+            check=args.check,
+            cache=args.cache,
+        )
+    except (FileNotFoundError, ValueError) as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    print(
+        f"Збережено {len(paths)} звітів у '{args.out}' "
+        f"за {time.perf_counter() - started:.2f} с"
+    )
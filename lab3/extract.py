@@ -0,0 +1,183 @@
+import argparse
+import functools
+import mmap
+import re
+import time
+
+# Precompiled patterns shared by the extraction tasks
+WORD = re.compile(r'\b\w+\b')
+VOWEL_WORD = re.compile(r'\b[AEIOUYaeiouy]\w*\b')
+CONSONANT_WORD = re.compile(r'\b[^AEIOUYaeiouy\s]\w*\b')
+CAPITALIZED = re.compile(r'\b[A-Z][A-Za-z]*\b')
+EMAIL_DOMAIN = re.compile(r'@([\w\.-]+)')
+# Numbers containing a run of two or three fives
+FIVES_NUMBER = re.compile(r'\b\d*5{2,3}\d*\b')
+TIME_DATE = re.compile(r'(\d{2}:\d{2}:\d{2}) on (\d{4}-\d{2}-\d{2})')
+POSTAL_CODE = re.compile(r'\d{5}')
+# Any line of a multi-line block that is not a postal code
+INVALID_POSTAL_LINE = re.compile(r'^(?!\d{5}\r?$).*$', re.MULTILINE)
+
+# Size of one mmap'd chunk; chunks are extended to the next newline
+CHUNK_SIZE = 1 << 20
+
+
+def count_words(text):
+    return sum(1 for _ in WORD.finditer(text))
+
+
+def vowel_words(text):
+    return VOWEL_WORD.findall(text)
+
+
+def consonant_words(text):
+    return CONSONANT_WORD.findall(text)
+
+
+def capitalized_words(text):
+    return CAPITALIZED.findall(text)
+
+
+def email_domains(text):
+    return EMAIL_DOMAIN.findall(text)
+
+
+def numbers_with_fives(text):
+    return FIVES_NUMBER.findall(text)
+
+
+def time_date_pairs(text):
+    return TIME_DATE.findall(text)
+
+
+def is_postal_code(code):
+    return POSTAL_CODE.fullmatch(code) is not None
+
+
+@functools.lru_cache(maxsize=128)
+def _words_pattern(words):
+    # Longest first, so full words are tried before their prefixes
+    alternation = '|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+    return re.compile(r'\b(?:' + alternation + r')\b')
+
+
+def words_pattern(words):
+    """One compiled alternation matching any of the whole words (cached)."""
+    return _words_pattern(tuple(sorted(set(words))))
+
+
+@functools.lru_cache(maxsize=128)
+def _positions_matcher(words):
+    # Zero-width lookahead: the scan moves one character at a time, so targets
+    # inside a longer target (York in New-York) are found as well
+    alternation = '|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+    pattern = re.compile(r'\b(?=(' + alternation + r')\b)')
+    # Shorter targets that start where a longer one matched (New in New-York)
+    prefixes = {
+        word: [
+            re.compile(re.escape(other) + r'\b')
+            for other in words
+            if other != word and word.startswith(other)
+        ]
+        for word in words
+    }
+    return pattern, prefixes
+
+
+def find_positions(text, words, offset=0, positions=None):
+    """
+    Start positions of each word, found in a single pass over the text.
+    Overlapping targets are all reported, as with a separate search per word.
+    """
+    if positions is None:
+        positions = {word: [] for word in words}
+    words = tuple(sorted(set(words)))
+    if not words:
+        return positions
+    pattern, prefixes = _positions_matcher(words)
+    for match in pattern.finditer(text):
+        word, start = match.group(1), match.start()
+        positions[word].append(offset + start)
+        for prefix in prefixes[word]:
+            found = prefix.match(text, start)
+            if found:
+                positions[found.group()].append(offset + start)
+    return positions
+
+
+def replace_word(text, word, replacement):
+    return words_pattern([word]).sub(replacement, text)
+
+
+# --- Streaming over files ---
+
+def iter_lines(path, encoding='utf-8'):
+    """Yields (character offset, line) without loading the whole file."""
+    offset = 0
+    # newline='' keeps '\r\n' so that offsets match the file contents
+    with open(path, encoding=encoding, newline='') as file:
+        for line in file:
+            yield offset, line
+            offset += len(line)
+
+
+def iter_chunks(path, chunk_size=CHUNK_SIZE, encoding='utf-8'):
+    """
+    Yields (character offset, text) for mmap'd chunks of about chunk_size bytes.
+    Every chunk ends at a newline, so matches never span two chunks.
+    """
+    with open(path, 'rb') as file:
+        if file.seek(0, 2) == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            offset = start = 0
+            while start < len(data):
+                end = data.find(b'\n', min(start + chunk_size, len(data)) - 1)
+                end = len(data) if end == -1 else end + 1
+                text = data[start:end].decode(encoding)
+                yield offset, text
+                offset += len(text)
+                start = end
+
+
+def iter_text(path, use_mmap=True, chunk_size=CHUNK_SIZE, encoding='utf-8'):
+    if use_mmap:
+        return iter_chunks(path, chunk_size, encoding)
+    return iter_lines(path, encoding)
+
+
+def finditer_file(path, pattern, use_mmap=True, chunk_size=CHUNK_SIZE, encoding='utf-8'):
+    """Yields (character offset in the file, match) for a compiled pattern."""
+    for offset, text in iter_text(path, use_mmap, chunk_size, encoding):
+        for match in pattern.finditer(text):
+            yield offset + match.start(), match
+
+
+def count_file(path, pattern=WORD, use_mmap=True, chunk_size=CHUNK_SIZE, encoding='utf-8'):
+    return sum(
+        1 for _ in finditer_file(path, pattern, use_mmap, chunk_size, encoding)
+    )
+
+
+def find_positions_file(path, words, use_mmap=True, chunk_size=CHUNK_SIZE, encoding='utf-8'):
+    positions = {word: [] for word in words}
+    for offset, text in iter_text(path, use_mmap, chunk_size, encoding):
+        find_positions(text, words, offset, positions)
+    return positions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Count words and find word positions in a text file')
+    parser.add_argument('path')
+    parser.add_argument('--words', nargs='*', default=[], help='words to locate')
+    parser.add_argument('--lines', action='store_true', help='read line by line instead of mmap')
+    parser.add_argument('--encoding', default='utf-8')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    word_count = count_file(args.path, WORD, not args.lines, encoding=args.encoding)
+    print('Word count:', word_count)
+    if args.words:
+        positions = find_positions_file(args.path, args.words, not args.lines, encoding=args.encoding)
+        for word, found in positions.items():
+            print(f'{word}: {len(found)} occurrences, first at {found[:5]}')
+    print(f'Elapsed: {time.perf_counter() - started:.3f} s')
@@ -1,4 +1,4 @@
-import re
+import extract
 
 # Sample text variable with 5 sentences
 text = """This is a text variable for analysis. In this text, we will search for words.
@@ -6,21 +6,21 @@ text = """This is a text variable for analysis. In this text, we will search for
           Finally, we will try replacing one word with a surname."""
 
 # a. Count the number of words in the text
-word_count = len(re.findall(r'\b\w+\b', text))
+word_count = extract.count_words(text)
 
 # b. Find words that start with a vowel and their count
-vowel_words = re.findall(r'\b[AEIOUYaeiouy]\w*\b', text)
+vowel_words = extract.vowel_words(text)
 vowel_word_count = len(vowel_words)
 
 # c. Find words that start with a consonant
-consonant_words = re.findall(r'\b[^AEIOUYaeiouy\s]\w*\b', text)
+consonant_words = extract.consonant_words(text)
 
-# d. Choose three words and find their positions
+# d. Choose three words and find their positions (one pass for all words)
 sample_words = ["text", "analysis", "consonants"]
-sample_positions = {word: [m.start() for m in re.finditer(r'\b' + word + r'\b', text)] for word in sample_words}
+sample_positions = extract.find_positions(text, sample_words)
 
 # e. Replace a word in the text with the surname "Hudz"
-modified_text = re.sub(r'\bvariable\b', "Hudz", text)
+modified_text = extract.replace_word(text, "variable", "Hudz")
 
 # Display the results
 print(word_count, vowel_words, vowel_word_count, consonant_words, sample_positions, modified_text)
@@ -1,10 +1,10 @@
-import re
+import extract
 
 # Sample string with email addresses and their owners
 text = "John Doe <john.doe@example.com>, Jane Smith <jane.smith@company.org>, Bob Brown <bob.brown@service.net>"
 
 # Extract domains from email addresses using regex
-domains = re.findall(r'@([\w\.-]+)', text)
+domains = extract.email_domains(text)
 
 # Display the list of domains
 print(domains)
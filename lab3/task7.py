@@ -1,14 +1,166 @@
-import re
+import argparse
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+import extract
+
+# Characters read from a stream per block in batch mode
+BLOCK_SIZE = 1 << 20
+
 
 def is_valid_ukrainian_postal_code(postal_code):
-    # Regular expression pattern for a 5-digit postal code
-    pattern = r'^\d{5}$'
-    # Check if postal code matches the pattern
-    return bool(re.match(pattern, postal_code))
-
-# Example usage
-postal_code = input("Enter a Ukrainian postal code: ")
-if is_valid_ukrainian_postal_code(postal_code):
-    print("The postal code is valid.")
-else:
-    print("The postal code is invalid.")
\ No newline at end of file
+    # Same as the precompiled \d{5} pattern: str.isdecimal() accepts exactly \d
+    return len(postal_code) == 5 and postal_code.isdecimal()
+
+
+def iter_blocks(stream, size=BLOCK_SIZE):
+    """Yields blocks of whole lines (each ends with a newline, except maybe the last)."""
+    rest = ''
+    while True:
+        data = stream.read(size)
+        if not data:
+            break
+        data = rest + data
+        cut = data.rfind('\n') + 1
+        if cut:
+            rest = data[cut:]
+            yield data[:cut]
+        else:
+            rest = data
+    if rest:
+        yield rest
+
+
+def validate_blocks(stream, on_invalid=None):
+    """
+    Validates one code per line. A single regex pass over each block finds only the
+    invalid lines; their numbers come from counting newlines before them.
+    on_invalid(line number, code) is called for each invalid line.
+    Returns (number of lines, number of invalid lines).
+    """
+    total = invalid = 0
+    for block in iter_blocks(stream):
+        position, line_number = 0, total + 1
+        for match in extract.INVALID_POSTAL_LINE.finditer(block):
+            if match.start() == len(block):
+                # Empty "line" after the final newline of the block
+                break
+            line_number += block.count('\n', position, match.start())
+            position = match.start()
+            invalid += 1
+            if on_invalid is not None:
+                on_invalid(line_number, match.group().removesuffix('\r'))
+        total += block.count('\n') + (not block.endswith('\n'))
+    return total, invalid
+
+
+def validate_lines(stream, on_invalid=None, check=is_valid_ukrainian_postal_code):
+    """Line-by-line validation with check(code); same result as validate_blocks."""
+    total = invalid = 0
+    for total, line in enumerate(stream, 1):
+        code = line.removesuffix('\n').removesuffix('\r')
+        if not check(code):
+            invalid += 1
+            if on_invalid is not None:
+                on_invalid(total, code)
+    return total, invalid
+
+
+def validate_lines_regex(stream, on_invalid=None):
+    return validate_lines(stream, on_invalid, extract.is_postal_code)
+
+
+METHODS = {
+    'block': validate_blocks,
+    'lines': validate_lines,
+    'regex': validate_lines_regex,
+}
+
+
+def open_source(path, encoding='utf-8'):
+    # newline='\n' splits only on '\n', as the block scanner does
+    if path == '-':
+        return io.TextIOWrapper(sys.stdin.buffer, encoding=encoding, errors='replace', newline='\n')
+    return open(path, encoding=encoding, errors='replace', newline='\n')
+
+
+def validate_sources(paths, method='block', report=True, limit=None, out=sys.stdout):
+    """Validates every file ('-' is stdin), printing 'name:line: code' for invalid lines."""
+    validate = METHODS[method]
+    total = invalid = 0
+    printed = [0]
+    for path in paths:
+        name = '<stdin>' if path == '-' else path
+
+        def on_invalid(line_number, code, name=name):
+            if limit is None or printed[0] < limit:
+                out.write(f'{name}:{line_number}: {code!r}\n')
+                printed[0] += 1
+
+        with open_source(path) as stream:
+            lines, bad = validate(stream, on_invalid if report else None)
+        total += lines
+        invalid += bad
+    return total, invalid
+
+
+def benchmark(count=1_000_000, invalid_share=0.01, seed=42):
+    """Measures lines/sec of every method on a generated file of postal codes."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        if rng.random() < invalid_share:
+            lines.append(rng.choice(['1234', '123456', 'abcde', '12 45', '']))
+        else:
+            lines.append(f'{rng.randrange(100000):05d}')
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as file:
+        file.write('\n'.join(lines) + '\n')
+    results = {}
+    try:
+        for method, validate in METHODS.items():
+            started = time.perf_counter()
+            with open_source(file.name) as stream:
+                results[method] = validate(stream)
+            elapsed = time.perf_counter() - started
+            print(f'{method:6s} {count / elapsed:14,.0f} lines/s  {results[method]}')
+    finally:
+        os.remove(file.name)
+    if len(set(results.values())) != 1:
+        raise AssertionError(f'Methods disagree: {results}')
+    return results
+
+
+def interactive():
+    postal_code = input("Enter a Ukrainian postal code: ")
+    if is_valid_ukrainian_postal_code(postal_code):
+        print("The postal code is valid.")
+    else:
+        print("The postal code is invalid.")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Validate Ukrainian postal codes, one per line')
+    parser.add_argument('paths', nargs='*', help="files to validate ('-' for stdin); none - ask interactively")
+    parser.add_argument('--method', choices=METHODS, default='block')
+    parser.add_argument('--quiet', action='store_true', help='print only the summary')
+    parser.add_argument('--limit', type=int, help='print at most this many invalid lines')
+    parser.add_argument('--benchmark', type=int, metavar='LINES', help='benchmark all methods and exit')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+    elif not args.paths:
+        interactive()
+    else:
+        started = time.perf_counter()
+        total, invalid = validate_sources(args.paths, args.method, not args.quiet, args.limit)
+        elapsed = time.perf_counter() - started
+        print(
+            f'Checked {total} lines, {invalid} invalid, {total / max(elapsed, 1e-9):,.0f} lines/s',
+            file=sys.stderr,
+        )
+        sys.exit(1 if invalid else 0)